@@ -1,17 +1,32 @@
 
-import requests
-import json
+import os
+import tempfile
 from functools import partial
 
-# Base URL
-BASE_URL = "https://petstore.swagger.io/v2"
+from petstore import client, ids, multipart, mutations
+from petstore.payloads import JSON_HEADERS, MISSING, PetFactory, dumps
+from petstore.runner import main
+
+# Base URL (PETSTORE_BASE_URL ile yerel emülatöre veya staging'e yönlendirilebilir)
+BASE_URL = os.environ.get("PETSTORE_BASE_URL", "https://petstore.swagger.io/v2")
+
+pet_factory = PetFactory()
+
+# Geçerli formatta, bu koşuya ait pet id'si; diğer koşuların petlerine dokunulmaz
+PET_ID = ids.reserve("negative.pet")
+# Reddedilmesi beklenen create caselerinin id'si; sunucu kabul ederse pet koşu sonunda silinir
+CREATE_PET_ID = ids.reserve("negative.create_pet")
+# Koşuya ayrılmış ama hiç oluşturulmayan id; PUT ile upsert edilirse yine temizlenir
+MISSING_PET_ID = ids.reserve("negative.missing_pet")
+# upload_pet_image_large_file'ın koşu sırasında oluşturduğu dosyanın boyutu
+LARGE_FILE_SIZE = 10 * 1024 * 1024
 
 ##########################################################################################################################
 # Negative Test: Attempt to read a non-existent pet
 
 def get_pet_with_large_id():
     url = f"{BASE_URL}/pet/999999999999999"  # Çok büyük bir pet ID
-    response = requests.get(url)
+    response = client.get(url)
     print(f"Get Pet with Large ID Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
@@ -19,25 +34,25 @@ def get_pet_with_large_id():
 
 def get_pet_with_invalid_id_type():
     url = f"{BASE_URL}/pet/abc123"  # Geçersiz pet ID (String)
-    response = requests.get(url)
+    response = client.get(url)
     print(f"Get Pet with Invalid ID Type Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
 
 
 def get_pet_invalid_json_format():
-    url = f"{BASE_URL}/pet/12345"  # Geçerli pet ID, ancak yanlış formatta bir istek gönderiyoruz
-    response = requests.get(url, headers={"Content-Type": "application/xml"})  # Geçersiz Content-Type
+    url = f"{BASE_URL}/pet/{PET_ID}"  # Geçerli pet ID, ancak yanlış formatta bir istek gönderiyoruz
+    response = client.get(url, headers={"Content-Type": "application/xml"})  # Geçersiz Content-Type
     print(f"Get Pet with Invalid JSON Format Status Code: {response.status_code}")
     print(f"Response: {response.text}")  # response.text çünkü JSON hatası olabilir
     return response
 
 def get_pet_with_invalid_authorization():
-    url = f"{BASE_URL}/pet/12345"
+    url = f"{BASE_URL}/pet/{PET_ID}"
     headers = {
         "Authorization": "Bearer invalid_token"  # Geçersiz token
     }
-    response = requests.get(url, headers=headers)
+    response = client.get(url, headers=headers)
     print(f"Get Pet with Invalid Authorization Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
@@ -46,7 +61,7 @@ def get_pet_with_invalid_authorization():
 # Yanıt geçerli bir JSON değilse, ValueError hatasını yakalayarak uygun bir mesaj gösteriyoruz.
 def get_pet_with_empty_id():
     url = f"{BASE_URL}/pet/"  # ID eksik
-    response = requests.get(url)
+    response = client.get(url)
 
     print(f"Get Pet with Empty ID Status Code: {response.status_code}")
 
@@ -67,7 +82,7 @@ def get_pet_with_empty_id():
 def get_pet_with_invalid_query_param():
     url = f"{BASE_URL}/pet"
     params = {"status": "nonexistent_status"}  # Geçersiz query parametresi
-    response = requests.get(url, params=params)
+    response = client.get(url, params=params)
 
     print(f"Get Pet with Invalid Query Param Status Code: {response.status_code}")
 
@@ -85,22 +100,22 @@ def get_pet_with_invalid_query_param():
 
 
 def get_pet_with_empty_authorization():
-    url = f"{BASE_URL}/pet/12345"
+    url = f"{BASE_URL}/pet/{PET_ID}"
     headers = {
         "Authorization": ""  # Boş token
     }
-    response = requests.get(url, headers=headers)
+    response = client.get(url, headers=headers)
     print(f"Get Pet with Empty Authorization Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
 
 
 def get_pet_with_invalid_content_type():
-    url = f"{BASE_URL}/pet/12345"
+    url = f"{BASE_URL}/pet/{PET_ID}"
     headers = {
         "Content-Type": "application/xml"  # Geçersiz Content-Type
     }
-    response = requests.get(url, headers=headers)
+    response = client.get(url, headers=headers)
     print(f"Get Pet with Invalid Content-Type Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
@@ -108,19 +123,8 @@ def get_pet_with_invalid_content_type():
 
 def create_pet_with_invalid_id():
     url = f"{BASE_URL}/pet"
-    invalid_pet_data = {
-        "id": '0,5',  # Geçersiz ID (negatif sayı)
-        "name": "doggie",
-        "status": "available",
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "friendly"}],
-        "photoUrls": ["url1"]
-    }
-
-    response = requests.post(url, data=json.dumps(invalid_pet_data), headers={"Content-Type": "application/json"})
+    invalid_pet_body = pet_factory.body("doggie", id='0,5')  # Geçersiz ID (negatif sayı)
+    response = client.post(url, data=invalid_pet_body, headers=JSON_HEADERS)
     print(f"Create Pet with Invalid ID Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
@@ -128,18 +132,8 @@ def create_pet_with_invalid_id():
 
 def create_pet_missing_name():
     url = f"{BASE_URL}/pet"
-    invalid_pet_data = {
-        "id": 12345,
-        "status": "available",  # name alanı eksik
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1}],
-        "photoUrls": ["url1"]
-    }
-
-    response = requests.post(url, data=json.dumps(invalid_pet_data), headers={"Content-Type": "application/json"})
+    invalid_pet_body = pet_factory.invalid_body("missing_name", "doggie", id=CREATE_PET_ID, tags=[{"id": 1}])  # name alanı eksik
+    response = client.post(url, data=invalid_pet_body, headers=JSON_HEADERS)
     print(f"Create Pet Missing Name Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
@@ -149,26 +143,15 @@ def create_pet_invalid_json_format():
     url = f"{BASE_URL}/pet"
     invalid_pet_data = "{ 'id': 12345, 'name': 'doggie', 'status': 'available' }"  # Hatalı JSON formatı (tek tırnaklar)
 
-    response = requests.post(url, data=invalid_pet_data, headers={"Content-Type": "application/json"})
+    response = client.post(url, data=invalid_pet_data, headers=JSON_HEADERS)
     print(f"Create Pet with Invalid JSON Format Status Code: {response.status_code}")
     print(f"Response: {response.text}")  # response.text kullanılır çünkü JSON hatası olabilir
     return response
 
 def create_pet_invalid_category_id():
     url = f"{BASE_URL}/pet"
-    invalid_pet_data = {
-        "id": 12345,
-        "name": "doggie",
-        "status": "available",
-        "category": {
-            "id": 'abcd',  # Geçersiz kategori ID
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "friendly"}],
-        "photoUrls": ["url1"]
-    }
-
-    response = requests.post(url, data=json.dumps(invalid_pet_data), headers={"Content-Type": "application/json"})
+    invalid_pet_body = pet_factory.invalid_body("bad_category_id", "doggie", id=CREATE_PET_ID)  # Geçersiz kategori ID
+    response = client.post(url, data=invalid_pet_body, headers=JSON_HEADERS)
     print(f"Create Pet with Invalid Category ID Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
@@ -176,8 +159,9 @@ def create_pet_invalid_category_id():
 
 def create_pet_malformed_json():
     url = f"{BASE_URL}/pet"
-    malformed_json = '{"id": 12345, "name": "doggie", "status": "available",}'  # Trailing comma makes it invalid
-    response = requests.post(url, data=malformed_json, headers={"Content-Type": "application/json"})
+    # Trailing comma makes it invalid
+    malformed_json = pet_factory.malformed_body("doggie", id=CREATE_PET_ID, category=MISSING, tags=MISSING, photoUrls=MISSING)
+    response = client.post(url, data=malformed_json, headers=JSON_HEADERS)
     print(f"Create Pet Malformed JSON Status Code: {response.status_code}")
     print(f"Response: {response.text}")  # Invalid JSON will not parse
     return response
@@ -191,7 +175,7 @@ def create_pet_invalid_data_types():
         "status": True,      # Should be a string
         "photoUrls": "invalid_url",  # Should be a list
     }
-    response = requests.post(url, data=json.dumps(invalid_pet_data), headers={"Content-Type": "application/json"})
+    response = client.post(url, data=dumps(invalid_pet_data), headers=JSON_HEADERS)
     print(f"Create Pet Invalid Data Types Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
@@ -199,31 +183,16 @@ def create_pet_invalid_data_types():
 
 def create_pet_invalid_content_type():
     url = f"{BASE_URL}/pet"
-    valid_pet_data = {
-        "id": 12345,
-        "name": "doggie",
-        "photoUrls": ["string"],
-        "status": "available"
-    }
-    response = requests.post(url, data=json.dumps(valid_pet_data), headers={"Content-Type": "text/plain"})
+    valid_pet_body = pet_factory.body("doggie", id=CREATE_PET_ID, photoUrls=["string"], category=MISSING, tags=MISSING)
+    response = client.post(url, data=valid_pet_body, headers={"Content-Type": "text/plain"})
     print(f"Create Pet Invalid Content-Type Status Code: {response.status_code}")
     print(f"Response: {response.text}")
     return response
 
 def create_pet_empty_photoUrls():
     url = f"{BASE_URL}/pet"
-    invalid_pet_data = {
-        "id": 12345,
-        "name": "doggie",
-        "status": "available",
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "friendly"}],
-        "photoUrls":{}  # Empty array
-    }
-    response = requests.post(url, data=json.dumps(invalid_pet_data), headers={"Content-Type": "application/json"})
+    invalid_pet_body = pet_factory.body("doggie", id=CREATE_PET_ID, photoUrls={})  # Empty array
+    response = client.post(url, data=invalid_pet_body, headers=JSON_HEADERS)
     print(f"Create Pet Empty PhotoUrls Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
@@ -231,17 +200,7 @@ def create_pet_empty_photoUrls():
 def update_pet_with_invalid_id():
     pet_id = 0,99999999  # Var olmayan bir Pet ID
     url = f"{BASE_URL}/pet"
-    pet_data = {
-        "id": pet_id,
-        "name": "Tommy Updated",
-        "status": "sold",
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "playful"}]
-    }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=pet_factory.body("updated", id=pet_id), headers=JSON_HEADERS)
     print(f"Update Pet with Invalid ID Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
@@ -249,31 +208,21 @@ def update_pet_with_invalid_id():
 def update_pet_with_invalid_id_format():
     pet_id = "invalid_id"  # Geçersiz Pet ID formatı (String yerine tam sayı)
     url = f"{BASE_URL}/pet"
-    pet_data = {
-        "id": pet_id,
-        "name": "Tommy Updated",
-        "status": "sold",
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "playful"}]
-    }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=pet_factory.body("updated", id=pet_id), headers=JSON_HEADERS)
     print(f"Update Pet with Invalid ID Format Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
 
 
 def update_pet_with_missing_field():
-    pet_id = 12345
+    pet_id = PET_ID
     url = f"{BASE_URL}/pet"
     pet_data = {
         "id": pet_id,
         # "name" alanı eksik
         "status": "available",  # Ancak, 'name' eksik
     }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=dumps(pet_data), headers=JSON_HEADERS)
 
     print(f"Update Pet with Missing Field Status Code: {response.status_code}")
 
@@ -287,19 +236,10 @@ def update_pet_with_missing_field():
 
 
 def update_pet_with_invalid_status_value():
-    pet_id = 12345
+    pet_id = PET_ID
     url = f"{BASE_URL}/pet"
-    pet_data = {
-        "id": pet_id,
-        "name": "Tommy Updated",
-        "status": "invalid_status",  # Geçersiz status değeri
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "playful"}]
-    }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    pet_body = pet_factory.invalid_body("bad_status", "updated", id=pet_id)  # Geçersiz status değeri
+    response = client.put(url, data=pet_body, headers=JSON_HEADERS)
 
     print(f"Update Pet with Invalid Status Value Status Code: {response.status_code}")
 
@@ -313,19 +253,9 @@ def update_pet_with_invalid_status_value():
 
 
 def update_pet_with_invalid_json_format():
-    pet_id = 12345  # Geçerli bir Pet ID
+    pet_id = PET_ID  # Geçerli bir Pet ID
     url = f"{BASE_URL}/pet"
-    pet_data = {
-        "id": pet_id,
-        "name": "Tommy Updated",
-        "status": "sold",
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "playful"}]
-    }
-    response = requests.put(url, data="<xml>invalid data</xml>", headers={"Content-Type": "application/xml"})
+    response = client.put(url, data="<xml>invalid data</xml>", headers={"Content-Type": "application/xml"})
     print(f"Update Pet with Invalid JSON Format Status Code: {response.status_code}")
     print(f"Response: {response.text}")  # response.text çünkü JSON hatası olabilir
     return response
@@ -334,59 +264,38 @@ def update_pet_with_invalid_json_format():
 def update_pet_with_empty_id():
     pet_id = ""  # Boş ID
     url = f"{BASE_URL}/pet"
-    pet_data = {
-        "id": pet_id,  # Boş ID
-        "name": "Tommy Updated",
-        "status": "sold",
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "playful"}]
-    }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=pet_factory.body("updated", id=pet_id), headers=JSON_HEADERS)
 
     print(f"Update Pet with Empty ID Status Code: {response.status_code}")
 
     # Yanıtın boş ID ile geldiğini kontrol et
     if response.status_code == 200:
         print("Unexpected response: Pet ID should not be empty.")
+        # Sunucunun atadığı id koşu aralığının dışında; ids.cleanup silemez
+        client.delete(f"{BASE_URL}/pet/{response.json()['id']}")
     else:
         print(f"Response: {response.json()}")  # Eğer API doğru hata mesajı döndürebildiyse burada görünür
 
     return response
 
 def update_pet_with_invalid_header():
-    pet_id = 12345  # Geçerli bir Pet ID
+    pet_id = PET_ID  # Geçerli bir Pet ID
     url = f"{BASE_URL}/pet"
-    pet_data = {
-        "id": pet_id,
-        "name": "Tommy Updated",
-        "status": "sold",
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "playful"}]
-    }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/xml"})  # Yanlış Content-Type
+    response = client.put(url, data=pet_factory.body("updated", id=pet_id), headers={"Content-Type": "application/xml"})  # Yanlış Content-Type
     print(f"Update Pet with Invalid Header Status Code: {response.status_code}")
     print(f"Response: {response.text}")  # response.text çünkü JSON hatası olabilir
     return response
 
 
 def update_pet_with_invalid_id():
-    pet_data = {
-        "id": 9999999999999999999999999999999999999999999999,  # Geçersiz ID
-        "name": "Tommy Updated",
-        "status": "sold",
-        "category": {"id": 1, "name": "dog"},
-        "tags": [{"id": 1, "name": "playful"}],
-        "photoUrls": ["http://example.com/photo.jpg"]
-    }
+    pet_body = pet_factory.body(
+        "updated",
+        id=9999999999999999999999999999999999999999999999,  # Geçersiz ID
+        photoUrls=["http://example.com/photo.jpg"],
+    )
 
     url = f"{BASE_URL}/pet"
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=pet_body, headers=JSON_HEADERS)
 
     print(f"Update Pet Response Status Code: {response.status_code}")
     print(f"Response: {response.text}")
@@ -395,7 +304,7 @@ def update_pet_with_invalid_id():
 
 def get_pet_with_invalid_endpoint():
     url = f"{BASE_URL}/invalid_endpoint"  # Hatalı URL
-    response = requests.get(url)
+    response = client.get(url)
 
     print(f"Response invalid endpoint Status Code: {response.status_code}")
     print(f"Response: {response.text}")
@@ -406,7 +315,7 @@ def get_pet_with_invalid_endpoint():
 def delete_non_existent_pet():
     pet_id = 99999999999999  # Non-existent pet ID
     url = f"{BASE_URL}/pet/{pet_id}"
-    response = requests.delete(url)
+    response = client.delete(url)
     print(f"Delete Non-Existent Pet Status Code: {response.status_code}")
     if response.status_code == 404:
         print("Expected result: Pet not found.")
@@ -418,7 +327,7 @@ def delete_non_existent_pet():
 def delete_invalid_pet_id():
     pet_id = "invalid_id"  # Invalid pet ID (string instead of numeric)
     url = f"{BASE_URL}/pet/{pet_id}"
-    response = requests.delete(url)
+    response = client.delete(url)
     print(f"Delete Invalid Pet ID Status Code: {response.status_code}")
     if response.status_code == 400:
         print("Expected result: Bad Request due to invalid ID.")
@@ -430,9 +339,9 @@ def delete_invalid_pet_id():
 
 def upload_pet_image_invalid_pet_id(pet_id, file_path):
     url = f"{BASE_URL}/pet/{pet_id}/uploadImage"
-    files = {"file": open(file_path, "rb")}
-    response = requests.post(url, files=files)
+    response, throughput = multipart.upload_file(url, file_path)
     print(f"Invalid Pet ID - Status Code: {response.status_code}")
+    print(f"Upload Throughput: {throughput:.2f} MB/s")
     if response.status_code == 404:
         print("Pet not found!")
     else:
@@ -445,9 +354,9 @@ def upload_pet_image_invalid_pet_id(pet_id, file_path):
 def upload_pet_image_invalid_file_path(pet_id, file_path):
     try:
         url = f"{BASE_URL}/pet/{pet_id}/uploadImage"
-        files = {"file": open(file_path, "rb")}
-        response = requests.post(url, files=files)
+        response, throughput = multipart.upload_file(url, file_path)
         print(f"Invalid File Path - Status Code: {response.status_code}")
+        print(f"Upload Throughput: {throughput:.2f} MB/s")
         if response.status_code != 200:
             print(f"Error: {response.status_code} - {response.text}")
         return response
@@ -457,9 +366,9 @@ def upload_pet_image_invalid_file_path(pet_id, file_path):
 
 def upload_pet_image_unsupported_file(pet_id, file_path):
     url = f"{BASE_URL}/pet/{pet_id}/uploadImage"
-    files = {"file": open(file_path, "rb")}
-    response = requests.post(url, files=files)
+    response, throughput = multipart.upload_file(url, file_path)
     print(f"Unsupported File Type - Status Code: {response.status_code}")
+    print(f"Upload Throughput: {throughput:.2f} MB/s")
     if response.status_code == 415:
         print("Unsupported media type!")
     else:
@@ -467,11 +376,19 @@ def upload_pet_image_unsupported_file(pet_id, file_path):
     return response
 
 
-def upload_pet_image_large_file(pet_id, file_path):
+def upload_pet_image_large_file(pet_id, size=LARGE_FILE_SIZE):
     url = f"{BASE_URL}/pet/{pet_id}/uploadImage"
-    files = {"file": open(file_path, "rb")}
-    response = requests.post(url, files=files)
+    # Büyük dosya repoda tutulmaz; JPEG başlıklı seyrek bir dosya geçici dizinde oluşturulur
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "large_image.jpg")
+        with open(file_path, "wb") as f:
+            f.write(b"\xff\xd8\xff\xe0")
+            f.truncate(size)
+        # Kaset anahtarı dosyanın mtime'ını içerir; her koşuda aynı kalsın
+        os.utime(file_path, ns=(0, 0))
+        response, throughput = multipart.upload_file(url, file_path)
     print(f"File Too Large - Status Code: {response.status_code}")
+    print(f"Upload Throughput: {throughput:.2f} MB/s")
     if response.status_code == 413:
         print("File size exceeds limit!")
     else:
@@ -485,7 +402,7 @@ def update_pet_status_invalid_pet_id(pet_id, new_status):
         "id": pet_id,
         "status": new_status,
     }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=dumps(pet_data), headers=JSON_HEADERS)
     print(f"Invalid Pet ID - Status Code: {response.status_code}")
     if response.status_code == 404:
         print("Pet not found!")
@@ -499,7 +416,7 @@ def update_pet_status_invalid_status(pet_id, new_status):
         "id": pet_id,
         "status": new_status,  # Invalid status (e.g., "not_active")
     }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=dumps(pet_data), headers=JSON_HEADERS)
     print(f"Invalid Status - Status Code: {response.status_code}")
     if response.status_code == 400:
         print("Invalid status provided!")
@@ -514,7 +431,7 @@ def update_pet_status_missing_fields(pet_id, new_status):
         "id": pet_id,  # For missing 'status'
         # "status": new_status,  # Uncomment to test missing 'status'
     }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=dumps(pet_data), headers=JSON_HEADERS)
     print(f"Missing Fields - Status Code: {response.status_code}")
     if response.status_code == 400:
         print("Missing required fields!")
@@ -526,7 +443,7 @@ def update_pet_status_invalid_json(pet_id, new_status):
     url = f"{BASE_URL}/pet"
     # Incorrectly formatted JSON (e.g., missing closing brace)
     pet_data = '{"id": ' + str(pet_id) + ', "status": "' + new_status + '"'
-    response = requests.put(url, data=pet_data, headers={"Content-Type": "application/json"})
+    response = client.put(url, data=pet_data, headers=JSON_HEADERS)
     print(f"Invalid JSON Format - Status Code: {response.status_code}")
     if response.status_code == 400:
         print("Malformed JSON in request!")
@@ -535,23 +452,6 @@ def update_pet_status_invalid_json(pet_id, new_status):
     return response
 
 
-def run_test_cases(test_cases):
-    """
-    Test case isimlerini alır, sırayla çalıştırır ve sonuçları konsola yazar.
-
-    Args:
-        test_cases (list): Çalıştırılacak test case fonksiyonlarının isimlerinden oluşan liste.
-    """
-    for test in test_cases:
-        # Eğer test bir partial ise, custom bir isim kullan
-        test_name = test.func.__name__ if isinstance(test, partial) else test.__name__
-        print(f"\nÇalıştırılıyor: {test_name}")
-        try:
-            test()  # Test fonksiyonunu çalıştır
-            print(f"{test_name} başarıyla tamamlandı.")
-        except Exception as e:
-            print(f"Hata: {test_name} başarısız oldu. Hata: {e}")
-
 def get_test_cases():
     """
     Çalıştırılacak tüm test caselerini bir liste olarak döner.
@@ -588,17 +488,26 @@ def get_test_cases():
         delete_non_existent_pet,
         delete_invalid_pet_id,
         partial(upload_pet_image_invalid_pet_id,9999990009, "pets-3715733_1280.jpg"),
-        partial(upload_pet_image_invalid_file_path,123, "nonexistent_image.jpg"),
-        partial(upload_pet_image_unsupported_file,123, "image.txt"),
-        partial(upload_pet_image_large_file,123, "large_image.jpg"),
-        partial(update_pet_status_invalid_pet_id,99999, "sold"),
-        partial(update_pet_status_invalid_status,12345, "not_active"),
-        partial(update_pet_status_missing_fields,""),
-        partial(update_pet_status_invalid_json,123, "sold")
+        partial(upload_pet_image_invalid_file_path,PET_ID, "nonexistent_image.jpg"),
+        partial(upload_pet_image_unsupported_file,PET_ID, "image.txt"),
+        partial(upload_pet_image_large_file,PET_ID),
+        partial(update_pet_status_invalid_pet_id,MISSING_PET_ID, "sold"),
+        partial(update_pet_status_invalid_status,PET_ID, "not_active"),
+        partial(update_pet_status_missing_fields,PET_ID, "sold"),
+        partial(update_pet_status_invalid_json,PET_ID, "sold")
     ]
 
+def get_mutation_test_cases():
+    """
+    Geçerli bir petten ve Swagger Pet şemasından üretilen negatif test matrisini döner.
+
+    Yeni bir alan için ayrı fonksiyon yazmak gerekmez; alan şemaya eklendiğinde
+    ona ait yanlış tip, eksik alan ve geçersiz değer caseleri otomatik üretilir.
+
+    Returns:
+        list: Tekilleştirilmiş MutationCase listesi.
+    """
+    return mutations.generate_cases(BASE_URL, [pet_factory.build("doggie", id=PET_ID)])
+
 if __name__ == "__main__":
-    print("Testler Başlatılıyor...\n")
-    test_case_list = get_test_cases()
-    run_test_cases(test_case_list)
-    print("\nTüm testler tamamlandı.")
\ No newline at end of file
+    main(get_test_cases, get_generated_cases=get_mutation_test_cases)
@@ -1,72 +1,69 @@
-import requests
-import json
+import os
 from functools import partial
 
+from petstore import bulk, client, ids, multipart, streaming
+from petstore.index import PetIndex
+from petstore.payloads import JSON_HEADERS, MISSING, PetFactory, dumps
+from petstore.runner import group, main
+from petstore.workflow import Workflow, step
 
-# Base URL
-BASE_URL = "https://petstore.swagger.io/v2"
+
+# Base URL (PETSTORE_BASE_URL ile yerel emülatöre veya staging'e yönlendirilebilir)
+BASE_URL = os.environ.get("PETSTORE_BASE_URL", "https://petstore.swagger.io/v2")
+
+pet_factory = PetFactory()
+pet_index = PetIndex()
+
+# Koşuya özel id'ler; paralel koşular ve CI job'ları birbirinin petlerini değiştirmez
+PET_ID = ids.reserve("positive.pet")
+REX_ID, WHISKERS_ID = ids.reserve("positive.multiple_pets", 2)
+
+# create_multiple_pets ve create_multiple_and_validate_pets için "default" template override'ları
+MULTIPLE_PETS = [
+    {"id": REX_ID, "name": "Rex"},
+    {"id": WHISKERS_ID, "name": "Whiskers", "status": "pending", "category": {"id": 2, "name": "cat"}, "tags": [{"id": 2, "name": "cute"}]},
+]
 
 # Positive Test: Create a Pet
-def create_pet():
+def create_pet(pet_id=PET_ID):
     url = f"{BASE_URL}/pet"
-    pet_data = {
-        "id": 12345,
-        "name": "Tommy",
-        "status": "available",
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "friendly"}]
-    }
-    response = requests.post(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.post(url, data=pet_factory.body("default", id=pet_id), headers=JSON_HEADERS)
     print(f"Create Pet Status Code: {response.status_code}")
     print(f"Create Pet Response: {response.json()}")
     return response
 
 def create_multiple_pets():
-    pets = [
-        {"id": 1111, "name": "Rex", "status": "available", "category": {"id": 1, "name": "dog"}, "tags": [{"id": 1, "name": "friendly"}]},
-        {"id": 2222, "name": "Whiskers", "status": "pending", "category": {"id": 2, "name": "cat"}, "tags": [{"id": 2, "name": "cute"}]},
-    ]
-    for pet in pets:
-        response = requests.post(f"{BASE_URL}/pet", data=json.dumps(pet), headers={"Content-Type": "application/json"})
-        print(f"Create Pet ID {pet['id']} Status Code: {response.status_code}")
-        assert response.status_code == 200, f"Failed to create pet with ID {pet['id']}"
+    pets = (pet_factory.build(**overrides) for overrides in MULTIPLE_PETS)
+    summary = bulk.seed_pets(BASE_URL, pets, validate=False)
+    print(summary)
+    assert summary.failed == 0, f"Failed to create {summary.failed} pets: {summary.samples}"
     print("Multiple pets created successfully.")
 
 
 
-def create_pet_missing_fields():
+def create_pet_missing_fields(pet_id=PET_ID):
     url = f"{BASE_URL}/pet"
-    invalid_pet_data = {
-        "id": 12345,
-        "status": "available"  # Missing 'name' and 'photoUrls'
-    }
-    response = requests.post(url, data=json.dumps(invalid_pet_data), headers={"Content-Type": "application/json"})
+    # Missing 'name' and 'photoUrls'
+    invalid_pet_body = pet_factory.body(id=pet_id, name=MISSING, category=MISSING, tags=MISSING)
+    response = client.post(url, data=invalid_pet_body, headers=JSON_HEADERS)
     print(f"Create Pet Missing Fields Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
 
-def create_pet_missing_nested_fields():
+def create_pet_missing_nested_fields(pet_id=PET_ID):
     url = f"{BASE_URL}/pet"
-    invalid_pet_data = {
-        "id": 12345,
-        "name": "doggie",
-        "status": "available",
-        "category": {},  # Empty category
-        "tags": []  # Empty tags
-    }
-    response = requests.post(url, data=json.dumps(invalid_pet_data), headers={"Content-Type": "application/json"})
+    # Empty category and tags
+    invalid_pet_body = pet_factory.body(id=pet_id, name="doggie", category={}, tags=[])
+    response = client.post(url, data=invalid_pet_body, headers=JSON_HEADERS)
     print(f"Create Pet Missing Nested Fields Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     return response
 
 
 # Positive Test: Read a Pet (GET)
-def get_pet(pet_id=12345):
+def get_pet(pet_id=PET_ID):
     url = f"{BASE_URL}/pet/{pet_id}"
-    response = requests.get(url)
+    response = client.get(url)
     print(f"Get Pet Status Code: {response.status_code}")
     if response.status_code == 200:
         print(f"Pet Data: {response.json()}")
@@ -78,10 +75,13 @@ def get_pet(pet_id=12345):
 # Positive Test: List Pets by Status (GET)
 def list_pets_by_status(status='pending'):
     url = f"{BASE_URL}/pet/findByStatus?status={status}"
-    response = requests.get(url)
+    response = client.get(url, stream=True)
     print(f"List Pets by Status '{status}' Status Code: {response.status_code}")
     if response.status_code == 200:
-        print(f"Pets List: {response.json()}")
+        # Liste belleğe alınmadan okunur; konsola yalnızca sınırlı bir özet yazılır
+        with response:
+            count, pets_preview = streaming.preview(streaming.iter_pets(response))
+        print(f"Pets List ({count} pets): {pets_preview}")
     else:
         print("Failed to fetch pets by status.")
     return response
@@ -89,7 +89,7 @@ def list_pets_by_status(status='pending'):
 
 # Yeni oluşturulan bir pet'in detaylarını, ID ile sorgulama yaparak doğrulamak:
 
-def verify_pet_details(pet_id=12345, expected_name="doggie", expected_status="available"):
+def verify_pet_details(pet_id=PET_ID, expected_name="doggie", expected_status="available"):
     response = get_pet(pet_id)
     if response.status_code == 200:
         pet_data = response.json()
@@ -102,27 +102,17 @@ def verify_pet_details(pet_id=12345, expected_name="doggie", expected_status="av
 
 
 # Positive Test: Update Pet (PUT)
-def update_pet(pet_id=12345):
+def update_pet(pet_id=PET_ID):
     url = f"{BASE_URL}/pet"
-    pet_data = {
-        "id": pet_id,
-        "name": "Tommy Updated",
-        "status": "sold",
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "playful"}]
-    }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=pet_factory.body("updated", id=pet_id), headers=JSON_HEADERS)
     print(f"Update Pet Status Code: {response.status_code}")
     print(f"Update Pet Response: {response.json()}")
     return response
 
 # Positive Test: Delete a Pet (DELETE)
-def delete_pet(pet_id=12345):
+def delete_pet(pet_id=PET_ID):
     url = f"{BASE_URL}/pet/{pet_id}"
-    response = requests.delete(url)
+    response = client.delete(url)
     print(f"Delete Pet Status Code: {response.status_code}")
     if response.status_code == 200:
         print(f"Pet Deleted Successfully")
@@ -133,9 +123,9 @@ def delete_pet(pet_id=12345):
 
 def upload_pet_image(pet_id, file_path):
     url = f"{BASE_URL}/pet/{pet_id}/uploadImage"
-    files = {"file": open(file_path, "rb")}
-    response = requests.post(url, files=files)
+    response, throughput = multipart.upload_file(url, file_path)
     print(f"Upload Image Status Code: {response.status_code}")
+    print(f"Upload Throughput: {throughput:.2f} MB/s")
     if response.status_code == 200:
         print(f"Response: {response.json()}")
     else:
@@ -150,7 +140,7 @@ def update_pet_status(pet_id, new_status):
         "id": pet_id,
         "status": new_status,
     }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=dumps(pet_data), headers=JSON_HEADERS)
     print(f"Update Pet Status Code: {response.status_code}")
     if response.status_code == 200:
         print(f"Pet updated successfully with status: {response.json()}")
@@ -169,7 +159,7 @@ def update_pet_category(pet_id, new_category_id, new_category_name):
             "name": new_category_name
         }
     }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=dumps(pet_data), headers=JSON_HEADERS)
     print(f"Update Pet Category Status Code: {response.status_code}")
     if response.status_code == 200:
         print(f"Pet updated successfully with category: {response.json()}")
@@ -179,13 +169,13 @@ def update_pet_category(pet_id, new_category_id, new_category_name):
 
 
 
-def add_pet_tag(pet_id=12345, new_tag_name="playful"):
+def add_pet_tag(pet_id=PET_ID, new_tag_name="playful"):
     url = f"{BASE_URL}/pet"
     pet_data = {
         "id": pet_id,
         "tags": [{"id": 2, "name": new_tag_name}]
     }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=dumps(pet_data), headers=JSON_HEADERS)
     print(f"Add Pet Tag Status Code: {response.status_code}")
     if response.status_code == 200:
         print(f"Pet updated with new tag: {response.json()}")
@@ -194,47 +184,26 @@ def add_pet_tag(pet_id=12345, new_tag_name="playful"):
     return response
 
 
-def list_pets_by_name(name="Tommy"):
-    url = f"{BASE_URL}/pet/findByStatus?status=available"
-    response = requests.get(url)
-    print(f"List Pets by Name '{name}' Status Code: {response.status_code}")
-    if response.status_code == 200:
-        pets = response.json()
-        matching_pets = [pet for pet in pets if pet['name'] == name]
+def find_pets_by_name(name="Tommy"):
+    # Liste yerel indeksten okunur; sunucuya yalnızca TTL dolunca koşullu istek gider
+    matching_pets = pet_index.find(BASE_URL, status="available", name=name)
+    print(f"List Pets by Name '{name}' Status Code: {pet_index.last_status(BASE_URL)}")
+    if pet_index.last_status(BASE_URL) in (200, 304):
         print(f"Pets List with name '{name}': {matching_pets}")
     else:
         print("Failed to fetch pets by name.")
-    return response
+    return matching_pets
 
 
 def create_multiple_and_validate_pets():
-    pets = [
-        {"id": 1111, "name": "Rex", "status": "available", "category": {"id": 1, "name": "dog"}, "tags": [{"id": 1, "name": "friendly"}]},
-        {"id": 2222, "name": "Whiskers", "status": "pending", "category": {"id": 2, "name": "cat"}, "tags": [{"id": 2, "name": "cute"}]}
-    ]
-    for pet in pets:
-        create_response = requests.post(f"{BASE_URL}/pet", data=json.dumps(pet), headers={"Content-Type": "application/json"})
-        print(f"Create Pet ID {pet['id']} Status Code: {create_response.status_code}")
-        if create_response.status_code == 200:
-            created_pet_id = create_response.json().get('id')
-            get_pet(created_pet_id)
-        else:
-            print(f"Failed to create pet with ID {pet['id']}.")
+    pets = (pet_factory.build(**overrides) for overrides in MULTIPLE_PETS)
+    summary = bulk.seed_pets(BASE_URL, pets, validate=True)
+    print(summary)
 
 
 def update_pet_full_details(pet_id):
     url = f"{BASE_URL}/pet"
-    pet_data = {
-        "id": pet_id,
-        "name": "Updated Pet Name",
-        "status": "available",
-        "category": {
-            "id": 1,
-            "name": "dog"
-        },
-        "tags": [{"id": 1, "name": "friendly"}]
-    }
-    response = requests.put(url, data=json.dumps(pet_data), headers={"Content-Type": "application/json"})
+    response = client.put(url, data=pet_factory.body("full_update", id=pet_id), headers=JSON_HEADERS)
     print(f"Full Pet Update Status Code: {response.status_code}")
     if response.status_code == 200:
         print(f"Updated Pet Data: {response.json()}")
@@ -243,50 +212,71 @@ def update_pet_full_details(pet_id):
     return response
 
 
-def run_test_cases(test_cases):
-    """
-    Test case isimlerini alır, sırayla çalıştırır ve sonuçları konsola yazar.
-
-    Args:
-        test_cases (list): Çalıştırılacak test case fonksiyonlarının isimlerinden oluşan liste.
-    """
-    for test in test_cases:
-        test_name = test.func.__name__ if isinstance(test, partial) else test.__name__
-        print(f"\nÇalıştırılıyor: {test_name}")
-        try:
-            test()
-            print(f"{test_name} başarıyla tamamlandı.")
-        except Exception as e:
-            print(f"Hata: {test_name} başarısız oldu. Hata: {e}")
-
 def get_test_cases():
     """
     Çalıştırılacak tüm test caselerini bir liste olarak döner.
 
+    Birbirine bağımlı testler group() ile işaretlenir; paralel çalıştırmada
+    grup içindeki sıra korunur.
+
     Returns:
-        list: Test case fonksiyonlarının bir listesi.
+        list: Test case fonksiyonlarının ve grupların bir listesi.
     """
     return [
-        create_pet,
-        create_multiple_pets,
-        create_pet_missing_fields,
-        create_pet_missing_nested_fields,
-        get_pet,
+        # PET_ID'li pet üzerinde çalışan testler birbirine bağlı, sıralı kalmalı
+        group(
+            create_pet,
+            create_pet_missing_fields,
+            create_pet_missing_nested_fields,
+            get_pet,
+            partial(verify_pet_details,pet_id=PET_ID, expected_name="doggie", expected_status="available"),
+            update_pet,
+            delete_pet,
+            partial(upload_pet_image, pet_id=PET_ID, file_path="pets-3715733_1280.jpg"),
+            partial(update_pet_status,pet_id=PET_ID, new_status="sold"),
+            partial(update_pet_category,pet_id=PET_ID, new_category_id=2, new_category_name="cat"),
+            partial(add_pet_tag,pet_id=PET_ID, new_tag_name="playful"),
+            partial(update_pet_full_details,pet_id=PET_ID),
+        ),
+        # REX_ID ve WHISKERS_ID'li petleri aynı testler oluşturuyor
+        group(
+            create_multiple_pets,
+            create_multiple_and_validate_pets,
+        ),
         list_pets_by_status,
-        partial(verify_pet_details,pet_id=12345, expected_name="doggie", expected_status="available"),
-        update_pet,
-        delete_pet,
-        partial(upload_pet_image, pet_id=12345, file_path="pets-3715733_1280.jpg"),
-        partial(update_pet_status,pet_id=12345, new_status="sold"),
-        partial(update_pet_category,pet_id=12345, new_category_id=2, new_category_name="cat"),
-        partial(add_pet_tag,pet_id=12345, new_tag_name="playful"),
-        partial(list_pets_by_name,name="Tommy"),
-        create_multiple_and_validate_pets,
-        partial(update_pet_full_details,pet_id=12345)
+        partial(find_pets_by_name,name="Tommy"),
     ]
 
+
+def get_workflow():
+    """
+    Test caselerini kullandıkları petlerle birlikte bir workflow olarak döner.
+
+    PET_ID'li pet oluşturulduktan sonra okuyan testler paralel çalışır, güncellemeler
+    sırayla yapılır ve pet en sonda silinir; diğer dallar bu zinciri beklemez.
+
+    Returns:
+        Workflow: Bağımlılık grafiğine göre çalıştırılacak adımlar.
+    """
+    return Workflow([
+        step(create_pet, produces="pet"),
+        step(create_pet_missing_fields, produces="pet"),
+        step(create_pet_missing_nested_fields, produces="pet"),
+        step(get_pet, consumes="pet"),
+        step(partial(verify_pet_details, pet_id=PET_ID, expected_name="doggie", expected_status="available"),
+             consumes="pet"),
+        step(partial(upload_pet_image, pet_id=PET_ID, file_path="pets-3715733_1280.jpg"), consumes="pet"),
+        step(update_pet, produces="pet"),
+        step(partial(update_pet_status, pet_id=PET_ID, new_status="sold"), produces="pet"),
+        step(partial(update_pet_category, pet_id=PET_ID, new_category_id=2, new_category_name="cat"), produces="pet"),
+        step(partial(add_pet_tag, pet_id=PET_ID, new_tag_name="playful"), produces="pet"),
+        step(partial(update_pet_full_details, pet_id=PET_ID), produces="pet"),
+        step(delete_pet, destroys="pet"),
+        step(create_multiple_pets, produces="multiple_pets"),
+        step(create_multiple_and_validate_pets, produces="multiple_pets"),
+        step(list_pets_by_status),
+        step(partial(find_pets_by_name, name="Tommy")),
+    ])
+
 if __name__ == "__main__":
-    print("Testler Başlatılıyor...\n")
-    test_case_list = get_test_cases()  # Test case listesini al
-    run_test_cases(test_case_list)    # Listeyi çalıştır
-    print("\nTüm testler tamamlandı.")
\ No newline at end of file
+    main(get_test_cases, get_workflow=get_workflow)
@@ -0,0 +1,215 @@
+import os
+
+from petstore import client, ids
+from petstore.payloads import JSON_HEADERS, OrderFactory, UserFactory, dumps
+from petstore.runner import main
+
+# Base URL (PETSTORE_BASE_URL ile yerel emülatöre veya staging'e yönlendirilebilir)
+BASE_URL = os.environ.get("PETSTORE_BASE_URL", "https://petstore.swagger.io/v2")
+
+order_factory = OrderFactory()
+user_factory = UserFactory()
+
+# Bu koşuda hiç oluşturulmayan sipariş ve kullanıcı; "bulunamadı" caseleri için
+MISSING_ORDER_ID = ids.derive("store_user_negative.missing_order")
+MISSING_USERNAME = f"missing_{ids.RUN_ID}"
+USERNAME = f"invalid_{ids.RUN_ID}"
+
+##########################################################################################################################
+# Negative Test: Store (/store/order, /store/inventory)
+
+def get_non_existent_order():
+    url = f"{BASE_URL}/store/order/{MISSING_ORDER_ID}"
+    response = client.get(url)
+    print(f"Get Non-Existent Order Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def get_order_with_invalid_id_type():
+    url = f"{BASE_URL}/store/order/abc123"  # Geçersiz sipariş ID (String)
+    response = client.get(url)
+    print(f"Get Order with Invalid ID Type Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def place_order_malformed_json():
+    url = f"{BASE_URL}/store/order"
+    response = client.post(url, data=order_factory.malformed_body(id=MISSING_ORDER_ID), headers=JSON_HEADERS)
+    print(f"Place Order Malformed JSON Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def place_order_invalid_data_types():
+    url = f"{BASE_URL}/store/order"
+    invalid_order_body = order_factory.invalid_body("bad_quantity", id=MISSING_ORDER_ID)  # quantity string
+    response = client.post(url, data=invalid_order_body, headers=JSON_HEADERS)
+    print(f"Place Order Invalid Data Types Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def place_order_invalid_id():
+    url = f"{BASE_URL}/store/order"
+    response = client.post(url, data=order_factory.invalid_body("bad_id_type"), headers=JSON_HEADERS)
+    print(f"Place Order Invalid ID Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def place_order_invalid_content_type():
+    url = f"{BASE_URL}/store/order"
+    headers = {"Content-Type": "application/xml"}  # Geçersiz Content-Type
+    response = client.post(url, data=order_factory.body(id=MISSING_ORDER_ID), headers=headers)
+    print(f"Place Order Invalid Content-Type Status Code: {response.status_code}")
+    print(f"Response: {response.text}")
+    return response
+
+
+def delete_non_existent_order():
+    url = f"{BASE_URL}/store/order/{MISSING_ORDER_ID}"
+    response = client.delete(url)
+    print(f"Delete Non-Existent Order Status Code: {response.status_code}")
+    if response.status_code == 404:
+        print("Error: Order not found")
+    return response
+
+
+def delete_order_with_invalid_id():
+    url = f"{BASE_URL}/store/order/invalid_id"
+    response = client.delete(url)
+    print(f"Delete Order with Invalid ID Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+# Envanter yalnızca GET ile okunabilir; 405 Method Not Allowed beklenir
+def post_inventory():
+    url = f"{BASE_URL}/store/inventory"
+    response = client.post(url, data=dumps({"available": 1}), headers=JSON_HEADERS)
+    print(f"Post Inventory Status Code: {response.status_code}")
+    print(f"Response: {response.text}")
+    return response
+
+##########################################################################################################################
+# Negative Test: User (/user, /user/createWithArray, /user/createWithList)
+
+def get_non_existent_user():
+    url = f"{BASE_URL}/user/{MISSING_USERNAME}"
+    response = client.get(url)
+    print(f"Get Non-Existent User Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def create_user_malformed_json():
+    url = f"{BASE_URL}/user"
+    response = client.post(url, data=user_factory.malformed_body(username=USERNAME), headers=JSON_HEADERS)
+    print(f"Create User Malformed JSON Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def create_user_invalid_data_types():
+    url = f"{BASE_URL}/user"
+    invalid_user_body = user_factory.invalid_body("bad_user_status", username=USERNAME)  # userStatus string
+    response = client.post(url, data=invalid_user_body, headers=JSON_HEADERS)
+    print(f"Create User Invalid Data Types Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def create_user_invalid_content_type():
+    url = f"{BASE_URL}/user"
+    headers = {"Content-Type": "text/plain"}  # Geçersiz Content-Type
+    response = client.post(url, data=user_factory.body(username=USERNAME), headers=headers)
+    print(f"Create User Invalid Content-Type Status Code: {response.status_code}")
+    print(f"Response: {response.text}")
+    return response
+
+
+def create_users_with_array_not_a_list():
+    url = f"{BASE_URL}/user/createWithArray"
+    # Liste yerine tek bir kullanıcı objesi
+    response = client.post(url, data=user_factory.body(username=USERNAME), headers=JSON_HEADERS)
+    print(f"Create Users With Array (Object Body) Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def create_users_with_list_invalid_item():
+    url = f"{BASE_URL}/user/createWithList"
+    users = [user_factory.build(username=f"{USERNAME}_0"), user_factory.invalid("bad_id_type", username=f"{USERNAME}_1")]
+    response = client.post(url, data=dumps(users), headers=JSON_HEADERS)
+    print(f"Create Users With List Invalid Item Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def update_user_malformed_json():
+    url = f"{BASE_URL}/user/{USERNAME}"
+    response = client.put(url, data=user_factory.malformed_body(username=USERNAME), headers=JSON_HEADERS)
+    print(f"Update User Malformed JSON Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def delete_non_existent_user():
+    url = f"{BASE_URL}/user/{MISSING_USERNAME}"
+    response = client.delete(url)
+    print(f"Delete Non-Existent User Status Code: {response.status_code}")
+    if response.status_code == 404:
+        print("Error: User not found")
+    return response
+
+
+# Swagger sunucusu eksik kimlik bilgisiyle de oturum açabilir; yanıt yalnızca raporlanır
+def login_user_missing_credentials():
+    url = f"{BASE_URL}/user/login"
+    response = client.get(url)
+    print(f"Login User Missing Credentials Status Code: {response.status_code}")
+    print(f"Response: {response.text}")
+    return response
+
+
+def logout_user_wrong_method():
+    url = f"{BASE_URL}/user/logout"
+    response = client.post(url)
+    print(f"Logout User Wrong Method Status Code: {response.status_code}")
+    print(f"Response: {response.text}")
+    return response
+
+
+def get_test_cases():
+    """
+    Çalıştırılacak tüm store ve user negatif test caselerini bir liste olarak döner.
+
+    Returns:
+        list: Test case fonksiyonlarının bir listesi.
+    """
+    return [
+        get_non_existent_order,
+        get_order_with_invalid_id_type,
+        place_order_malformed_json,
+        place_order_invalid_data_types,
+        place_order_invalid_id,
+        place_order_invalid_content_type,
+        delete_non_existent_order,
+        delete_order_with_invalid_id,
+        post_inventory,
+        get_non_existent_user,
+        create_user_malformed_json,
+        create_user_invalid_data_types,
+        create_user_invalid_content_type,
+        create_users_with_array_not_a_list,
+        create_users_with_list_invalid_item,
+        update_user_malformed_json,
+        delete_non_existent_user,
+        login_user_missing_credentials,
+        logout_user_wrong_method,
+    ]
+
+if __name__ == "__main__":
+    main(get_test_cases)
@@ -0,0 +1,237 @@
+import os
+from functools import partial
+
+from petstore import bulk, client, ids
+from petstore.payloads import JSON_HEADERS, OrderFactory, UserFactory, dumps
+from petstore.runner import group, main
+
+# Base URL (PETSTORE_BASE_URL ile yerel emülatöre veya staging'e yönlendirilebilir)
+BASE_URL = os.environ.get("PETSTORE_BASE_URL", "https://petstore.swagger.io/v2")
+
+order_factory = OrderFactory()
+user_factory = UserFactory()
+
+# Sipariş id'leri pet değildir; koşu sonunda pet temizliğine girmemesi için derive ile türetilir
+ORDER_ID = ids.derive("store_user_positive.order")
+ORDER_PET_ID = ids.derive("store_user_positive.order_pet")
+
+# Kullanıcı isimleri koşuya özel; aynı anda çalışan başka koşuların kullanıcılarına dokunulmaz
+USERNAME = f"owner_{ids.RUN_ID}"
+SEED_PREFIX = f"seed_{ids.RUN_ID}"
+SEED_COUNT = 200
+SEED_BATCH_SIZE = 50
+# createWithArray ve createWithList testlerinin tek istekte gönderdiği kullanıcılar
+BATCH_PREFIX = f"batch_{ids.RUN_ID}"
+BATCH_COUNT = 5
+
+
+# Positive Test: Place an Order (POST)
+def place_order(order_id=ORDER_ID):
+    url = f"{BASE_URL}/store/order"
+    response = client.post(url, data=order_factory.body(id=order_id, petId=ORDER_PET_ID), headers=JSON_HEADERS)
+    print(f"Place Order Status Code: {response.status_code}")
+    print(f"Place Order Response: {response.json()}")
+    assert response.status_code == 200, f"Order could not be placed: {response.status_code}"
+    return response
+
+
+# Positive Test: Read an Order (GET)
+def get_order(order_id=ORDER_ID):
+    url = f"{BASE_URL}/store/order/{order_id}"
+    response = client.get(url)
+    print(f"Get Order Status Code: {response.status_code}")
+    if response.status_code == 200:
+        order = response.json()
+        print(f"Order Data: {order}")
+        assert order["id"] == order_id, "Order id mismatch"
+        assert order["petId"] == ORDER_PET_ID, "Order petId mismatch"
+    else:
+        print("Order not found.")
+    return response
+
+
+def get_inventory():
+    url = f"{BASE_URL}/store/inventory"
+    response = client.get(url)
+    print(f"Get Inventory Status Code: {response.status_code}")
+    assert response.status_code == 200, f"Inventory could not be fetched: {response.status_code}"
+    inventory = response.json()
+    assert all(isinstance(count, int) for count in inventory.values()), "Inventory counts must be integers"
+    print(f"Inventory: {inventory}")
+    return response
+
+
+# Positive Test: Delete an Order (DELETE)
+def delete_order(order_id=ORDER_ID):
+    url = f"{BASE_URL}/store/order/{order_id}"
+    response = client.delete(url)
+    print(f"Delete Order Status Code: {response.status_code}")
+    if response.status_code == 200:
+        print("Order Deleted Successfully")
+    else:
+        print("Error deleting order.")
+    return response
+
+
+def verify_order_deleted(order_id=ORDER_ID):
+    response = client.get(f"{BASE_URL}/store/order/{order_id}")
+    print(f"Verify Order Deleted Status Code: {response.status_code}")
+    assert response.status_code == 404, "Order still exists after delete"
+
+
+# Positive Test: Create a User (POST)
+def create_user(username=USERNAME):
+    url = f"{BASE_URL}/user"
+    response = client.post(url, data=user_factory.body(username=username), headers=JSON_HEADERS)
+    print(f"Create User Status Code: {response.status_code}")
+    print(f"Create User Response: {response.json()}")
+    return response
+
+
+def get_user(username=USERNAME):
+    url = f"{BASE_URL}/user/{username}"
+    response = client.get(url)
+    print(f"Get User Status Code: {response.status_code}")
+    if response.status_code == 200:
+        print(f"User Data: {response.json()}")
+    else:
+        print("User not found.")
+    return response
+
+
+def verify_user_details(username=USERNAME, expected_first_name="Tommy", expected_status=1):
+    response = get_user(username)
+    assert response.status_code == 200, "User not found for verification"
+    user = response.json()
+    assert user["username"] == username, "Username mismatch"
+    assert user["firstName"] == expected_first_name, "First name mismatch"
+    assert user["userStatus"] == expected_status, "User status mismatch"
+    print("User details are correct!")
+
+
+def login_user(username=USERNAME, password="secret"):
+    url = f"{BASE_URL}/user/login"
+    response = client.get(url, params={"username": username, "password": password})
+    print(f"Login User Status Code: {response.status_code}")
+    assert response.status_code == 200, f"Login failed: {response.status_code}"
+    print(f"Session: {response.json().get('message')}")
+    print(f"Rate Limit: {response.headers.get('X-Rate-Limit')}, Expires: {response.headers.get('X-Expires-After')}")
+    return response
+
+
+def logout_user():
+    url = f"{BASE_URL}/user/logout"
+    response = client.get(url)
+    print(f"Logout User Status Code: {response.status_code}")
+    return response
+
+
+# Positive Test: Update User (PUT)
+def update_user(username=USERNAME):
+    url = f"{BASE_URL}/user/{username}"
+    response = client.put(url, data=user_factory.body("updated", username=username), headers=JSON_HEADERS)
+    print(f"Update User Status Code: {response.status_code}")
+    print(f"Update User Response: {response.json()}")
+    return response
+
+
+# Positive Test: Delete User (DELETE)
+def delete_user(username=USERNAME):
+    url = f"{BASE_URL}/user/{username}"
+    response = client.delete(url)
+    print(f"Delete User Status Code: {response.status_code}")
+    if response.status_code == 200:
+        print("User Deleted Successfully")
+    else:
+        print("Error deleting user.")
+    return response
+
+
+def create_users_with_array(prefix=f"{BATCH_PREFIX}_array", count=BATCH_COUNT):
+    url = f"{BASE_URL}/user/createWithArray"
+    users = list(bulk.generate_users(count, prefix, user_factory))
+    response = client.post(url, data=dumps(users), headers=JSON_HEADERS)
+    print(f"Create Users With Array Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def create_users_with_list(prefix=f"{BATCH_PREFIX}_list", count=BATCH_COUNT):
+    url = f"{BASE_URL}/user/createWithList"
+    users = list(bulk.generate_users(count, prefix, user_factory))
+    response = client.post(url, data=dumps(users), headers=JSON_HEADERS)
+    print(f"Create Users With List Status Code: {response.status_code}")
+    print(f"Response: {response.json()}")
+    return response
+
+
+def verify_users_created(prefix=f"{BATCH_PREFIX}_array", count=BATCH_COUNT):
+    # İlk ve son kullanıcı yeterli; toplu istek ya hepsini ya hiçbirini oluşturur
+    for username in (f"{prefix}_0", f"{prefix}_{count - 1}"):
+        response = get_user(username)
+        assert response.status_code == 200, f"User {username} was not created"
+    print(f"{count} users verified.")
+
+
+def seed_users(prefix=SEED_PREFIX, count=SEED_COUNT):
+    # Toplu endpoint ile batch'ler halinde; tekil POST /user'dan çok daha az istek
+    summary = bulk.seed_users(BASE_URL, bulk.generate_users(count, prefix, user_factory),
+                              batch_size=SEED_BATCH_SIZE)
+    print(summary)
+    assert summary.failed == 0, f"Failed to create {summary.failed} users: {summary.samples}"
+
+
+def delete_users(prefix, count):
+    counts = bulk.delete_users(BASE_URL, (f"{prefix}_{offset}" for offset in range(count)))
+    print(f"Deleted Users: {counts}")
+    assert counts["failed"] == 0 and counts["missing"] == 0, f"Users could not be deleted: {counts}"
+
+
+def get_test_cases():
+    """
+    Çalıştırılacak tüm store ve user test caselerini bir liste olarak döner.
+
+    Birbirine bağımlı testler group() ile işaretlenir; paralel çalıştırmada
+    grup içindeki sıra korunur.
+
+    Returns:
+        list: Test case fonksiyonlarının ve grupların bir listesi.
+    """
+    return [
+        # ORDER_ID'li sipariş üzerinde çalışan testler
+        group(
+            place_order,
+            get_order,
+            delete_order,
+            verify_order_deleted,
+        ),
+        get_inventory,
+        # USERNAME'li kullanıcının yaşam döngüsü
+        group(
+            create_user,
+            verify_user_details,
+            login_user,
+            update_user,
+            partial(verify_user_details, expected_first_name="Tommy Updated", expected_status=2),
+            logout_user,
+            delete_user,
+        ),
+        group(
+            create_users_with_array,
+            verify_users_created,
+            partial(delete_users, f"{BATCH_PREFIX}_array", BATCH_COUNT),
+        ),
+        group(
+            create_users_with_list,
+            partial(verify_users_created, f"{BATCH_PREFIX}_list", BATCH_COUNT),
+            partial(delete_users, f"{BATCH_PREFIX}_list", BATCH_COUNT),
+        ),
+        group(
+            seed_users,
+            partial(verify_users_created, SEED_PREFIX, SEED_COUNT),
+            partial(delete_users, SEED_PREFIX, SEED_COUNT),
+        ),
+    ]
+
+if __name__ == "__main__":
+    main(get_test_cases)
@@ -0,0 +1,3 @@
+"""
+PetStore test suitelerinin ortak altyapısı (runner, HTTP client, yardımcılar).
+"""
@@ -0,0 +1,267 @@
+import asyncio
+import contextvars
+import inspect
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from petstore import client, metrics, ratelimit
+from petstore.runner import TestGroup, test_name
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Eşzamanlı isteklerin varsayılan üst sınırı
+DEFAULT_CONCURRENCY = 100
+# Senkron test caseleri için ayrılan thread sayısının üst sınırı
+MAX_SYNC_THREADS = 32
+
+_client = None
+_client_loop = None
+
+
+class AsyncResponse:
+    """
+    httpx/aiohttp yanıtını requests ile aynı arayüze (status_code, reason, headers, text, json) getirir.
+
+    Gövde oluşturulurken okunur; kaset, metrics ve response hook'ları yanıtı requests
+    yanıtı gibi kullanabilir.
+    """
+
+    # Gönderilen istek nesnesi tutulmaz; metrics gönderilen gövdeyi çağrı argümanlarından alır
+    request = None
+
+    def __init__(self, status_code, headers, content, encoding, url="", reason=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+        self.url = url
+        self.reason = reason
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self):
+        pass
+
+
+class AsyncClient:
+    """
+    httpx.AsyncClient, yoksa aiohttp.ClientSession üzerine ince bir katman.
+
+    Bağlantı hataları ve timeout'lar requests istisnalarına çevrilir; policy ve kaset
+    senkron istemcideki gibi çalışır.
+
+    Args:
+        limit (int): Toplam ve host başına açık bağlantı üst sınırı.
+    """
+
+    def __init__(self, limit=DEFAULT_CONCURRENCY):
+        if httpx is not None:
+            limits = httpx.Limits(max_connections=limit, max_keepalive_connections=limit)
+            self._httpx = httpx.AsyncClient(limits=limits)
+            self._aiohttp = None
+        elif aiohttp is not None:
+            self._httpx = None
+            self._aiohttp = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=limit, limit_per_host=limit))
+        else:
+            raise ImportError("Async mod için httpx veya aiohttp kurulu olmalı.")
+
+    async def request(self, method, url, params=None, data=None, headers=None, timeout=None, **kwargs):
+        try:
+            if self._httpx is not None:
+                if timeout is not None:
+                    timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+                resp = await self._httpx.request(method, url, params=params, content=data, headers=headers,
+                                                 timeout=timeout, **kwargs)
+                return AsyncResponse(resp.status_code, resp.headers, resp.content, resp.encoding,
+                                     str(resp.url), resp.reason_phrase)
+            if timeout is not None:
+                timeout = aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+            async with self._aiohttp.request(method, url, params=params, data=data, headers=headers,
+                                             timeout=timeout, **kwargs) as resp:
+                content = await resp.read()
+                return AsyncResponse(resp.status, resp.headers, content, resp.charset, str(resp.url), resp.reason)
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except Exception as e:
+            if httpx is not None and isinstance(e, httpx.TimeoutException):
+                raise requests.exceptions.Timeout(str(e)) from e
+            if (httpx is not None and isinstance(e, httpx.TransportError)) or \
+                    (aiohttp is not None and isinstance(e, aiohttp.ClientError)):
+                raise requests.exceptions.ConnectionError(str(e)) from e
+            raise
+
+    async def aclose(self):
+        if self._httpx is not None:
+            await self._httpx.aclose()
+        else:
+            await self._aiohttp.close()
+
+
+def available():
+    """
+    Async mod için httpx veya aiohttp kurulu mu.
+    """
+    return httpx is not None or aiohttp is not None
+
+
+def get_client():
+    """
+    Çalışan event loop'a ait paylaşılan AsyncClient nesnesini döner.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = AsyncClient()
+        _client_loop = loop
+    return _client
+
+
+async def close_client():
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
+
+
+async def _send(method, url, kwargs):
+    from petstore import policy
+    timeout = kwargs.pop("timeout", None)
+    session = get_client()
+    return await policy.default_policy.aexecute(
+        method, url, lambda limit: ratelimit.acall(url, session.request, method, url, timeout=limit, **kwargs),
+        timeout,
+    )
+
+
+async def request(method, url, **kwargs):
+    """
+    client.request'in coroutine karşılığı; paylaşılan AsyncClient üzerinden istek gönderir.
+
+    Policy, ratelimit, kaset, metrics ve response hook'ları senkron istemcideki sırayla
+    uygulanır; stream desteklenmez.
+    """
+    from petstore import cassette
+    metrics.start_call()
+    started = time.perf_counter()
+    response = None
+    error = None
+    try:
+        if cassette.active is not None:
+            response = await cassette.active.arequest(method, url, kwargs, lambda: _send(method, url, dict(kwargs)))
+        else:
+            response = await _send(method, url, kwargs)
+        client.run_response_hooks(method, url, response)
+        return response
+    except Exception as e:
+        error = type(e).__name__
+        raise
+    finally:
+        metrics.finish_call(method, url, response, started, error, kwargs.get("data"))
+
+
+async def get(url, **kwargs):
+    return await request("GET", url, **kwargs)
+
+
+async def post(url, **kwargs):
+    return await request("POST", url, **kwargs)
+
+
+async def put(url, **kwargs):
+    return await request("PUT", url, **kwargs)
+
+
+async def delete(url, **kwargs):
+    return await request("DELETE", url, **kwargs)
+
+
+def _coroutine(test):
+    if inspect.iscoroutinefunction(test):
+        return test
+    # acall metodu olan caseler (ör. mutations.MutationCase) AsyncClient ile event loop'ta koşar
+    acall = getattr(test, "acall", None)
+    return acall if inspect.iscoroutinefunction(acall) else None
+
+
+async def run_test_async(test, semaphore, executor):
+    """
+    Tek bir test caseini semaphore altında çalıştırır.
+
+    Yalnızca coroutine fonksiyonlar ve acall coroutine'i olan caseler (şu an yalnızca
+    mutations.MutationCase) event loop'ta AsyncClient ile koşar. Suite'lerdeki elle
+    yazılmış get_test_cases() caseleri senkron kalır ve en fazla MAX_SYNC_THREADS
+    thread'lik havuzda çalışır. Sonuç formatı senkron runner ile aynıdır.
+    """
+    name = test_name(test)
+    coroutine = _coroutine(test)
+    async with semaphore:
+        print(f"\nÇalıştırılıyor: {name}")
+        token = metrics.set_current_test(name)
+        started = time.perf_counter()
+        try:
+            if coroutine is not None:
+                await coroutine()
+            else:
+                # Test ismi metrics kayıtlarına geçsin diye context executor thread'ine taşınır
+                context = contextvars.copy_context()
+                await asyncio.get_running_loop().run_in_executor(executor, context.run, test)
+            print(f"{name} başarıyla tamamlandı.")
+            return name, True, None, time.perf_counter() - started
+        except Exception as e:
+            print(f"Hata: {name} başarısız oldu. Hata: {e}")
+            return name, False, str(e), time.perf_counter() - started
+        finally:
+            metrics.reset_current_test(token)
+
+
+async def _run_group(tests, semaphore, executor):
+    return [await run_test_async(test, semaphore, executor) for test in tests]
+
+
+async def run_test_cases_async(test_cases, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Test caselerini en fazla concurrency kadarı aynı anda çalışacak şekilde koşturur.
+
+    Elle yazılmış senkron caseler thread havuzunda çalıştığı için bu caselerde eşzamanlılık
+    MAX_SYNC_THREADS ile sınırlıdır; concurrency'nin tamamını coroutine caseler kullanır.
+
+    Args:
+        test_cases (list): Test case fonksiyonları ve group() ile işaretlenmiş gruplar.
+        concurrency (int): Aynı anda çalışabilecek test sayısı.
+
+    Returns:
+        list: Her test için (test ismi, başarılı mı, hata mesajı, süre) listesi.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    units = [tuple(test) if isinstance(test, TestGroup) else (test,) for test in test_cases]
+    with ThreadPoolExecutor(max_workers=min(concurrency, MAX_SYNC_THREADS)) as executor:
+        try:
+            unit_results = await asyncio.gather(*(_run_group(unit, semaphore, executor) for unit in units))
+        finally:
+            await close_client()
+    return [result for results in unit_results for result in results]
+
+
+def run_test_cases(test_cases, concurrency=DEFAULT_CONCURRENCY):
+    return asyncio.run(run_test_cases_async(test_cases, concurrency))
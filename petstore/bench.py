@@ -0,0 +1,354 @@
+import argparse
+import contextlib
+import datetime
+import json
+import math
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+
+import requests
+
+from petstore import bulk, ids, suites
+
+DEFAULT_WARMUP = 5
+DEFAULT_ITERATIONS = 30
+# p95 veya throughput bu oranda kötüleşirse (ve fark anlamlı ve yeterince büyükse) regresyon sayılır
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_ALPHA = 0.05
+# Vargha-Delaney A: rastgele bir yeni örneğin baseline örneğinden yavaş olma olasılığı (0.5 = fark yok).
+# 0.71 büyük etki sınırıdır; yerel koşulardaki küçük ama anlamlı kaymalar regresyon sayılmaz
+DEFAULT_MIN_EFFECT = 0.71
+UPLOAD_FILE = os.path.join(suites.ROOT, "pets-3715733_1280.jpg")
+# Kullanıcı scenario'larında her iterasyonda oluşturulan kullanıcı sayısı
+USER_BATCH = 50
+
+# Kullanıcı scenario'larının oluşturduğu isim önekleri; koşu sonunda silinir
+_user_prefixes = []
+
+
+def _create(suite):
+    return None, lambda _: suite.create_pet(suite.PET_ID)
+
+
+def _get(suite):
+    suite.create_pet(suite.PET_ID)
+    return None, lambda _: suite.get_pet(suite.PET_ID)
+
+
+def _find_by_status(suite):
+    return None, lambda _: suite.list_pets_by_status("available")
+
+
+def _update(suite):
+    suite.create_pet(suite.PET_ID)
+    return None, lambda _: suite.update_pet(suite.PET_ID)
+
+
+def _delete(suite):
+    # Her iterasyon kendi petini siler; oluşturma ölçüme dahil değil
+    def setup():
+        pet_id = ids.allocate()
+        suite.create_pet(pet_id)
+        return pet_id
+    return setup, suite.delete_pet
+
+
+def _upload_image(suite):
+    suite.create_pet(suite.PET_ID)
+    return None, lambda _: suite.upload_pet_image(suite.PET_ID, UPLOAD_FILE)
+
+
+def _user_prefix():
+    prefix = f"bench_{ids.RUN_ID}_{len(_user_prefixes)}"
+    _user_prefixes.append(prefix)
+    return prefix
+
+
+def _users_with_array(suite):
+    users = suites.load("store_user_positive")
+    return _user_prefix, lambda prefix: users.create_users_with_array(prefix, USER_BATCH)
+
+
+def _users_with_list(suite):
+    users = suites.load("store_user_positive")
+    return _user_prefix, lambda prefix: users.create_users_with_list(prefix, USER_BATCH)
+
+
+def _users_single(suite):
+    # Aynı USER_BATCH kullanıcı tek tek POST /user ile; en kötü status döner
+    users = suites.load("store_user_positive")
+
+    def call(prefix):
+        responses = [users.create_user(f"{prefix}_{offset}") for offset in range(USER_BATCH)]
+        return max(responses, key=lambda response: response.status_code)
+    return _user_prefix, call
+
+
+# Toplu oluşturma scenario'ları; throughput'ları tekil POST ile karşılaştırılır
+USER_SCENARIOS = ("usersWithArray", "usersWithList", "usersSingle")
+
+# Scenario ismi -> hazırlık fonksiyonu; (iterasyon başı setup veya None, ölçülen çağrı) döner
+SCENARIOS = {
+    "create": _create,
+    "get": _get,
+    "findByStatus": _find_by_status,
+    "update": _update,
+    "delete": _delete,
+    "uploadImage": _upload_image,
+    "usersWithArray": _users_with_array,
+    "usersWithList": _users_with_list,
+    "usersSingle": _users_single,
+}
+
+
+def environment(base_url):
+    """
+    Sonuçların karşılaştırılabilirliğini etkileyen ortam bilgileri.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=suites.ROOT, capture_output=True,
+                                text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "host": socket.gethostname(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "requests": requests.__version__,
+        "base_url": base_url,
+        "commit": commit,
+    }
+
+
+def percentile(sorted_values, pct):
+    # Nearest-rank yöntemi; örneklerin tamamı regresyon testi için tutulduğundan kesin değer hesaplanır
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_scenario(suite, name, warmup=DEFAULT_WARMUP, iterations=DEFAULT_ITERATIONS):
+    """
+    Scenario'yu önce warmup kez ölçmeden, sonra iterations kez ölçerek çalıştırır.
+
+    Returns:
+        dict: Gecikme örnekleri (ms), yüzdelikler, throughput ve hata sayısı.
+    """
+    setup, call = SCENARIOS[name](suite)
+    samples = []
+    errors = 0
+    measured = 0.0
+    for index in range(warmup + iterations):
+        argument = setup() if setup else None
+        started = time.perf_counter()
+        try:
+            failed = call(argument).status_code >= 400
+        except Exception:
+            failed = True
+        elapsed = time.perf_counter() - started
+        if index < warmup:
+            continue
+        measured += elapsed
+        samples.append(elapsed * 1000)
+        errors += failed
+    values = sorted(samples)
+    return {
+        "samples": samples,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "mean": sum(values) / len(values),
+        "throughput": len(values) / measured if measured else 0.0,
+        "errors": errors,
+    }
+
+
+def run(base_url, scenarios=None, warmup=DEFAULT_WARMUP, iterations=DEFAULT_ITERATIONS):
+    """
+    Scenario'ları sırayla çalıştırır; scenario fonksiyonlarının konsol çıktısı bastırılır.
+
+    Returns:
+        dict: environment ve scenario sonuçları.
+    """
+    suites.set_base_url(base_url)
+    suite = suites.load("positive")
+    results = {}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for name in scenarios or SCENARIOS:
+            results[name] = run_scenario(suite, name, warmup, iterations)
+        ids.cleanup(base_url)
+        bulk.delete_users(base_url, (f"{prefix}_{offset}" for prefix in _user_prefixes for offset in range(USER_BATCH)))
+        _user_prefixes.clear()
+    return {"environment": environment(base_url), "scenarios": results}
+
+
+def mann_whitney_u(baseline, current):
+    """
+    current örneklerinin baseline'dan büyük (daha yavaş) olduğu hipotezi için tek yönlü Mann-Whitney U testi.
+
+    Bağlı sıralar ortalama sıra alır; p-değeri süreklilik düzeltmeli normal yaklaşımla hesaplanır.
+
+    Returns:
+        tuple: (U istatistiği, p-değeri)
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 0.0, 1.0
+    values = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    rank_sum = 0.0
+    ties = 0.0
+    position = 0
+    while position < len(values):
+        end = position
+        while end + 1 < len(values) and values[end + 1][0] == values[position][0]:
+            end += 1
+        count = end - position + 1
+        average_rank = (position + end) / 2 + 1
+        rank_sum += average_rank * sum(1 for _, group in values[position:end + 1] if group == 0)
+        ties += count ** 3 - count
+        position = end + 1
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def effect_size(u, baseline, current):
+    """
+    Mann-Whitney U'dan Vargha-Delaney A etki büyüklüğü; örnek yoksa 0.5.
+    """
+    pairs = len(baseline) * len(current)
+    return u / pairs if pairs else 0.5
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD, alpha=DEFAULT_ALPHA, min_effect=DEFAULT_MIN_EFFECT):
+    """
+    Sonuçları baseline ile karşılaştırır.
+
+    Bir scenario, p95 gecikmesi threshold oranından fazla artmışsa veya throughput'u
+    threshold oranından fazla düşmüşse, gecikme dağılımındaki kayma alpha düzeyinde
+    anlamlıysa ve etki büyüklüğü en az min_effect ise regresyon sayılır. Tek örnekteki
+    gürültü veya küçük ama istatistiksel olarak anlamlı kaymalar tek başına CI'ı kırmaz.
+
+    Returns:
+        list: Scenario başına karşılaştırma satırları (dict).
+    """
+    rows = []
+    for name, result in current["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            continue
+        u, p_value = mann_whitney_u(base["samples"], result["samples"])
+        effect = effect_size(u, base["samples"], result["samples"])
+        p95_change = result["p95"] / base["p95"] - 1 if base["p95"] else 0.0
+        throughput_change = result["throughput"] / base["throughput"] - 1 if base["throughput"] else 0.0
+        significant = p_value < alpha and effect >= min_effect
+        rows.append({
+            "scenario": name,
+            "p95_change": p95_change,
+            "throughput_change": throughput_change,
+            "p_value": p_value,
+            "effect": effect,
+            "regression": significant and (p95_change > threshold or throughput_change < -threshold),
+        })
+    return rows
+
+
+def print_results(results):
+    print(f"\n{'Scenario':<16}{'p50':>9}{'p95':>9}{'p99':>9}{'istek/sn':>10}{'Hata':>6}  (ms)")
+    for name, row in results["scenarios"].items():
+        print(f"{name:<16}{row['p50']:>9.2f}{row['p95']:>9.2f}{row['p99']:>9.2f}{row['throughput']:>10.1f}{row['errors']:>6}")
+
+
+def print_bulk_comparison(results):
+    """
+    Toplu kullanıcı endpointlerinin throughput'unu tekil POST /user ile karşılaştırır.
+    """
+    scenarios = results["scenarios"]
+    single = scenarios.get("usersSingle")
+    rows = [(name, scenarios[name]) for name in USER_SCENARIOS if name in scenarios]
+    if len(rows) < 2 or single is None:
+        return
+    print(f"\n{'Kullanıcı oluşturma':<20}{'kullanıcı/sn':>14}{'tekile göre':>13}")
+    for name, row in rows:
+        rate = row["throughput"] * USER_BATCH
+        print(f"{name:<20}{rate:>14.0f}{row['throughput'] / single['throughput']:>12.1f}x")
+
+
+def print_comparison(rows, baseline):
+    environment = baseline.get("environment", {})
+    print(f"\nBaseline: {environment.get('timestamp')} ({environment.get('commit') or 'commit bilinmiyor'}, "
+          f"{environment.get('base_url')})")
+    print(f"{'Scenario':<16}{'p95 Δ':>9}{'istek/sn Δ':>12}{'p':>9}{'A':>7}")
+    for row in rows:
+        flag = "  REGRESYON" if row["regression"] else ""
+        print(f"{row['scenario']:<16}{row['p95_change'] * 100:>8.1f}%{row['throughput_change'] * 100:>11.1f}%"
+              f"{row['p_value']:>9.3f}{row['effect']:>7.2f}{flag}")
+
+
+def _count(minimum):
+    def parse(value):
+        number = int(value)
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"En az {minimum} olmalı: {value}")
+        return number
+    return parse
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save(path, results):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Petstore endpoint benchmark'ı ve baseline karşılaştırması.")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="Çalıştırılacak scenario (tekrarlanabilir)")
+    parser.add_argument("--warmup", type=_count(0), default=DEFAULT_WARMUP)
+    parser.add_argument("--iterations", type=_count(1), default=DEFAULT_ITERATIONS)
+    parser.add_argument("--output", default=None, help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--baseline", default=None, help="Karşılaştırılacak baseline JSON dosyası")
+    parser.add_argument("--save-baseline", default=None, metavar="PATH", help="Sonuçları yeni baseline olarak kaydeder")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="İzin verilen kötüleşme oranı (0.10 = %%10)")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="Anlamlılık düzeyi")
+    parser.add_argument("--min-effect", type=float, default=DEFAULT_MIN_EFFECT,
+                        help="Regresyon için en küçük Vargha-Delaney A etki büyüklüğü (0.5 = fark yok)")
+    parser.add_argument("--base-url", default=os.environ.get("PETSTORE_BASE_URL", "https://petstore.swagger.io/v2"))
+    parser.add_argument("--local", action="store_true", help="Süreç içi Petstore emülatörüne karşı çalıştır")
+    args = parser.parse_args()
+
+    server = None
+    if args.local:
+        from petstore import server as petstore_server
+        server = petstore_server.start()
+        args.base_url = server.base_url
+    results = run(args.base_url, args.scenario, args.warmup, args.iterations)
+    if server is not None:
+        server.stop()
+    print_results(results)
+    print_bulk_comparison(results)
+    for path in (args.output, args.save_baseline):
+        if path:
+            _save(path, results)
+    if args.baseline:
+        baseline = _load(args.baseline)
+        rows = compare(baseline, results, args.threshold, args.alpha, args.min_effect)
+        print_comparison(rows, baseline)
+        if any(row["regression"] for row in rows):
+            print("\nPerformans regresyonu tespit edildi.")
+            sys.exit(1)
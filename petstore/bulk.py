@@ -0,0 +1,305 @@
+import argparse
+import json
+import os
+import threading
+import time
+import zlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from petstore import client
+from petstore.payloads import JSON_HEADERS, PetFactory, UserFactory, dumps
+
+DEFAULT_WORKERS = 16
+# Tek istekte liste olarak gönderilen kullanıcı sayısı
+DEFAULT_BATCH_SIZE = 100
+# Toplu kullanıcı endpointleri; None tekil POST /user demektir
+USER_ENDPOINTS = ("createWithArray", "createWithList", None)
+# Hata özetinde tutulacak en fazla örnek; sayaçlar yine de tüm hataları sayar
+MAX_FAILURE_SAMPLES = 20
+
+
+def _fingerprint(pet):
+    # Doğrulama için pet başına tek bir 32 bit değer saklanır, petin kendisi değil
+    return zlib.crc32(f"{pet.get('name')}\x00{pet.get('status')}".encode())
+
+
+class SeedSummary:
+    """
+    Toplu oluşturma sonucunun kompakt özeti.
+
+    Args:
+        noun (str): Özette oluşturulan kaynağın ismi.
+    """
+
+    def __init__(self, noun="pet"):
+        self.noun = noun
+        self.sent = 0
+        self.created = 0
+        self.failures = {}
+        self.samples = []
+        self.validated = 0
+        self.mismatched = 0
+        self.elapsed = 0.0
+        self.validate_elapsed = 0.0
+
+    @property
+    def failed(self):
+        return sum(self.failures.values())
+
+    def add_failure(self, reason, pet_id):
+        self.failures[reason] = self.failures.get(reason, 0) + 1
+        if len(self.samples) < MAX_FAILURE_SAMPLES:
+            self.samples.append((pet_id, reason))
+
+    def __str__(self):
+        rate = self.created / self.elapsed if self.elapsed else 0.0
+        lines = [f"{self.created}/{self.sent} {self.noun} oluşturuldu, {self.elapsed:.1f} sn ({rate:.0f} {self.noun}/sn)"]
+        if self.validated or self.mismatched:
+            lines.append(f"Doğrulama: {self.validated} doğru, {self.mismatched} hatalı, {self.validate_elapsed:.1f} sn")
+        for reason, count in sorted(self.failures.items(), key=lambda item: -item[1]):
+            lines.append(f"  {reason}: {count}")
+        if self.samples:
+            lines.append(f"  Örnekler: {self.samples}")
+        return "\n".join(lines)
+
+
+def iter_pets_jsonl(path):
+    """
+    Her satırında bir pet bulunan JSON Lines dosyasını satır satır okur.
+    """
+    with open(path) as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def generate_pets(count, start_id, factory=None):
+    """
+    PetFactory'den sıralı id'lerle count adet pet üretir.
+    """
+    factory = factory or PetFactory()
+    statuses = ("available", "pending", "sold")
+    for offset in range(count):
+        pet_id = start_id + offset
+        yield factory.build(id=pet_id, name=f"pet-{pet_id}", status=statuses[offset % 3])
+
+
+def generate_users(count, prefix, factory=None):
+    """
+    UserFactory'den "{prefix}_{sıra}" kullanıcı isimleriyle count adet kullanıcı üretir.
+    """
+    factory = factory or UserFactory()
+    for offset in range(count):
+        yield factory.build(id=offset + 1, username=f"{prefix}_{offset}", email=f"{prefix}_{offset}@example.com")
+
+
+def _batches(items, size):
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _run_bounded(tasks, worker, workers, max_in_flight):
+    # Semaphore dolunca generator'dan okunmaz; bellekte en fazla max_in_flight iş bulunur
+    slots = threading.BoundedSemaphore(max_in_flight)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for task in tasks:
+            slots.acquire()
+            future = executor.submit(worker, task)
+            future.add_done_callback(lambda _: slots.release())
+
+
+def seed_pets(base_url, pets, workers=DEFAULT_WORKERS, max_in_flight=None, validate=True):
+    """
+    Petleri sınırlı eşzamanlılıkla POST /pet ile oluşturur, istenirse sonra toplu GET ile doğrular.
+
+    Paylaşılan bağlantı havuzunu değiştirmez; havuz çağıranın kurulumunda (runner, CLI)
+    workers'a göre boyutlanır, küçükse istekler boşa çıkan bağlantıyı bekler.
+
+    pets bir generator olabilir; tamamı belleğe alınmaz. Doğrulama için pet başına
+    yalnızca id ve 32 bitlik bir parmak izi saklanır.
+
+    Args:
+        base_url (str): Petstore BASE_URL.
+        pets (iterable): Pet dict'leri.
+        workers (int): Eşzamanlı istek sayısı.
+        max_in_flight (int): Kuyrukta bekleyebilecek en fazla pet (varsayılan: workers * 4).
+        validate (bool): Oluşturulan petler GET ile kontrol edilsin mi.
+
+    Returns:
+        SeedSummary: Sayılar ve hata örnekleri.
+    """
+    summary = SeedSummary()
+    lock = threading.Lock()
+    created_ids = array("q")
+    fingerprints = array("L")
+    url = f"{base_url}/pet"
+
+    def create(pet):
+        try:
+            response = client.post(url, data=dumps(pet), headers=JSON_HEADERS)
+        except Exception as e:
+            with lock:
+                summary.add_failure(type(e).__name__, pet.get("id"))
+            return
+        with lock:
+            if response.status_code == 200:
+                summary.created += 1
+                if validate:
+                    created_ids.append(pet.get("id") or response.json()["id"])
+                    fingerprints.append(_fingerprint(pet))
+            else:
+                summary.add_failure(f"POST {response.status_code}", pet.get("id"))
+
+    def counted(pets):
+        for pet in pets:
+            summary.sent += 1
+            yield pet
+
+    started = time.perf_counter()
+    _run_bounded(counted(pets), create, workers, max_in_flight or workers * 4)
+    summary.elapsed = time.perf_counter() - started
+
+    if validate:
+        started = time.perf_counter()
+        validate_pets(base_url, created_ids, fingerprints, summary, workers)
+        summary.validate_elapsed = time.perf_counter() - started
+    return summary
+
+
+def validate_pets(base_url, pet_ids, fingerprints, summary, workers=DEFAULT_WORKERS, batch_size=256):
+    """
+    Oluşturulan petleri batch'ler halinde GET /pet/{id} ile kontrol eder ve summary'yi günceller.
+    """
+    lock = threading.Lock()
+
+    def check(batch):
+        valid = 0
+        for index in batch:
+            pet_id = pet_ids[index]
+            try:
+                response = client.get(f"{base_url}/pet/{pet_id}")
+                if response.status_code == 200 and _fingerprint(response.json()) == fingerprints[index]:
+                    valid += 1
+                    continue
+                reason = f"GET {response.status_code}" if response.status_code != 200 else "mismatch"
+            except Exception as e:
+                reason = type(e).__name__
+            with lock:
+                summary.mismatched += 1
+                summary.add_failure(reason, pet_id)
+        with lock:
+            summary.validated += valid
+
+    batches = (range(start, min(start + batch_size, len(pet_ids))) for start in range(0, len(pet_ids), batch_size))
+    _run_bounded(batches, check, workers, workers * 2)
+
+
+def seed_users(base_url, users, endpoint="createWithArray", batch_size=DEFAULT_BATCH_SIZE,
+               workers=DEFAULT_WORKERS):
+    """
+    Kullanıcıları toplu endpointlerle batch'ler halinde, sınırlı eşzamanlılıkla oluşturur.
+
+    users bir generator olabilir; bellekte en fazla workers * 2 batch bulunur.
+
+    Args:
+        base_url (str): Petstore BASE_URL.
+        users (iterable): Kullanıcı dict'leri.
+        endpoint (str): "createWithArray", "createWithList" veya tekil POST /user için None.
+        batch_size (int): Tek istekte gönderilecek kullanıcı sayısı (endpoint None ise 1).
+        workers (int): Eşzamanlı istek sayısı.
+
+    Returns:
+        SeedSummary: Sayılar ve hata örnekleri.
+    """
+    if endpoint not in USER_ENDPOINTS:
+        raise ValueError(f"Bilinmeyen kullanıcı endpoint'i: {endpoint}")
+    summary = SeedSummary("kullanıcı")
+    lock = threading.Lock()
+    url = f"{base_url}/user/{endpoint}" if endpoint else f"{base_url}/user"
+
+    def create(batch):
+        try:
+            response = client.post(url, data=dumps(batch if endpoint else batch[0]), headers=JSON_HEADERS)
+        except Exception as e:
+            with lock:
+                summary.add_failure(type(e).__name__, batch[0].get("username"))
+            return
+        with lock:
+            if response.status_code == 200:
+                summary.created += len(batch)
+            else:
+                summary.add_failure(f"POST {response.status_code}", batch[0].get("username"))
+
+    def counted(users):
+        for batch in _batches(users, batch_size if endpoint else 1):
+            summary.sent += len(batch)
+            yield batch
+
+    started = time.perf_counter()
+    _run_bounded(counted(users), create, workers, workers * 2)
+    summary.elapsed = time.perf_counter() - started
+    return summary
+
+
+def _delete_all(urls, workers):
+    counts = {"deleted": 0, "missing": 0, "failed": 0}
+    lock = threading.Lock()
+
+    def remove(url):
+        try:
+            status = client.delete(url).status_code
+            key = "deleted" if status == 200 else "missing" if status == 404 else "failed"
+        except Exception:
+            key = "failed"
+        with lock:
+            counts[key] += 1
+
+    _run_bounded(urls, remove, workers, workers * 4)
+    return counts
+
+
+def delete_pets(base_url, pet_ids, workers=DEFAULT_WORKERS):
+    """
+    Petleri sınırlı eşzamanlılıkla DELETE /pet/{id} ile siler; zaten olmayan petler hata sayılmaz.
+
+    Returns:
+        dict: deleted, missing ve failed sayıları.
+    """
+    return _delete_all((f"{base_url}/pet/{pet_id}" for pet_id in pet_ids), workers)
+
+
+def delete_users(base_url, usernames, workers=DEFAULT_WORKERS):
+    """
+    Kullanıcıları DELETE /user/{username} ile siler; Petstore'da toplu silme endpoint'i yoktur.
+
+    Returns:
+        dict: deleted, missing ve failed sayıları.
+    """
+    return _delete_all((f"{base_url}/user/{username}" for username in usernames), workers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Petstore'a toplu pet yükler.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", help="Her satırda bir pet bulunan JSON Lines dosyası")
+    source.add_argument("--count", type=int, help="PetFactory ile üretilecek pet sayısı")
+    parser.add_argument("--start-id", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--no-validate", action="store_true")
+    parser.add_argument("--base-url", default=os.environ.get("PETSTORE_BASE_URL", "https://petstore.swagger.io/v2"))
+    parser.add_argument("--local", action="store_true", help="Süreç içi Petstore emülatörüne yükle")
+    args = parser.parse_args()
+
+    server = None
+    if args.local:
+        from petstore import server as petstore_server
+        server = petstore_server.start()
+        args.base_url = server.base_url
+    client.configure(pool_maxsize=max(args.workers, client.POOL_MAXSIZE))
+    pets = iter_pets_jsonl(args.file) if args.file else generate_pets(args.count, args.start_id)
+    print(seed_pets(args.base_url, pets, workers=args.workers, validate=not args.no_validate))
+    if server is not None:
+        server.stop()
@@ -0,0 +1,328 @@
+import functools
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from petstore import metrics
+
+MODES = ("record", "replay", "verify")
+# Anahtara giren istek başlıkları; User-Agent, Content-Length gibi başlıklar yanıtı değiştirmez
+KEY_HEADERS = ("accept", "content-type", "if-none-match", "if-modified-since", "api_key")
+DEFAULT_DRIFT_SAMPLE = 0.1
+# verify modunda yalnızca bunlar canlı gönderilir; yazan istekler canlı sunucuda temizlenmeyen veri bırakır
+DRIFT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Kayıtta koşuya özel run id'nin yerine yazılır; replay eden koşunun run id'si geri konur
+RUN_PLACEHOLDER = "<run>"
+MAX_DRIFT_SAMPLES = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS interactions (
+    key TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    reason TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (key, seq)
+)
+"""
+
+active = None
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """
+    Replay modunda kasette karşılığı olmayan bir istek yapıldığında fırlatılır.
+    """
+
+
+def _body_key(data):
+    if data is None:
+        return b""
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode()
+    if isinstance(data, dict):
+        return json.dumps(data, sort_keys=True).encode()
+    # Akış gövdeleri (MultipartFile) okunmadan anahtarlanabilmek için cache_key sağlar
+    return getattr(data, "cache_key", type(data).__name__).encode()
+
+
+def _run_id():
+    # ids yüklenmemiş bir process'te koşuya özel değer de yoktur
+    ids = sys.modules.get("petstore.ids")
+    return None if ids is None else str(ids.RUN_ID)
+
+
+@functools.lru_cache(maxsize=4)
+def _run_patterns(run_id):
+    # Pet id'leri run_id + 6 haneli sayaç, kullanıcı isimleri "..._<run_id>" biçimindedir;
+    # başka bir sayının parçası olan eşleşmeler değiştirilmez
+    pattern = rf"(?<!\d){run_id}(?=(?:\d{{6}})?(?!\d))"
+    return re.compile(pattern), re.compile(pattern.encode())
+
+
+def normalize(value):
+    """
+    Metindeki (str veya bytes) koşuya özel id ve isimlerde run id'yi RUN_PLACEHOLDER ile değiştirir.
+
+    Her koşu ids.RUN_ID'den türetilen farklı id'ler kullandığı için kayıtlar ve
+    anahtarlar run id'den bağımsız tutulur; kaset başka bir koşuda da replay edilebilir.
+    """
+    run_id = _run_id()
+    if run_id is None:
+        return value
+    text, binary = _run_patterns(run_id)
+    if isinstance(value, bytes):
+        return binary.sub(RUN_PLACEHOLDER.encode(), value)
+    return text.sub(RUN_PLACEHOLDER, value)
+
+
+def restore(body):
+    """
+    normalize() ile kaydedilmiş gövdeye bu koşunun run id'sini geri koyar.
+    """
+    run_id = _run_id()
+    return body if run_id is None else body.replace(RUN_PLACEHOLDER.encode(), run_id.encode())
+
+
+def request_key(method, url, params=None, headers=None, data=None, scope=None):
+    """
+    İsteğin kasetteki anahtarı: test ismi, method, path + query, seçili başlıklar ve gövdenin sha256'sı.
+
+    Test ismi (scope) anahtara girdiği için aynı isteği yapan farklı testlerin ve
+    suite'lerin kayıtları birbirinin tekrar sırasını bozmaz.
+
+    Host anahtara girmez; --local emülatörünün her koşuda değişen portu kaydı bozmasın.
+    Bir kaset tek bir sunucuya aittir. Koşuya özel run id de normalize() ile anahtardan
+    çıkarılır.
+    """
+    prepared = requests.Request(method.upper(), url, params=params).prepare()
+    parts = urlsplit(prepared.url)
+    digest = hashlib.sha256(normalize(f"{scope}\n{prepared.method} {parts.path}?{parts.query}\n").encode())
+    for name, value in sorted((name.lower(), str(value)) for name, value in (headers or {}).items()):
+        if name in KEY_HEADERS:
+            if name == "content-type":
+                # multipart boundary her istekte rastgele üretilir
+                value = value.split(";")[0].strip()
+            digest.update(normalize(f"{name}: {value}\n").encode())
+    digest.update(b"\n" + normalize(_body_key(data)))
+    return digest.hexdigest()
+
+
+def _shape(value):
+    # Drift karşılaştırması için değerlerin yerine tiplerini koyar; id gibi değişken alanlar farklı sayılmaz
+    if isinstance(value, dict):
+        return {key: _shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_shape(value[0])] if value else []
+    return type(value).__name__
+
+
+def _body_shape(status, content):
+    try:
+        return status, _shape(json.loads(content)) if content else None
+    except ValueError:
+        return status, "text"
+
+
+class Cassette:
+    """
+    İstek/yanıt çiftlerini sqlite dosyasında saklayan kayıt deposu.
+
+    Aynı istek bir koşuda birden fazla kez yapılabilir (ör. silme öncesi ve sonrası GET);
+    bu yüzden kayıtlar (anahtar, kaçıncı tekrar) ile tutulur ve replay sırasında aynı
+    sırayla döner. Gövdeler zlib ile sıkıştırılır.
+
+    Args:
+        path (str): Kaset dosyası.
+        mode (str): "record" canlı sunucuya gidip kaydeder, "replay" ağa hiç çıkmaz,
+            "verify" replay eder ve drift_sample oranındaki okuma isteklerini (DRIFT_METHODS)
+            canlı sunucuyla karşılaştırır.
+        drift_sample (float): verify modunda canlı kontrol edilecek okuma isteği oranı.
+    """
+
+    def __init__(self, path, mode="replay", drift_sample=DEFAULT_DRIFT_SAMPLE):
+        if mode not in MODES:
+            raise ValueError(f"Geçersiz kaset modu: {mode}")
+        self.path = path
+        self.mode = mode
+        self.drift_sample = drift_sample
+        self.hits = 0
+        self.recorded = 0
+        self.checked = 0
+        self.drifts = []
+        self._seen = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connect().execute(SCHEMA)
+
+    def _connect(self):
+        # sqlite bağlantıları thread'ler ve fork edilmiş process'ler arasında paylaşılmaz
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection, self._local.pid = connection, pid
+        return self._local.connection
+
+    def _next_seq(self, key):
+        with self._lock:
+            seq = self._seen.get(key, 0)
+            self._seen[key] = seq + 1
+        return seq
+
+    def _load(self, key, seq):
+        row = self._connect().execute(
+            "SELECT status, reason, headers, body, url FROM interactions WHERE key = ? AND seq <= ? "
+            "ORDER BY seq DESC LIMIT 1",
+            (key, seq),
+        ).fetchone()
+        return row
+
+    def _save(self, key, seq, method, response):
+        self._connect().execute(
+            "INSERT OR REPLACE INTO interactions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, seq, method.upper(), normalize(response.url), response.status_code, response.reason,
+             json.dumps(dict(response.headers)), zlib.compress(normalize(response.content)), time.time()),
+        )
+        with self._lock:
+            self.recorded += 1
+
+    @staticmethod
+    def _response(row, url):
+        status, reason, headers, body, _ = row
+        body = restore(zlib.decompress(body))
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.url = url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(0)
+        response._content = body
+        response._content_consumed = True
+        response.raw = io.BytesIO(body)
+        return response
+
+    def request(self, method, url, kwargs, send):
+        """
+        İsteği moda göre kasetten karşılar veya send() ile canlı gönderip kaydeder.
+
+        Args:
+            method (str): HTTP method.
+            url (str): İstek URL'si.
+            kwargs (dict): requests'e verilecek params, headers, data ...
+            send (callable): İsteği canlı sunucuya gönderen fonksiyon.
+        """
+        key, seq = self._key(method, url, kwargs)
+        if self.mode == "record":
+            return self._record(key, seq, method, send(), kwargs)
+        response = self._replay(key, seq, method, url)
+        if self._sampled(method):
+            try:
+                self._compare(method, url, response, send())
+            except requests.exceptions.RequestException as e:
+                self._compare(method, url, response, error=e)
+        return response
+
+    async def arequest(self, method, url, kwargs, send):
+        """
+        request'in coroutine karşılığı; send() awaitable döner.
+        """
+        key, seq = self._key(method, url, kwargs)
+        if self.mode == "record":
+            return self._record(key, seq, method, await send(), kwargs)
+        response = self._replay(key, seq, method, url)
+        if self._sampled(method):
+            try:
+                self._compare(method, url, response, await send())
+            except requests.exceptions.RequestException as e:
+                self._compare(method, url, response, error=e)
+        return response
+
+    def _key(self, method, url, kwargs):
+        key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"), kwargs.get("data"),
+                          metrics.current_test())
+        return key, self._next_seq(key)
+
+    def _record(self, key, seq, method, response, kwargs):
+        self._save(key, seq, method, response)
+        if kwargs.get("stream"):
+            # Gövde kayıt için okundu; akış olarak okuyacak çağıran için yeniden sar
+            response.raw = io.BytesIO(response.content)
+        return response
+
+    def _replay(self, key, seq, method, url):
+        row = self._load(key, seq)
+        if row is None:
+            raise CassetteMissError(f"Kasette kayıt yok: {method.upper()} {url}")
+        with self._lock:
+            self.hits += 1
+        return self._response(row, url)
+
+    def _sampled(self, method):
+        return self.mode == "verify" and method.upper() in DRIFT_METHODS and random.random() < self.drift_sample
+
+    def _compare(self, method, url, replayed, live=None, error=None):
+        if error is None:
+            expected, actual = _body_shape(replayed.status_code, replayed.content), _body_shape(live.status_code, live.content)
+        else:
+            expected, actual = replayed.status_code, type(error).__name__
+        with self._lock:
+            self.checked += 1
+            if expected != actual and len(self.drifts) < MAX_DRIFT_SAMPLES:
+                self.drifts.append((f"{method.upper()} {urlsplit(url).path}", expected, actual))
+
+    def summary(self):
+        if self.mode == "record":
+            return f"Kaset ({self.path}): {self.recorded} etkileşim kaydedildi"
+        lines = [f"Kaset ({self.path}): {self.hits} yanıt replay edildi"]
+        if self.mode == "verify":
+            lines.append(f"Drift kontrolü: {self.checked} istek canlı kontrol edildi, {len(self.drifts)} fark")
+            lines.extend(f"  {call}: kayıt {expected} != canlı {actual}" for call, expected, actual in self.drifts)
+        return "\n".join(lines)
+
+
+def install(path, mode="replay", drift_sample=DEFAULT_DRIFT_SAMPLE):
+    """
+    petstore.client çağrılarını kasete yönlendirir.
+
+    Returns:
+        Cassette: Aktif kaset.
+    """
+    global active
+    active = Cassette(path, mode, drift_sample)
+    return active
+
+
+def uninstall():
+    global active
+    active = None
+
+
+def worker_state():
+    return None if active is None else (active.path, active.mode, active.drift_sample)
+
+
+def init_worker(state):
+    if state is not None:
+        install(*state)
@@ -0,0 +1,181 @@
+import os
+import threading
+import time
+from functools import partial
+
+from petstore import metrics, ratelimit
+
+# Varsayılan havuz ayarları; configure() ile runner'ın worker sayısına göre büyütülür
+POOL_CONNECTIONS = 10   # Aynı anda tutulacak host havuzu sayısı
+POOL_MAXSIZE = 10       # Host başına en fazla açık bağlantı
+POOL_BLOCK = True       # Limit dolunca yeni bağlantı açmak yerine boşa çıkanı bekle
+
+_lock = threading.Lock()
+_session = None
+_session_pid = None
+_stats = {"opened": 0, "requests": 0}
+_response_hooks = []
+
+
+def _count(key):
+    with _lock:
+        _stats[key] += 1
+
+
+def _new_session():
+    # requests/urllib3 yalnızca ilk istekte yüklenir; yalnızca test listesi isteyen process'ler bedelini ödemez
+    from petstore import transport
+    return transport.new_session(POOL_CONNECTIONS, POOL_MAXSIZE, POOL_BLOCK)
+
+
+def get_session():
+    """
+    Tüm test fonksiyonlarının paylaştığı requests.Session nesnesini döner.
+
+    Process havuzunda fork sonrası soketler paylaşılmasın diye her process kendi
+    session'ını oluşturur.
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    # Global bir kez okunur; araya giren configure() None yapsa da çağırana session döner
+    session = _session
+    if session is None or _session_pid != pid:
+        with _lock:
+            session = _session
+            if session is None or _session_pid != pid:
+                if _session_pid != pid:
+                    _stats.update(opened=0, requests=0)
+                session = _session = _new_session()
+                _session_pid = pid
+    return session
+
+
+def configure(pool_connections=None, pool_maxsize=None, pool_block=None):
+    """
+    Bağlantı havuzu ayarlarını değiştirir; ayar değiştiyse sonraki istek yeni session açar.
+
+    Args:
+        pool_connections (int): Tutulacak host havuzu sayısı.
+        pool_maxsize (int): Host başına en fazla açık bağlantı.
+        pool_block (bool): Limit dolduğunda bağlantı beklensin mi.
+    """
+    global POOL_CONNECTIONS, POOL_MAXSIZE, POOL_BLOCK, _session
+    with _lock:
+        settings = (POOL_CONNECTIONS, POOL_MAXSIZE, POOL_BLOCK)
+        if pool_connections is not None:
+            POOL_CONNECTIONS = pool_connections
+        if pool_maxsize is not None:
+            POOL_MAXSIZE = pool_maxsize
+        if pool_block is not None:
+            POOL_BLOCK = pool_block
+        old = None
+        if settings != (POOL_CONNECTIONS, POOL_MAXSIZE, POOL_BLOCK):
+            # Fork ile miras kalan session parent'ındır; yalnızca bırakılır
+            old = _session if _session_pid == os.getpid() else None
+            _session = None
+    if old is not None:
+        # Kapatılan havuz boştaki bağlantıları kapatır; süren istekler tamamlanır ve
+        # bağlantıları havuza dönerken kapatılır
+        old.close()
+
+
+def close():
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def connection_stats():
+    """
+    Bu process'te açılan ve yeniden kullanılan bağlantı sayılarını döner.
+
+    Returns:
+        dict: opened, reused ve requests anahtarları.
+    """
+    with _lock:
+        opened, total = _stats["opened"], _stats["requests"]
+    return {"opened": opened, "reused": max(total - opened, 0), "requests": total}
+
+
+def add_response_hook(hook):
+    """
+    Gövdesi okunmuş her yanıt için hook(method, url, response) çağrılmasını sağlar.
+
+    stream=True yanıtlarda gövde okunmadığı için hook çağrılmaz; hook'un
+    wrap_items(method, url, response, items) metodu varsa streaming.iter_pets akıştan
+    okunan elemanları bu metottan geçirir.
+    """
+    _response_hooks.append(hook)
+    return hook
+
+
+def remove_response_hook(hook):
+    if hook in _response_hooks:
+        _response_hooks.remove(hook)
+
+
+def run_response_hooks(method, url, response, stream=False):
+    """
+    Yanıtı response hook'larından geçirir; stream yanıtlarda hook'lar item_hooks olarak eklenir.
+    """
+    if _response_hooks and not stream:
+        for hook in list(_response_hooks):
+            hook(method, url, response)
+    elif _response_hooks:
+        response.item_hooks = [partial(hook.wrap_items, method, url, response)
+                               for hook in _response_hooks if hasattr(hook, "wrap_items")]
+
+
+def _send(method, url, kwargs):
+    from petstore import policy
+    timeout = kwargs.pop("timeout", None)
+    session = get_session()
+    return policy.default_policy.execute(
+        method, url, lambda limit: ratelimit.call(url, session.request, method, url, timeout=limit, **kwargs),
+        timeout,
+    )
+
+
+def request(method, url, **kwargs):
+    """
+    Paylaşılan session üzerinden istek gönderir ve çağrıyı metrics hook'larına raporlar.
+
+    Timeout, idempotent istekler için retry ve devre kesici petstore.policy, hız ve
+    eşzamanlılık limiti petstore.ratelimit tarafından uygulanır. Kaset aktifse yanıt
+    petstore.cassette üzerinden kaydedilir veya replay edilir.
+    """
+    from petstore import cassette
+    metrics.start_call()
+    started = time.perf_counter()
+    response = None
+    error = None
+    try:
+        if cassette.active is not None:
+            response = cassette.active.request(method, url, kwargs, lambda: _send(method, url, dict(kwargs)))
+        else:
+            response = _send(method, url, kwargs)
+        run_response_hooks(method, url, response, kwargs.get("stream", False))
+        return response
+    except Exception as e:
+        error = type(e).__name__
+        raise
+    finally:
+        metrics.finish_call(method, url, response, started, error, kwargs.get("data"), kwargs.get("stream", False))
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+def put(url, **kwargs):
+    return request("PUT", url, **kwargs)
+
+
+def delete(url, **kwargs):
+    return request("DELETE", url, **kwargs)
@@ -0,0 +1,133 @@
+import multiprocessing
+import os
+import random
+import threading
+import zlib
+
+from petstore import bulk
+
+# Her koşuya ayrılan id aralığının büyüklüğü; id = run_id * RUN_BLOCK + sayaç
+RUN_BLOCK = 10**6
+# run_id * RUN_BLOCK int64 sınırının altında kalmalı
+MAX_RUN_ID = 9 * 10**12
+# Bloğun başı reserve() ile isimle ayrılan id'lere, geri kalanı allocate() sayacına ayrılır
+NAMED_RANGE = 10**5
+
+# Process'ler arası kilit ilk ihtiyaçta oluşur (_shared_lock); yalnızca import eden process semaphore açmaz
+_lock = None
+_lock_guard = threading.Lock()
+_counter = multiprocessing.RawValue("q", NAMED_RANGE)
+_reserved = set()
+
+
+def _run_id():
+    value = os.environ.get("PETSTORE_RUN_ID")
+    if value:
+        run_id = int(value)
+        if not 0 < run_id < MAX_RUN_ID:
+            raise ValueError(f"PETSTORE_RUN_ID 1 ile {MAX_RUN_ID} arasında olmalı: {value}")
+        return run_id
+    run_id = random.SystemRandom().randrange(1, MAX_RUN_ID)
+    # spawn/forkserver ile başlayan worker'lar ve alt process'ler aynı koşu aralığını kullansın
+    os.environ["PETSTORE_RUN_ID"] = str(run_id)
+    return run_id
+
+
+# Sayaç ve run id modül yüklenirken oluşur; fork edilen worker process'ler aynı aralığı paylaşır
+RUN_ID = _run_id()
+FIRST_ID = RUN_ID * RUN_BLOCK
+
+
+def reserve(name, count=1):
+    """
+    İsimden türetilen, her process'te aynı olan id'leri döner.
+
+    Suite'lerin modül seviyesindeki sabitleri (PET_ID gibi) bununla ayrılır; suite'i
+    sonradan yükleyen bir worker process de parent ile aynı id'leri görür.
+
+    Args:
+        name (str): Koşu içinde tekil isim, örn. "positive.pet".
+        count (int): Ardışık id sayısı.
+
+    Returns:
+        int: count == 1 ise id, değilse ardışık id'lerin range'i.
+    """
+    derived = derive(name, count)
+    _reserved.update(range(derived, derived + 1) if count == 1 else derived)
+    return derived
+
+
+def derive(name, count=1):
+    """
+    reserve() gibi isimden id türetir, ancak id'ler koşu sonunda pet olarak silinmez.
+
+    Sipariş gibi pet olmayan kaynakların id'leri için kullanılır.
+
+    Returns:
+        int: count == 1 ise id, değilse ardışık id'lerin range'i.
+    """
+    start = FIRST_ID + zlib.crc32(name.encode()) % (NAMED_RANGE - count)
+    return start if count == 1 else range(start, start + count)
+
+
+def _shared_lock():
+    # spawn bağlamındaki kilit fork ile de miras alınabilir; fork bağlamındaki forkserver worker'larına verilemez
+    global _lock
+    if _lock is None:
+        with _lock_guard:
+            if _lock is None:
+                _lock = multiprocessing.get_context("spawn").Lock()
+    return _lock
+
+
+def allocate(count=1):
+    """
+    Bu koşuya ait, başka bir koşu veya CI job'uyla çakışmayan pet id'leri ayırır.
+
+    Aynı aralığı tekrar kullanmak için PETSTORE_RUN_ID verilir; kaset replay'i için gerekmez,
+    kayıtlar run id'den bağımsız tutulur (cassette.normalize).
+
+    Args:
+        count (int): Ayrılacak ardışık id sayısı.
+
+    Returns:
+        int: count == 1 ise id, değilse ardışık id'lerin range'i.
+    """
+    with _shared_lock():
+        start = _counter.value - NAMED_RANGE
+        if start + count > RUN_BLOCK - NAMED_RANGE:
+            raise RuntimeError(f"Koşu için ayrılan {RUN_BLOCK} id tükendi")
+        _counter.value += count
+    start += FIRST_ID + NAMED_RANGE
+    return start if count == 1 else range(start, start + count)
+
+
+def allocated():
+    """
+    Bu process'te isimle ayrılan ve tüm process'lerde sayaçla ayrılan id'ler.
+    """
+    return sorted(_reserved) + list(range(FIRST_ID + NAMED_RANGE, FIRST_ID + _counter.value))
+
+
+def worker_state():
+    # Fork dışı başlatma yöntemlerinde process havuzunun initializer'ına verilir; fork öncesi de
+    # çağrılır ki worker'lar aynı kilidi miras alsın
+    return _shared_lock(), _counter
+
+
+def init_worker(state):
+    global _lock, _counter
+    _lock, _counter = state
+
+
+def cleanup(base_url, workers=bulk.DEFAULT_WORKERS):
+    """
+    Bu koşuda ayrılan id'lerdeki petleri toplu olarak siler.
+
+    Hangi testin hangi id'de pet oluşturduğu izlenmez; ayrılan id'lerin tamamı silinir
+    ve zaten silinmiş veya hiç oluşturulmamış petler 404 olarak sayılır.
+
+    Returns:
+        dict: deleted, missing ve failed sayıları.
+    """
+    return bulk.delete_pets(base_url, allocated(), workers)
@@ -0,0 +1,179 @@
+import threading
+import time
+
+from petstore import client, streaming
+
+DEFAULT_TTL = 30.0
+# Başarılı olduğunda listeyi eskiten istekler
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+def _hashable(value):
+    # Herkese açık sunucuda isimler string olmayabilir; indeks anahtarı yine de üretilebilmeli
+    return value if isinstance(value, (str, int, float, type(None))) else repr(value)
+
+
+class _StatusView:
+    """
+    Tek bir findByStatus listesinin id, isim, tag ve kategori indeksleri.
+    """
+
+    def __init__(self):
+        self.pets = {}
+        self.by_name = {}
+        self.by_tag = {}
+        self.by_category = {}
+        self.etag = None
+        self.last_modified = None
+        self.fetched_at = None
+        self.last_status = None
+        # Her eskitmede artar; istek sürerken gelen yazma sonrası liste taze sayılmaz
+        self.generation = 0
+
+    def expire(self):
+        self.fetched_at = None
+        self.generation += 1
+
+    @staticmethod
+    def _keys(pet):
+        category = pet.get("category")
+        tags = pet.get("tags") if isinstance(pet.get("tags"), list) else ()
+        return (
+            _hashable(pet.get("name")),
+            [_hashable(tag.get("name")) for tag in tags if isinstance(tag, dict)],
+            _hashable(category.get("name")) if isinstance(category, dict) else None,
+        )
+
+    def _add(self, pet_id, pet):
+        name, tags, category = self._keys(pet)
+        self.pets[pet_id] = pet
+        self.by_name.setdefault(name, set()).add(pet_id)
+        for tag in tags:
+            self.by_tag.setdefault(tag, set()).add(pet_id)
+        self.by_category.setdefault(category, set()).add(pet_id)
+
+    def _remove(self, pet_id):
+        pet = self.pets.pop(pet_id)
+        name, tags, category = self._keys(pet)
+        self.by_name[name].discard(pet_id)
+        for tag in tags:
+            self.by_tag[tag].discard(pet_id)
+        self.by_category[category].discard(pet_id)
+
+    def update(self, pets):
+        """
+        Yeni listeyi mevcut indekse uygular; yalnızca değişen petlerin indeks kayıtları yenilenir.
+        """
+        seen = set()
+        for pet in pets:
+            pet_id = pet.get("id")
+            seen.add(pet_id)
+            old = self.pets.get(pet_id)
+            if old == pet:
+                continue
+            if old is not None:
+                self._remove(pet_id)
+            self._add(pet_id, pet)
+        for pet_id in [pet_id for pet_id in self.pets if pet_id not in seen]:
+            self._remove(pet_id)
+
+
+class PetIndex:
+    """
+    findByStatus listelerinin isim, status, kategori ve tag'e göre yerel indeksi.
+
+    Liste ttl saniye boyunca istek atılmadan kullanılır. Süre dolunca ETag veya
+    Last-Modified ile koşullu istek atılır; 304 yanıtında gövde indirilmez ve parse edilmez.
+    petstore.client üzerinden yapılan başarılı /pet yazmaları TTL'i beklemeden listeyi
+    eskitir; sonraki find() koşullu istekle güncel listeyi alır.
+
+    Args:
+        ttl (float): Listenin yeniden kontrol edilmeden kullanılacağı süre (saniye).
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        self._views = {}
+        self._lock = threading.Lock()
+        client.add_response_hook(self._on_response)
+
+    def _on_response(self, method, url, response):
+        if method.upper() not in WRITE_METHODS or response.status_code >= 400:
+            return
+        with self._lock:
+            for (base_url, _), view in self._views.items():
+                if url.startswith(f"{base_url}/pet"):
+                    view.expire()
+
+    def close(self):
+        client.remove_response_hook(self._on_response)
+
+    def _view(self, base_url, status):
+        key = (base_url, status)
+        view = self._views.get(key)
+        if view is None:
+            view = self._views[key] = _StatusView()
+        return view
+
+    def refresh(self, base_url, status="available", force=False):
+        """
+        Listeyi gerekiyorsa sunucudan yeniler.
+
+        İstek ve parse kilit dışında yapılır; find() ve yazma hook'ları ağ beklerken bloklanmaz.
+        Sonuç kilit altında indekse uygulanır. İstek sürerken liste eskitildiyse yeni liste
+        yine uygulanır ama taze sayılmaz; sonraki find() tekrar koşullu istek atar.
+
+        Returns:
+            int: Son isteğin status kodu (200, 304 ...) veya TTL içinde istek atılmadıysa None.
+        """
+        with self._lock:
+            view = self._view(base_url, status)
+            if not force and view.fetched_at is not None and time.monotonic() - view.fetched_at < self.ttl:
+                return None
+            headers = {}
+            if view.etag:
+                headers["If-None-Match"] = view.etag
+            if view.last_modified:
+                headers["If-Modified-Since"] = view.last_modified
+            generation = view.generation
+        response = client.get(f"{base_url}/pet/findByStatus", params={"status": status}, headers=headers, stream=True)
+        pets = None
+        with response:
+            if response.status_code == 200:
+                pets = [pet for pet in streaming.iter_pets(response) if isinstance(pet, dict)]
+        with self._lock:
+            view.last_status = response.status_code
+            if pets is not None:
+                view.update(pets)
+                view.etag = response.headers.get("ETag")
+                view.last_modified = response.headers.get("Last-Modified")
+            if response.status_code in (200, 304) and view.generation == generation:
+                view.fetched_at = time.monotonic()
+        return response.status_code
+
+    def invalidate(self, base_url=None):
+        with self._lock:
+            for key, view in self._views.items():
+                if base_url is None or key[0] == base_url:
+                    view.expire()
+
+    def find(self, base_url, status="available", name=None, tag=None, category=None):
+        """
+        Verilen kriterlere uyan petleri indeksten döner; kriterler kesişim olarak uygulanır.
+        """
+        self.refresh(base_url, status)
+        with self._lock:
+            view = self._view(base_url, status)
+            candidates = None
+            for index, key in ((view.by_name, name), (view.by_tag, tag), (view.by_category, category)):
+                if key is None:
+                    continue
+                ids = index.get(key, set())
+                candidates = ids if candidates is None else candidates & ids
+            if candidates is None:
+                return list(view.pets.values())
+            return [view.pets[pet_id] for pet_id in candidates]
+
+    def last_status(self, base_url, status="available"):
+        with self._lock:
+            return self._view(base_url, status).last_status
@@ -0,0 +1,290 @@
+import argparse
+import contextlib
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from petstore import bulk, client, ids, suites
+from petstore.histogram import Histogram
+from petstore.metrics import EndpointStats
+
+# Scenario fonksiyonu -> (endpoint etiketi, varsayılan ağırlık)
+OPERATIONS = {
+    "create_pet": ("POST /pet", 1),
+    "get_pet": ("GET /pet/{id}", 5),
+    "list_pets_by_status": ("GET /pet/findByStatus", 2),
+    "update_pet": ("PUT /pet", 1),
+    "delete_pet": ("DELETE /pet/{id}", 1),
+}
+
+# Operasyonun pet id'si: yeni ayrılan ("create") veya bu koşuda oluşturulmuş bir pet ("use", "delete")
+PET_ACCESS = {
+    "create_pet": "create",
+    "get_pet": "use",
+    "update_pet": "use",
+    "delete_pet": "delete",
+}
+
+PERCENTILES = (50, 90, 99, 99.9)
+# Açık döngüde istekler arası süre: sabit (1/rate) veya üstel dağılımlı (Poisson geliş)
+ARRIVALS = ("constant", "poisson")
+# Planlanan zamandan bu kadar geç gönderilen istekler worker yetersizliğine işaret eder (saniye)
+LAG_WARNING = 0.010
+
+
+class LoadGenerator:
+    """
+    Mevcut scenario fonksiyonlarını ağırlıklı operasyonlar olarak çalıştıran yük üreteci.
+
+    rate verilirse yük açık döngüdür: istekler yanıtlardan bağımsız, önceden belirlenmiş
+    bir geliş takvimiyle gönderilir ve gecikme planlanan gönderim zamanından ölçülür.
+    Sunucu yavaşlayıp worker'lar takvimin gerisine düştüğünde bekleyen istekler de
+    gecikmeye yansır (coordinated omission düzeltmesi); servis süresi ayrıca raporlanır.
+    Süre dolduğunda takvimde bekleyen istekler gönderilmez; her biri en az deadline -
+    planlanan zaman kadar beklemiş sayılır ve bu alt sınır gecikme yüzdeliklerine katılır.
+    rate verilmezse worker'lar beklemeden çalışır (kapalı döngü).
+
+    Her oluşturma ids.allocate() ile yeni bir id alır; okuma, güncelleme ve silme bu
+    koşuda oluşturulmuş petlerden birini, kullanıldığı süre boyunca başka worker'a
+    vermeden seçer. Bu yüzden aynı pet üzerinde yarışan istekler 404 olarak hataya
+    karışmaz. Kullanılabilir pet yoksa operasyon yerine pet oluşturulur; koşu sonunda
+    kalan petler silinir.
+
+    Args:
+        weights (dict): Operasyon ismi -> ağırlık.
+        concurrency (int): Aynı anda istek gönderen worker sayısı; açık döngüde uçuştaki en fazla istek.
+        rate (float): Hedef saniyedeki istek sayısı; None ise worker'lar beklemeden çalışır.
+        duration (float): Yükün süresi (saniye).
+        arrival (str): Açık döngüde geliş takvimi, "constant" veya "poisson".
+    """
+
+    def __init__(self, weights=None, concurrency=10, rate=None, duration=10.0, seed=None, arrival="constant"):
+        self.suite = suites.load("positive")
+        weights = weights or {name: weight for name, (_, weight) in OPERATIONS.items()}
+        self.operations = [(name, getattr(self.suite, name)) for name in weights]
+        self.weights = list(weights.values())
+        self.concurrency = concurrency
+        self.rate = rate
+        self.duration = duration
+        self.seed = seed
+        if arrival not in ARRIVALS:
+            raise ValueError(f"Bilinmeyen geliş takvimi: {arrival}")
+        self.arrival = arrival
+        # Pet kalmadığında create_pet'e düşülebilir; seçilmemiş olsa da ölçümü tutulur
+        names = list(weights) + ["create_pet"] * ("create_pet" not in weights)
+        self.stats = {name: EndpointStats() for name in names}
+        # Açık döngüde istek başına yalnızca sunucu süresi; stats'taki gecikme planlanan zamandan ölçülür
+        self.service = {name: Histogram() for name in names}
+        # Planlanan ile gerçek gönderim zamanı arasındaki fark
+        self.send_lag = Histogram()
+        # Süre içinde gönderilemeyen isteklerin bekleme süresi (alt sınır: deadline - planlanan zaman)
+        self.unsent_wait = Histogram()
+        self._lock = threading.Lock()
+        self._issued = 0
+        self._offset = 0.0
+        self._unsent = 0
+        self._arrival_rng = random.Random(seed)
+        # Bu koşuda oluşturulmuş ve şu an hiçbir worker'ın kullanmadığı pet id'leri
+        self._idle_pets = []
+        self.cleanup = None
+
+    def _next_slot(self, start):
+        # Takvimdeki bir sonraki isteğin zamanı; yanıtlara bağlı değil, tüm worker'lar aynı takvimi paylaşır
+        with self._lock:
+            if self.arrival == "poisson":
+                self._offset += self._arrival_rng.expovariate(self.rate)
+            else:
+                self._offset = self._issued / self.rate
+            self._issued += 1
+            return start + self._offset
+
+    def _skip(self, slot, deadline):
+        with self._lock:
+            self._unsent += 1
+            self.unsent_wait.record(max(deadline - slot, 0.0))
+
+    def _checkout(self, rng):
+        with self._lock:
+            if not self._idle_pets:
+                return None
+            index = rng.randrange(len(self._idle_pets))
+            # Sıra önemli değil; sondaki elemanla yer değiştirip O(1) çıkarılır
+            self._idle_pets[index], self._idle_pets[-1] = self._idle_pets[-1], self._idle_pets[index]
+            return self._idle_pets.pop()
+
+    def _checkin(self, pet_id):
+        with self._lock:
+            self._idle_pets.append(pet_id)
+
+    def _pick(self, rng):
+        # (isim, operasyon, pet id) seçer; bu koşuya ait kullanılabilir pet yoksa yenisini oluşturur
+        name, operation = rng.choices(self.operations, weights=self.weights)[0]
+        access = PET_ACCESS.get(name)
+        if access is None:
+            return name, operation, None
+        pet_id = self._checkout(rng) if access != "create" else None
+        if pet_id is None:
+            name, operation, pet_id = "create_pet", self.suite.create_pet, ids.allocate()
+        return name, operation, pet_id
+
+    def _release(self, name, pet_id, failed):
+        # Oluşan, kullanılan veya silinemeyen pet tekrar seçilebilir olur
+        access = PET_ACCESS[name]
+        if access == "use" or access == "create" and not failed or access == "delete" and failed:
+            self._checkin(pet_id)
+
+    def _seed(self):
+        # Ölçüme girmeyen başlangıç petleri; her worker'ın ilk okumasında bir pet hazır olsun
+        if not any(PET_ACCESS.get(name) in ("use", "delete") for name, _ in self.operations):
+            return
+        for _ in range(self.concurrency):
+            pet_id = ids.allocate()
+            with contextlib.suppress(Exception):
+                if self.suite.create_pet(pet_id).status_code < 400:
+                    self._checkin(pet_id)
+
+    def _worker(self, index, start, deadline):
+        rng = random.Random(None if self.seed is None else self.seed + index)
+        while True:
+            slot = None
+            if self.rate:
+                slot = self._next_slot(start)
+                if slot >= deadline:
+                    return
+                delay = slot - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                elif time.perf_counter() >= deadline:
+                    # Süre doldu; takvimde kalan istekler gönderilmez, bekleme süreleriyle raporlanır
+                    self._skip(slot, deadline)
+                    return
+            elif time.perf_counter() >= deadline:
+                return
+            name, operation, pet_id = self._pick(rng)
+            began = time.perf_counter()
+            try:
+                response = operation() if pet_id is None else operation(pet_id)
+                failed = response.status_code >= 400
+            except Exception:
+                failed = True
+            finished = time.perf_counter()
+            if pet_id is not None:
+                self._release(name, pet_id, failed)
+            # Açık döngüde gecikme isteğin gönderilmesi gereken andan başlar
+            latency = finished - (slot if slot is not None else began)
+            with self._lock:
+                self.stats[name].add(latency, failed)
+                self.service[name].record(finished - began)
+                if slot is not None:
+                    self.send_lag.record(max(began - slot, 0.0))
+
+    def run(self):
+        """
+        Yükü çalıştırır; scenario fonksiyonlarının konsol çıktısı bastırılır.
+
+        Returns:
+            dict: Endpoint bazında rapor ve toplam throughput.
+        """
+        client.configure(pool_maxsize=max(self.concurrency, client.POOL_MAXSIZE))
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            self._seed()
+            start = time.perf_counter()
+            deadline = start + self.duration
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                for index in range(self.concurrency):
+                    executor.submit(self._worker, index, start, deadline)
+            elapsed = time.perf_counter() - start
+        if self.rate:
+            while (slot := self._next_slot(start)) < deadline:
+                self._skip(slot, deadline)
+        # Silinmeden kalan petler; silinenler ve oluşturulamayanlar tekrar istek almaz
+        self.cleanup = bulk.delete_pets(self.suite.BASE_URL, self._idle_pets)
+        self._idle_pets = []
+        return self.report(elapsed)
+
+    def report(self, elapsed):
+        endpoints = {}
+        total = 0
+        for name, stats in self.stats.items():
+            if not stats.count and name not in dict(self.operations):
+                # Yalnızca yedek olarak eklenmiş ve hiç kullanılmamış create_pet
+                continue
+            total += stats.count
+            endpoints[OPERATIONS.get(name, (name,))[0]] = {
+                "count": stats.count,
+                "error_rate": stats.errors / stats.count if stats.count else 0.0,
+                "throughput": stats.count / elapsed,
+                **{f"p{pct:g}": stats.latency.percentile(pct) * 1000 for pct in PERCENTILES},
+                "service_p99": self.service[name].percentile(99) * 1000,
+            }
+        report = {"elapsed": elapsed, "requests": total, "throughput": total / elapsed, "endpoints": endpoints}
+        if self.rate:
+            # Gönderilemeyen istekler dahil tüm takvimin gecikmesi; gönderilemeyenler için alt sınır
+            overall = Histogram()
+            for stats in self.stats.values():
+                overall.merge(stats.latency)
+            overall.merge(self.unsent_wait)
+            report.update(target_rate=self.rate, arrival=self.arrival, unsent=self._unsent,
+                          unsent_wait_max=self.unsent_wait.max * 1000, p99_with_unsent=overall.percentile(99) * 1000,
+                          send_lag_p99=self.send_lag.percentile(99) * 1000, send_lag_max=self.send_lag.max * 1000)
+        return report
+
+
+def print_report(report):
+    print(f"\nToplam: {report['requests']} istek, {report['elapsed']:.1f} sn, {report['throughput']:.1f} istek/sn")
+    if "target_rate" in report:
+        print(f"Açık döngü: hedef {report['target_rate']:g} istek/sn ({report['arrival']}), "
+              f"gönderim gecikmesi p99 {report['send_lag_p99']:.1f} ms, en fazla {report['send_lag_max']:.1f} ms, "
+              f"süre içinde gönderilemeyen {report['unsent']} istek")
+        if report["unsent"]:
+            print(f"Gönderilemeyen isteklerin bekleme alt sınırı en fazla {report['unsent_wait_max']:.1f} ms; "
+                  f"bunlar dahil p99 en az {report['p99_with_unsent']:.1f} ms")
+    print(f"{'Endpoint':<24}{'Adet':>8}{'Hata %':>8}{'p50':>9}{'p90':>9}{'p99':>9}{'p99.9':>9}{'servis p99':>12}  (ms)")
+    for endpoint, row in report["endpoints"].items():
+        print(f"{endpoint:<24}{row['count']:>8}{row['error_rate'] * 100:>8.1f}"
+              f"{row['p50']:>9.1f}{row['p90']:>9.1f}{row['p99']:>9.1f}{row['p99.9']:>9.1f}{row['service_p99']:>12.1f}")
+    if report.get("send_lag_p99", 0.0) > LAG_WARNING * 1000 or report.get("unsent"):
+        print("Uyarı: istekler takvimin gerisinde kaldı; gecikmeler bekleme süresini içerir. "
+              "Sunucu kapasitesini ölçmek için --concurrency artırılabilir.")
+
+
+def parse_weights(values):
+    weights = {}
+    for value in values:
+        name, _, weight = value.partition("=")
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Bilinmeyen operasyon: {name}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scenario fonksiyonlarıyla Petstore yük testi.")
+    parser.add_argument("--op", action="append", default=[], help="Operasyon ve ağırlığı, örn. get_pet=5")
+    parser.add_argument("--concurrency", type=int, default=10, help="Eşzamanlı worker sayısı")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Hedef istek/sn; verilirse açık döngü (verilmezse sabit eşzamanlılık)")
+    parser.add_argument("--arrival", choices=ARRIVALS, default="constant",
+                        help="Açık döngüde geliş takvimi: sabit aralık veya Poisson")
+    parser.add_argument("--duration", type=float, default=10.0, help="Süre (saniye)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--base-url", default=os.environ.get("PETSTORE_BASE_URL"))
+    parser.add_argument("--local", action="store_true", help="Süreç içi Petstore emülatörüne karşı çalıştır")
+    args = parser.parse_args()
+
+    server = None
+    if args.local:
+        from petstore import server as petstore_server
+        server = petstore_server.start()
+        args.base_url = server.base_url
+    if args.base_url:
+        suites.set_base_url(args.base_url)
+    generator = LoadGenerator(parse_weights(args.op) or None, args.concurrency, args.rate, args.duration, args.seed,
+                              args.arrival)
+    print_report(generator.run())
+    counts = generator.cleanup
+    print(f"Temizlik: {counts['deleted']} pet silindi, {counts['missing']} zaten yoktu, {counts['failed']} hata")
+    if server is not None:
+        server.stop()
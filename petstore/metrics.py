@@ -0,0 +1,279 @@
+import contextvars
+import csv
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+from petstore.histogram import Histogram
+
+# URL'lerde sabit kalan path parçaları; geri kalanlar parametre kabul edilir
+RESOURCES = ("pet", "store", "user")
+LITERAL_SEGMENTS = {
+    "pet", "findByStatus", "findByTags", "uploadImage",
+    "store", "order", "inventory",
+    "user", "createWithArray", "createWithList", "login", "logout",
+}
+PARAMETER_NAMES = {"user": "{username}"}
+
+FIELDS = (
+    "timestamp", "test", "method", "endpoint", "url", "status", "bytes_sent", "bytes_received",
+    "dns", "connect", "ttfb", "total", "retries", "error",
+)
+
+_hooks = []
+# Thread'ler ve asyncio task'ları ayrı context'te çalışır; eşzamanlı coroutine'lerin ölçümleri karışmaz
+_timing = contextvars.ContextVar("timing", default=None)
+_current_test = contextvars.ContextVar("current_test", default=None)
+
+
+class CallRecord:
+    """
+    Tek bir HTTP çağrısının ölçümleri. Süreler saniye cinsindendir.
+
+    Yanıt objesine referans tutmaz; yalnızca ölçülen değerler saklanır.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, **values):
+        for field in FIELDS:
+            setattr(self, field, values.get(field))
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in FIELDS}
+
+
+def endpoint_template(url):
+    """
+    URL'yi endpoint şablonuna çevirir, örn. .../v2/pet/12345 -> /pet/{id}.
+    """
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    for index, segment in enumerate(segments):
+        if segment in RESOURCES:
+            segments = segments[index:]
+            break
+    else:
+        return "/" + "/".join(segments)
+    template = [segments[0]]
+    for segment in segments[1:]:
+        template.append(segment if segment in LITERAL_SEGMENTS else PARAMETER_NAMES.get(segments[0], "{id}"))
+    return "/" + "/".join(template)
+
+
+def add_hook(hook):
+    """
+    Her HTTP çağrısından sonra CallRecord ile çağrılacak fonksiyonu ekler.
+    """
+    _hooks.append(hook)
+    return hook
+
+
+def remove_hook(hook):
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def set_current_test(name):
+    return _current_test.set(name)
+
+
+def reset_current_test(token):
+    _current_test.reset(token)
+
+
+def current_test():
+    return _current_test.get()
+
+
+def timing():
+    """
+    Bu context'te süren çağrının zamanlama sözlüğü; bağlantı katmanı dns/connect/ttfb yazar.
+    """
+    return _timing.get()
+
+
+def start_call():
+    values = {"dns": 0.0, "connect": 0.0, "ttfb": None, "retries": 0}
+    _timing.set(values)
+    return values
+
+
+def _body_length(body):
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    return getattr(body, "len", 0)
+
+
+def finish_call(method, url, response, started, error=None, body=None, stream=False):
+    """
+    Çağrı bittiğinde kaydı oluşturup hook'lara iletir. Hook yoksa hiçbir şey yapmaz.
+    """
+    values = _timing.get() or {}
+    _timing.set(None)
+    if not _hooks:
+        return
+    total = time.perf_counter() - started
+    received = 0
+    if response is not None:
+        if stream:
+            received = int(response.headers.get("Content-Length") or 0)
+        else:
+            received = len(response.content)
+        # Kasetten ve async istemciden gelen yanıtlarda gönderilen istek nesnesi yok
+        request = getattr(response, "request", None)
+        body = request.body if request is not None else body
+    record = CallRecord(
+        timestamp=time.time(),
+        test=_current_test.get(),
+        method=method.upper(),
+        endpoint=endpoint_template(url),
+        url=url,
+        status=response.status_code if response is not None else None,
+        bytes_sent=_body_length(body),
+        bytes_received=received,
+        dns=values.get("dns", 0.0),
+        connect=values.get("connect", 0.0),
+        ttfb=values.get("ttfb") if values.get("ttfb") is not None else total,
+        total=total,
+        retries=values.get("retries", 0),
+        error=error,
+    )
+    for hook in list(_hooks):
+        hook(record)
+
+
+class EndpointStats:
+    """
+    Bir endpoint'in sayaçları ve gecikme histogramı; çağrı sayısından bağımsız bellek kullanır.
+    """
+
+    __slots__ = ("latency", "errors", "statuses", "bytes_sent", "bytes_received")
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.errors = 0
+        self.statuses = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    @property
+    def count(self):
+        return self.latency.count
+
+    def add(self, latency, failed=False, status=None, bytes_sent=0, bytes_received=0):
+        self.latency.record(latency)
+        self.errors += failed
+        if status is not None:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+
+    def merge(self, other):
+        self.latency.merge(other.latency)
+        self.errors += other.errors
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        self.bytes_sent += other.bytes_sent
+        self.bytes_received += other.bytes_received
+        return self
+
+
+class EndpointAggregator:
+    """
+    CallRecord'ları saklamadan "METHOD /endpoint" bazında EndpointStats'ta toplayan hook.
+
+    Bağlantı hatası veya 5xx yanıt hata sayılır; 4xx negatif testlerin beklenen sonucudur.
+    """
+
+    def __init__(self):
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        key = f"{record.method} {record.endpoint}"
+        failed = record.error is not None or (record.status or 0) >= 500
+        with self._lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = EndpointStats()
+            stats.add(record.total, failed, record.status, record.bytes_sent, record.bytes_received)
+
+    def summary(self):
+        lines = [f"{'Endpoint':<32}{'Adet':>8}{'Hata':>6}{'p50':>9}{'p99':>9}{'max':>9}  (ms)"]
+        for key in sorted(self.endpoints):
+            stats = self.endpoints[key]
+            latency = stats.latency
+            lines.append(f"{key:<32}{stats.count:>8}{stats.errors:>6}{latency.percentile(50) * 1000:>9.1f}"
+                         f"{latency.percentile(99) * 1000:>9.1f}{latency.max * 1000:>9.1f}")
+        return "\n".join(lines)
+
+
+class ResultWriter:
+    """
+    CallRecord'ları JSON Lines (.jsonl) veya CSV (.csv) dosyasına yazan hook.
+
+    Dosya oluşturulurken sıfırlanır; process havuzundaki her process kendi
+    handle'ı ile satır satır ekleme yapar.
+
+    Args:
+        path (str): Sonuç dosyası; uzantısı formatı belirler.
+        truncate (bool): False ise mevcut dosyaya eklenir (worker process'ler için).
+    """
+
+    def __init__(self, path, truncate=True):
+        self.path = path
+        self.format = "csv" if path.endswith(".csv") else "jsonl"
+        self._lock = threading.Lock()
+        self._file = None
+        self._pid = None
+        if truncate:
+            with open(path, "w", newline="") as handle:
+                if self.format == "csv":
+                    csv.writer(handle).writerow(FIELDS)
+
+    def _handle(self):
+        if self._file is None or self._pid != os.getpid():
+            self._file = open(self.path, "a", newline="", buffering=1)
+            self._pid = os.getpid()
+        return self._file
+
+    def __call__(self, record):
+        with self._lock:
+            handle = self._handle()
+            if self.format == "csv":
+                csv.writer(handle).writerow([getattr(record, field) for field in FIELDS])
+            else:
+                handle.write(json.dumps(record.as_dict()) + "\n")
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def worker_state():
+    # Fork dışı başlatılan worker'larda aynı dosyalara yazılsın
+    return [hook.path for hook in _hooks if isinstance(hook, ResultWriter)]
+
+
+def init_worker(paths):
+    for path in paths:
+        add_hook(ResultWriter(path, truncate=False))
+
+
+def read_results(path):
+    """
+    ResultWriter ile yazılmış dosyadaki kayıtları sözlük olarak okur.
+    """
+    with open(path, newline="") as handle:
+        if path.endswith(".csv"):
+            yield from csv.DictReader(handle)
+        else:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
@@ -0,0 +1,204 @@
+import copy
+import hashlib
+import re
+
+from petstore import client, schema
+from petstore.payloads import JSON_HEADERS, dumps
+
+# Beklenen tip dışında gönderilecek örnek değerler
+WRONG_TYPE_VALUES = {
+    "string": 12345,
+    "integer": "invalid_id",
+    "number": "abc",
+    "boolean": "true",
+    "array": "invalid_list",
+    "object": "invalid_object",
+}
+EXTRA_WRONG_TYPES = {
+    "integer": (1.5, True, None),
+    "string": (True, None, ["list"]),
+    "array": ({}, None),
+    "object": ([], None),
+}
+OUT_OF_RANGE = {"int32": (2**31, -2**31 - 1), "int64": (2**63, -2**63 - 1)}
+# Swagger sunucusunun (Jackson varsayılanları) hata vermeden kabul ettiği yanlış tipler:
+# skalerler string'e çevrilir, ondalıklı sayı tamsayıya kesilir, null alan boş bırakılır
+TOLERATED_TYPES = {
+    "string": ("int", "bool", "nonetype"),
+    "integer": ("float", "nonetype"),
+    "array": ("nonetype",),
+    "object": ("nonetype",),
+}
+# Kabul edilen id mutasyonları koşu aralığı dışında pet oluşturur (1.5 -> 1, null -> sunucunun atadığı id);
+# ids.cleanup bunları silemeyeceği için üretilmez
+UNTRACKED_PATHS = (("id",),)
+METHODS = ("POST", "PUT")
+WRONG_CONTENT_TYPES = ("text/plain", "application/xml")
+
+
+class MutationCase:
+    """
+    Tek bir geçersiz isteği gönderen, runner ile çalıştırılabilen test case.
+
+    Sunucu isteği 4xx/5xx ile reddederse başarılı sayılır. tolerated caseler şemaya
+    uymasa da sunucunun kabul ettiği mutasyonlardır; 200 beklenir ve isimleri "_tolerated"
+    ile biter, raporda negatif case olarak sayılmazlar.
+    """
+
+    def __init__(self, name, method, url, body, content_type="application/json", tolerated=False):
+        self.__name__ = name
+        self.method = method
+        self.url = url
+        self.body = body
+        self.content_type = content_type
+        self.tolerated = tolerated
+
+    @property
+    def key(self):
+        # Aynı method, content-type ve gövdeye sahip caseler tekrar gönderilmez
+        return hashlib.sha1(f"{self.method}\0{self.content_type}\0".encode() + self.body).hexdigest()
+
+    @property
+    def headers(self):
+        return JSON_HEADERS if self.content_type == "application/json" else {"Content-Type": self.content_type}
+
+    def __call__(self):
+        return self._check(client.request(self.method, self.url, data=self.body, headers=self.headers))
+
+    async def acall(self):
+        # Async modda thread yerine event loop'ta, paylaşılan AsyncClient üzerinden gönderilir
+        from petstore import aio
+        return self._check(await aio.request(self.method, self.url, data=self.body, headers=self.headers))
+
+    def _check(self, response):
+        print(f"{self.__name__} Status Code: {response.status_code}")
+        if self.tolerated:
+            assert response.status_code == 200, f"Sunucunun kabul etmesi beklenen istek reddedildi ({response.status_code})"
+            print("Tolerated: server accepted the invalid request as expected")
+        else:
+            assert response.status_code >= 400, f"Geçersiz istek kabul edildi ({response.status_code})"
+        return response
+
+
+def _resolve(node):
+    while "$ref" in node:
+        node = schema.DEFINITIONS[node["$ref"]]
+    return node
+
+
+def _fields(node, path=()):
+    """
+    Şemadaki her alanı (path, şema) olarak üretir; object ve array içlerine iner.
+    """
+    node = _resolve(node)
+    yield path, node
+    if node.get("type") == "object":
+        for key, child in node.get("properties", {}).items():
+            yield from _fields(child, path + (key,))
+    elif node.get("type") == "array":
+        yield from _fields(node.get("items", {}), path + (0,))
+
+
+def _get(document, path):
+    for key in path:
+        document = document[key]
+    return document
+
+
+def _exists(document, path):
+    try:
+        _get(document, path)
+        return True
+    except (KeyError, IndexError, TypeError):
+        return False
+
+
+def _set(document, path, value):
+    result = copy.deepcopy(document)
+    if not path:
+        return value
+    _get(result, path[:-1])[path[-1]] = value
+    return result
+
+
+def _delete(document, path):
+    result = copy.deepcopy(document)
+    del _get(result, path[:-1])[path[-1]]
+    return result
+
+
+def _field_mutations(pet, pet_schema):
+    # (mutasyon ismi, path, geçersiz pet, sunucu kabul eder mi) üretir
+    for path, node in _fields(pet_schema):
+        if not path or not _exists(pet, path):
+            continue
+        kind = node.get("type")
+        for value in (WRONG_TYPE_VALUES.get(kind),) + EXTRA_WRONG_TYPES.get(kind, ()):
+            value_type = type(value).__name__.lower()
+            tolerated = value_type in TOLERATED_TYPES.get(kind, ())
+            if tolerated and path in UNTRACKED_PATHS:
+                continue
+            yield f"wrong_type_{value_type}", path, _set(pet, path, value), tolerated
+        for value in OUT_OF_RANGE.get(node.get("format"), ()):
+            yield f"out_of_range_{'high' if value > 0 else 'low'}", path, _set(pet, path, value), False
+        if "enum" in node:
+            yield "bad_enum", path, _set(pet, path, "invalid_" + path[-1]), True
+            yield "empty_enum", path, _set(pet, path, ""), True
+
+    for path, node in _fields(pet_schema):
+        if node.get("type") != "object":
+            continue
+        for key in node.get("required", ()):
+            field_path = path + (key,)
+            if _exists(pet, field_path):
+                yield "missing_required", field_path, _delete(pet, field_path), True
+
+
+def _case_name(method, path, mutation, tolerated=False):
+    field = "_".join(str(part) for part in path) or "body"
+    name = f"{method.lower()}_pet_{field}_{mutation}" + ("_tolerated" if tolerated else "")
+    return re.sub(r"\W", "_", name)
+
+
+def generate_cases(base_url, pets, pet_schema=None, methods=METHODS):
+    """
+    Geçerli petlerden ve şemadan negatif test matrisini üretir.
+
+    Her alan için yanlış tipler, aralık dışı id'ler ve geçersiz enum'lar;
+    her zorunlu alan için eksik alan; gövde için bozuk JSON ve yanlış content-type
+    caseleri oluşturulur. Aynı isteği gönderen caseler tekilleştirilir.
+
+    Swagger sunucusu enum ve zorunlu alanları kontrol etmez, skalerleri string'e
+    çevirir ve null alanları kabul eder; bu caseler tolerated olarak 200 bekler.
+    Kabul edilen id mutasyonları koşu dışı pet bırakacağı için üretilmez (UNTRACKED_PATHS).
+
+    Args:
+        base_url (str): Petstore BASE_URL.
+        pets (list): Mutasyonların uygulanacağı geçerli petler.
+        pet_schema (dict): Pet şeması (varsayılan: Swagger Pet tanımı).
+        methods (tuple): Matrisin uygulanacağı method'lar (/pet için POST ve PUT).
+
+    Returns:
+        list: MutationCase listesi.
+    """
+    pet_schema = pet_schema or {"$ref": "Pet"}
+    url = f"{base_url}/pet"
+    cases = {}
+
+    def add(case):
+        cases.setdefault(case.key, case)
+
+    for pet in pets:
+        valid_body = dumps(pet)
+        for method in methods:
+            for mutation, path, invalid_pet, tolerated in _field_mutations(pet, pet_schema):
+                add(MutationCase(_case_name(method, path, mutation, tolerated), method, url, dumps(invalid_pet),
+                                 tolerated=tolerated))
+            add(MutationCase(_case_name(method, (), "trailing_comma"), method, url, valid_body[:-1] + b",}"))
+            add(MutationCase(_case_name(method, (), "truncated"), method, url, valid_body[:len(valid_body) // 2]))
+            add(MutationCase(_case_name(method, (), "single_quotes"), method, url, valid_body.replace(b'"', b"'")))
+            add(MutationCase(_case_name(method, (), "empty"), method, url, b""))
+            for content_type in WRONG_CONTENT_TYPES:
+                mutation = "content_type_" + content_type.split("/")[1]
+                add(MutationCase(_case_name(method, (), mutation), method, url, valid_body, content_type))
+    return list(cases.values())
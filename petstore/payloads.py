@@ -0,0 +1,232 @@
+import copy
+import json
+import threading
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Bir alanı payload'dan çıkarmak için override değeri olarak kullanılır
+MISSING = object()
+
+TEMPLATES = {
+    "default": {
+        "id": 12345,
+        "name": "Tommy",
+        "status": "available",
+        "category": {"id": 1, "name": "dog"},
+        "tags": [{"id": 1, "name": "friendly"}],
+    },
+    "updated": {
+        "id": 12345,
+        "name": "Tommy Updated",
+        "status": "sold",
+        "category": {"id": 1, "name": "dog"},
+        "tags": [{"id": 1, "name": "playful"}],
+    },
+    "full_update": {
+        "id": 12345,
+        "name": "Updated Pet Name",
+        "status": "available",
+        "category": {"id": 1, "name": "dog"},
+        "tags": [{"id": 1, "name": "friendly"}],
+    },
+    "doggie": {
+        "id": 12345,
+        "name": "doggie",
+        "status": "available",
+        "category": {"id": 1, "name": "dog"},
+        "tags": [{"id": 1, "name": "friendly"}],
+        "photoUrls": ["url1"],
+    },
+}
+
+# Kasıtlı olarak geçersiz petler: isim -> override'lar
+INVALID = {
+    "missing_name": {"name": MISSING},
+    "bad_id_type": {"id": "invalid_id"},
+    "bad_status": {"status": "invalid_status"},
+    "bad_category_id": {"category": {"id": "abcd", "name": "dog"}},
+}
+
+ORDER_TEMPLATES = {
+    "default": {
+        "id": 1,
+        "petId": 12345,
+        "quantity": 1,
+        "shipDate": "2024-01-01T00:00:00.000+0000",
+        "status": "placed",
+        "complete": False,
+    },
+    "delivered": {
+        "id": 1,
+        "petId": 12345,
+        "quantity": 1,
+        "shipDate": "2024-01-01T00:00:00.000+0000",
+        "status": "delivered",
+        "complete": True,
+    },
+}
+
+ORDER_INVALID = {
+    "bad_id_type": {"id": "invalid_id"},
+    "bad_pet_id_type": {"petId": "invalid_pet_id"},
+    "bad_quantity": {"quantity": "many"},
+    "bad_complete": {"complete": "yes"},
+}
+
+USER_TEMPLATES = {
+    "default": {
+        "id": 1,
+        "username": "tommy_owner",
+        "firstName": "Tommy",
+        "lastName": "Owner",
+        "email": "tommy@example.com",
+        "password": "secret",
+        "phone": "5551234567",
+        "userStatus": 1,
+    },
+    "updated": {
+        "id": 1,
+        "username": "tommy_owner",
+        "firstName": "Tommy Updated",
+        "lastName": "Owner",
+        "email": "tommy.updated@example.com",
+        "password": "new_secret",
+        "phone": "5557654321",
+        "userStatus": 2,
+    },
+}
+
+USER_INVALID = {
+    "bad_id_type": {"id": "invalid_id"},
+    "bad_user_status": {"userStatus": "active"},
+    "bad_username_type": {"username": 12345},
+}
+
+# Cache'te tutulacak en fazla gövde; yük altında her id ayrı anahtar olduğu için sınırlı
+CACHE_SIZE = 4096
+
+
+def dumps(obj):
+    """
+    Objeyi JSON byte'larına çevirir; orjson kuruluysa onu kullanır.
+
+    orjson 64 bitten büyük tamsayıları desteklemediğinden bu durumda json'a düşer.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj).encode()
+
+
+def _freeze(value):
+    # Skalerler tipleriyle birlikte saklanır; True, 1 ve 1.0 eşit hash'lendiği için aynı gövdeye düşmesin
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_freeze(item) for item in value)
+    if value is MISSING:
+        return "<missing>"
+    return type(value).__name__, value
+
+
+class PayloadFactory:
+    """
+    Template'lerden geçerli ve geçersiz payload'lar üretir, serialize edilmiş gövdeleri cache'ler.
+
+    Aynı template ve override'lar için body() her seferinde aynı bytes nesnesini döner;
+    dict oluşturma ve json.dumps yalnızca ilk çağrıda yapılır.
+
+    Args:
+        templates (dict): Template ismi -> temel payload.
+        invalid (dict): Geçersiz payload ismi -> override'lar.
+        cache_size (int): Cache'te tutulacak en fazla gövde sayısı.
+    """
+
+    def __init__(self, templates, invalid=None, cache_size=CACHE_SIZE):
+        self.templates = templates
+        self.invalid_overrides = invalid or {}
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def build(self, template="default", **overrides):
+        """
+        Template'in bir kopyasını override'ları uygulayarak döner. MISSING alanı siler.
+        """
+        pet = copy.deepcopy(self.templates[template])
+        for key, value in overrides.items():
+            if value is MISSING:
+                pet.pop(key, None)
+            else:
+                pet[key] = copy.deepcopy(value)
+        return pet
+
+    def invalid(self, kind, template="default", **overrides):
+        return self.build(template, **{**self.invalid_overrides[kind], **overrides})
+
+    def body(self, template="default", **overrides):
+        """
+        Payload'ın serialize edilmiş JSON gövdesini cache'ten döner.
+
+        Returns:
+            bytes: Doğrudan data= olarak gönderilebilecek gövde.
+        """
+        key = (template, _freeze(overrides))
+        with self._lock:
+            body = self._cache.get(key)
+            if body is not None:
+                self._cache.move_to_end(key)
+                return body
+        body = dumps(self.build(template, **overrides))
+        with self._lock:
+            self._cache[key] = body
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return body
+
+    def invalid_body(self, kind, template="default", **overrides):
+        if kind == "malformed":
+            return self.malformed_body(template, **overrides)
+        return self.body(template, **{**self.invalid_overrides[kind], **overrides})
+
+    def malformed_body(self, template="default", **overrides):
+        """
+        Sonunda fazladan virgül olan, parse edilemeyen JSON gövdesi döner.
+        """
+        valid = self.body(template, **overrides)
+        return valid[:-1].rstrip() + b",}"
+
+
+class PetFactory(PayloadFactory):
+    """
+    Pet payload'ları; varsayılan template'ler TEMPLATES, geçersiz petler INVALID.
+    """
+
+    def __init__(self, templates=None, cache_size=CACHE_SIZE):
+        super().__init__(templates or TEMPLATES, INVALID, cache_size)
+
+
+class OrderFactory(PayloadFactory):
+    """
+    /store/order sipariş payload'ları.
+    """
+
+    def __init__(self, templates=None, cache_size=CACHE_SIZE):
+        super().__init__(templates or ORDER_TEMPLATES, ORDER_INVALID, cache_size)
+
+
+class UserFactory(PayloadFactory):
+    """
+    /user kullanıcı payload'ları.
+    """
+
+    def __init__(self, templates=None, cache_size=CACHE_SIZE):
+        super().__init__(templates or USER_TEMPLATES, USER_INVALID, cache_size)
@@ -0,0 +1,278 @@
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from petstore import metrics
+
+# (connect, read) timeout'ları, saniye
+DEFAULT_TIMEOUT = (3.05, 10.0)
+ENDPOINT_TIMEOUTS = {
+    "/pet/findByStatus": (3.05, 30.0),
+    "/pet/{id}/uploadImage": (3.05, 120.0),
+}
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Host'un ayakta olmadığını gösteren yanıtlar; 500 negatif caselerde beklenen bir yanıt olduğu için sayılmaz
+UNAVAILABLE_STATUSES = frozenset({502, 503, 504})
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.25
+BACKOFF_MAX = 8.0
+
+# Art arda bu kadar bağlantı hatası/timeout/502-504 sonrası host için devre açılır
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 30.0
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """
+    Host devre kesici açıkken istek gönderilmeden fırlatılır.
+    """
+
+
+class BudgetExceededError(requests.exceptions.Timeout):
+    """
+    Koşu için ayrılan süre dolduğunda fırlatılır.
+    """
+
+
+class CircuitBreaker:
+    """
+    Host başına art arda hataları sayan devre kesici.
+
+    Eşik aşılınca cooldown süresince istekler hemen reddedilir; süre dolunca tek bir
+    deneme isteğine izin verilir (half-open). Deneme başarılı olursa devre kapanır.
+    """
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = {}
+        self._opened_at = {}
+        self._probing = set()
+        self._lock = threading.Lock()
+
+    def before_request(self, host):
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return
+            if time.monotonic() - opened_at < self.cooldown or host in self._probing:
+                raise CircuitOpenError(f"{host} için devre açık; istek gönderilmedi.")
+            self._probing.add(host)
+
+    def record(self, host, success):
+        """
+        İsteğin sonucunu işler ve half-open denemesini serbest bırakır.
+
+        Args:
+            host (str): İsteğin gittiği host.
+            success (bool): Host'un ayakta olup olmadığı; None ise sonuç sayılmaz (ör. süre bütçesi
+                doldu veya host ile ilgisiz bir hata oluştu).
+        """
+        with self._lock:
+            self._probing.discard(host)
+            if success is None:
+                return
+            if success:
+                self._failures.pop(host, None)
+                self._opened_at.pop(host, None)
+                return
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.threshold:
+                self._opened_at[host] = time.monotonic()
+
+    def is_open(self, host):
+        with self._lock:
+            return host in self._opened_at
+
+
+def _retry_after(response):
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class Policy:
+    """
+    Timeout, retry, devre kesici ve toplam süre bütçesini uygulayan katman.
+
+    Args:
+        max_retries (int): İdempotent istekler için en fazla tekrar.
+        backoff_base (float): Üstel bekleme tabanı (saniye); full jitter uygulanır.
+        backoff_max (float): Tek bir beklemenin üst sınırı.
+        breaker (CircuitBreaker): Host bazlı devre kesici.
+    """
+
+    def __init__(self, max_retries=MAX_RETRIES, backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX, breaker=None):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self.deadline = None
+
+    def set_budget(self, seconds):
+        """
+        Bu andan itibaren tüm isteklerin seconds içinde bitmesini sağlar; None sınırı kaldırır.
+        """
+        self.deadline = None if seconds is None else time.monotonic() + seconds
+
+    def _remaining(self):
+        if self.deadline is None:
+            return None
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise BudgetExceededError("Koşu için ayrılan süre doldu.")
+        return remaining
+
+    def timeout_for(self, url, timeout=None):
+        connect, read = timeout or ENDPOINT_TIMEOUTS.get(metrics.endpoint_template(url), DEFAULT_TIMEOUT)
+        remaining = self._remaining()
+        if remaining is not None:
+            connect, read = min(connect, remaining), min(read, remaining)
+        return connect, read
+
+    def _delay(self, attempt, response=None):
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        if response is not None:
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                delay = min(retry_after, self.backoff_max)
+        remaining = self._remaining()
+        if remaining is not None and delay >= remaining:
+            raise BudgetExceededError("Tekrar beklemesi koşu süresini aşıyor.")
+        return delay
+
+    @staticmethod
+    def _retried(attempt):
+        timing = metrics.timing()
+        if timing is not None:
+            # ttfb son denemenin yanıtından ölçülsün
+            timing["retries"] = attempt
+            timing["ttfb"] = None
+
+    def _steps(self, method, url, timeout):
+        """
+        execute ve aexecute'un ortak retry döngüsü.
+
+        ("send", timeout) adımında gönderilen yanıtı alır veya istisnayı fırlatılmış olarak
+        görür; ("sleep", saniye) adımında bekletir ve sonunda yanıtı return eder.
+        """
+        host = urlsplit(url).netloc
+        retries = self.max_retries if method.upper() in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            # Bütçe dolduysa istek gönderilmez ve devre kesiciye hata yazılmaz
+            limit = self.timeout_for(url, timeout)
+            self.breaker.before_request(host)
+            success = None
+            response = None
+            try:
+                response = yield "send", limit
+                success = response.status_code not in UNAVAILABLE_STATUSES
+            except BudgetExceededError:
+                raise
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                success = False
+                if attempt >= retries:
+                    raise
+            finally:
+                # Her çıkış yolunda çağrılır; aksi halde yarım kalan half-open denemesi devreyi kilitler
+                self.breaker.record(host, success)
+            if response is None:
+                yield "sleep", self._delay(attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                    return response
+                response.close()
+                yield "sleep", self._delay(attempt, response)
+            attempt += 1
+            self._retried(attempt)
+
+    def execute(self, method, url, send, timeout=None):
+        """
+        send(timeout) çağrısını politikaya göre çalıştırır ve yanıtı döner.
+
+        Args:
+            method (str): HTTP method; yalnızca idempotent olanlar tekrar edilir.
+            url (str): İstek URL'si; timeout ve devre kesici host'u buradan belirlenir.
+            send (callable): Verilen timeout ile isteği gönderen fonksiyon.
+            timeout (tuple): Çağıranın verdiği (connect, read) timeout'u.
+        """
+        steps = self._steps(method, url, timeout)
+        try:
+            kind, value = next(steps)
+            while True:
+                if kind == "sleep":
+                    time.sleep(value)
+                    kind, value = steps.send(None)
+                    continue
+                try:
+                    response = send(value)
+                except Exception as e:
+                    kind, value = steps.throw(e)
+                else:
+                    kind, value = steps.send(response)
+        except StopIteration as stop:
+            return stop.value
+
+    async def aexecute(self, method, url, send, timeout=None):
+        """
+        execute'un coroutine karşılığı; send(timeout) awaitable döner, beklemeler event loop'u bloklamaz.
+        """
+        steps = self._steps(method, url, timeout)
+        try:
+            kind, value = next(steps)
+            while True:
+                if kind == "sleep":
+                    await asyncio.sleep(value)
+                    kind, value = steps.send(None)
+                    continue
+                try:
+                    response = await send(value)
+                except Exception as e:
+                    kind, value = steps.throw(e)
+                else:
+                    kind, value = steps.send(response)
+        except StopIteration as stop:
+            return stop.value
+
+
+default_policy = Policy()
+
+
+def configure(**settings):
+    """
+    Varsayılan politikanın ayarlarını değiştirir (max_retries, backoff_base, backoff_max).
+    """
+    for name, value in settings.items():
+        setattr(default_policy, name, value)
+
+
+def set_budget(seconds):
+    default_policy.set_budget(seconds)
+
+
+def worker_state():
+    # monotonic saat sistem genelinde ortak; deadline worker process'lerde de geçerli
+    policy = default_policy
+    return policy.max_retries, policy.backoff_base, policy.backoff_max, policy.deadline
+
+
+def init_worker(state):
+    policy = default_policy
+    policy.max_retries, policy.backoff_base, policy.backoff_max, policy.deadline = state
@@ -0,0 +1,221 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+
+from petstore import metrics
+
+# Bu status kodları sunucunun yük altında olduğunu gösterir
+OVERLOAD_STATUSES = frozenset({429, 502, 503, 504})
+# Gecikme endpoint'in en iyi gecikmesinin bu katını aşarsa eşzamanlılık düşürülür
+LATENCY_TOLERANCE = 2.0
+# Çok kısa isteklerde ölçüm gürültüsü yüzünden geri çekilmemek için alt sınır (saniye)
+MIN_LATENCY_THRESHOLD = 0.05
+# Async çağrıların boş eşzamanlılık yeri için yoklama aralığı (saniye); Condition event loop'ta beklenemez
+POLL_INTERVAL = 0.005
+
+_bucket = None
+_controller = None
+
+
+class TokenBucket:
+    """
+    Saniyede rate istek, en fazla burst kadar ani istek izni veren token bucket.
+
+    Durum multiprocessing.Value'larda tutulur; process havuzu açılmadan oluşturulursa
+    tüm worker process'ler ve thread'ler aynı kovayı paylaşır.
+
+    Args:
+        rate (float): Saniyede izin verilen istek sayısı.
+        burst (int): Kovada biriktirilebilecek en fazla token.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst or max(1, int(rate)))
+        self._lock = multiprocessing.get_context("spawn").Lock()
+        self._tokens = multiprocessing.RawValue("d", self.burst)
+        self._updated = multiprocessing.RawValue("d", time.monotonic())
+
+    def acquire(self):
+        """
+        Bir token alınana kadar bekler.
+
+        Returns:
+            float: Beklenen süre (saniye).
+        """
+        waited = 0.0
+        while True:
+            delay = self._take()
+            if not delay:
+                return waited
+            # Uyku kilit dışında; bekleyen diğer çağrılar da sırası gelince token alabilir
+            time.sleep(delay)
+            waited += delay
+
+    async def aacquire(self):
+        """
+        acquire'ın coroutine karşılığı; beklerken event loop'u bloklamaz.
+        """
+        waited = 0.0
+        while True:
+            delay = self._take()
+            if not delay:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def _take(self):
+        # Token alınırsa 0, alınamazsa bir token birikene kadar beklenecek süreyi döner
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self.burst, self._tokens.value + (now - self._updated.value) * self.rate)
+            self._updated.value = now
+            if tokens >= 1:
+                self._tokens.value = tokens - 1
+                return 0.0
+            self._tokens.value = tokens
+            return (1 - tokens) / self.rate
+
+
+class AdaptiveConcurrency:
+    """
+    Uçuştaki istek sayısını AIMD ile ayarlayan kontrolcü.
+
+    Her başarılı yanıtta limit yaklaşık her "limit" yanıtta bir artar (additive increase).
+    429/502-504, bağlantı hatası veya endpoint'in en iyi gecikmesinin LATENCY_TOLERANCE
+    katını aşan bir yanıt limiti decrease oranında düşürür (multiplicative decrease).
+    Aynı yüklenme dalgası için art arda düşüş yapılmaz.
+
+    Args:
+        initial (int): Başlangıç limiti.
+        minimum (int): Limitin inebileceği en düşük değer.
+        maximum (int): Limitin çıkabileceği en yüksek değer.
+        decrease (float): Geri çekilmede limitin çarpılacağı oran.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=64, decrease=0.5):
+        self.limit = float(min(initial, maximum))
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.in_flight = 0
+        self.peak = int(self.limit)
+        self.decreases = 0
+        self._best = {}
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+            return time.monotonic()
+
+    async def aacquire(self):
+        while True:
+            with self._condition:
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return time.monotonic()
+            await asyncio.sleep(POLL_INTERVAL)
+
+    def release(self, endpoint, started, overloaded):
+        latency = time.monotonic() - started
+        with self._condition:
+            self.in_flight -= 1
+            best = self._best.get(endpoint)
+            if not overloaded and best is not None:
+                overloaded = latency > max(best * LATENCY_TOLERANCE, MIN_LATENCY_THRESHOLD)
+            if best is None or latency < best:
+                self._best[endpoint] = latency
+            if overloaded:
+                # Düşüşten önce gönderilmiş isteklerin yanıtları yeni bir düşüşe yol açmasın
+                if started >= self._last_decrease:
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+                    self._last_decrease = time.monotonic()
+                    self.decreases += 1
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                self.peak = max(self.peak, int(self.limit))
+            self._condition.notify_all()
+
+    def summary(self):
+        return (f"Eşzamanlılık: limit {int(self.limit)}, en yüksek {self.peak}, "
+                f"{self.decreases} kez geri çekildi")
+
+
+def install(rate=None, burst=None, adaptive=False, maximum=64):
+    """
+    petstore.client çağrılarına hız limiti ve/veya adaptif eşzamanlılık ekler.
+
+    Process havuzu açılmadan önce çağrılmalıdır; token bucket fork sırasında worker'lara geçer.
+
+    Args:
+        rate (float): Saniyede en fazla istek; None ise hız limiti yok.
+        burst (int): Token bucket kapasitesi.
+        adaptive (bool): AIMD eşzamanlılık kontrolünü açar.
+        maximum (int): Adaptif limitin üst sınırı.
+
+    Returns:
+        AdaptiveConcurrency: Kontrolcü (adaptive kapalıysa None).
+    """
+    global _bucket, _controller
+    _bucket = TokenBucket(rate, burst) if rate else None
+    _controller = AdaptiveConcurrency(maximum=maximum) if adaptive else None
+    return _controller
+
+
+def uninstall():
+    global _bucket, _controller
+    _bucket = _controller = None
+
+
+def worker_state():
+    # Fork dışı başlatma yöntemlerinde process havuzunun initializer'ına verilir
+    return _bucket, _controller is not None, _controller.maximum if _controller else None
+
+
+def init_worker(state):
+    global _bucket, _controller
+    _bucket, adaptive, maximum = state
+    _controller = AdaptiveConcurrency(maximum=maximum) if adaptive else None
+
+
+def call(url, send, *args, **kwargs):
+    """
+    send(*args, **kwargs) isteğini token ve eşzamanlılık izni aldıktan sonra çalıştırır.
+    """
+    if _bucket is not None:
+        _bucket.acquire()
+    controller = _controller
+    if controller is None:
+        return send(*args, **kwargs)
+    started = controller.acquire()
+    overloaded = True
+    try:
+        response = send(*args, **kwargs)
+        overloaded = response.status_code in OVERLOAD_STATUSES
+        return response
+    finally:
+        controller.release(metrics.endpoint_template(url), started, overloaded)
+
+
+async def acall(url, send, *args, **kwargs):
+    """
+    call'un coroutine karşılığı; send(*args, **kwargs) awaitable döner.
+    """
+    if _bucket is not None:
+        await _bucket.aacquire()
+    controller = _controller
+    if controller is None:
+        return await send(*args, **kwargs)
+    started = await controller.aacquire()
+    overloaded = True
+    try:
+        response = await send(*args, **kwargs)
+        overloaded = response.status_code in OVERLOAD_STATUSES
+        return response
+    finally:
+        controller.release(metrics.endpoint_template(url), started, overloaded)
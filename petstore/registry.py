@@ -0,0 +1,106 @@
+import os
+from collections import namedtuple
+from functools import partial
+
+from petstore import suites
+
+# Suite fonksiyonunun isimle tarifi; worker process'e fonksiyon objesi yerine bu gönderilir
+TestRef = namedtuple("TestRef", "suite name args kwargs")
+
+# Suite scriptinde tanımlı olmayan, üretilmiş testlerin (MutationCase) id öneki
+GENERATED_SUITE = "matrix"
+
+_SUITES_BY_FILE = {filename: name for name, filename in suites.SUITE_FILES.items()}
+_resolved = {}
+
+
+def suite_of(function):
+    """
+    Fonksiyonun tanımlandığı suite'in ismini döner; suite scripti dışındaysa None.
+
+    Script doğrudan çalıştırıldığında modül ismi "__main__" olduğu için dosya ismine bakılır.
+    """
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return None
+    return _SUITES_BY_FILE.get(os.path.basename(code.co_filename))
+
+
+def ref(test):
+    """
+    Suite fonksiyonunu veya partial'ını TestRef'e çevirir; diğer testleri (ör. MutationCase) olduğu gibi bırakır.
+    """
+    function, args, kwargs = (test.func, test.args, test.keywords) if isinstance(test, partial) else (test, (), {})
+    suite = suite_of(function)
+    if suite is None:
+        return test
+    return TestRef(suite, function.__name__, tuple(args), tuple(sorted(kwargs.items())))
+
+
+def test_id(test):
+    """
+    Testin koşudan koşuya değişmeyen id'si, örn. "positive::create_pet".
+
+    partial argümanları id'ye girmez; koşuya göre değişen pet id'leri id'yi değiştirmesin.
+    """
+    function = test.func if isinstance(test, partial) else test
+    suite = suite_of(function) or GENERATED_SUITE
+    return f"{suite}::{getattr(function, '__name__', type(function).__name__)}"
+
+
+def unit_ids(units):
+    """
+    İş birimlerindeki her test için id üretir; aynı isim tekrar ederse "#2", "#3" eklenir.
+
+    Returns:
+        list: units ile aynı yapıda id tuple'ları.
+    """
+    seen = {}
+    result = []
+    for unit in units:
+        ids = []
+        for test in unit:
+            base = test_id(test)
+            seen[base] = seen.get(base, 0) + 1
+            ids.append(base if seen[base] == 1 else f"{base}#{seen[base]}")
+        result.append(tuple(ids))
+    return result
+
+
+def collect(names=tuple(suites.SUITE_FILES), generated=False):
+    """
+    Suite'lerin get_test_cases() listelerini sırayla tek bir listede birleştirir.
+
+    Args:
+        names (tuple): Birleştirilecek suite isimleri.
+        generated (bool): get_mutation_test_cases() tanımlı suite'lerin üretilmiş caselerini de ekler.
+    """
+    test_cases = []
+    for name in names:
+        suite = suites.load(name)
+        test_cases.extend(suite.get_test_cases())
+        if generated and hasattr(suite, "get_mutation_test_cases"):
+            test_cases.extend(suite.get_mutation_test_cases())
+    return test_cases
+
+
+def compile_units(units):
+    """
+    Runner'ın iş birimlerini (test tuple'ları) process'ler arasında ucuza taşınabilecek hale getirir.
+    """
+    return [tuple(ref(test) for test in unit) for unit in units]
+
+
+def resolve(entry):
+    """
+    TestRef'i çağrılabilir teste çevirir; suite scripti bu process'te ilk kullanımda yüklenir.
+    """
+    if not isinstance(entry, TestRef):
+        return entry
+    key = (entry.suite, entry.name)
+    function = _resolved.get(key)
+    if function is None:
+        function = _resolved[key] = getattr(suites.load(entry.suite), entry.name)
+    if entry.args or entry.kwargs:
+        return partial(function, *entry.args, **dict(entry.kwargs))
+    return function
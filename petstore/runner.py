@@ -0,0 +1,343 @@
+import argparse
+import importlib
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from petstore import client, metrics, ratelimit, registry
+
+# Fork dışı başlatmada ayarları worker'lara aktarılan modüller (worker_state/init_worker)
+WORKER_MODULES = ("petstore.metrics", "petstore.ratelimit", "petstore.policy", "petstore.cassette", "petstore.ids")
+# forkserver bu modülleri bir kez yükler; worker'lar requests import'u yapılmış process'ten fork edilir
+FORKSERVER_PRELOAD = ["petstore.transport", "petstore.policy", "petstore.runner"]
+
+
+class TestGroup(tuple):
+    """
+    Birbirine bağımlı test caselerinden oluşan, sırayla çalıştırılması gereken grup.
+    """
+
+
+def group(*tests):
+    """
+    Verilen test caselerini sıralı bir grup olarak işaretler.
+
+    Args:
+        *tests: Aynı sırayla çalıştırılacak test case fonksiyonları.
+
+    Returns:
+        TestGroup: Runner'ın bölmeden tek bir işte çalıştıracağı grup.
+    """
+    return TestGroup(tests)
+
+
+def test_name(test):
+    # Eğer test bir partial ise, sarılan fonksiyonun ismini kullan
+    return test.func.__name__ if isinstance(test, partial) else test.__name__
+
+
+def run_test(test):
+    """
+    Tek bir test caseini çalıştırır ve sonucu konsola yazar.
+
+    Returns:
+        tuple: (test ismi, başarılı mı, hata mesajı veya None, süre)
+    """
+    name = test_name(test)
+    print(f"\nÇalıştırılıyor: {name}")
+    token = metrics.set_current_test(name)
+    started = time.perf_counter()
+    try:
+        test()
+        print(f"{name} başarıyla tamamlandı.")
+        return name, True, None, time.perf_counter() - started
+    except Exception as e:
+        print(f"Hata: {name} başarısız oldu. Hata: {e}")
+        return name, False, str(e), time.perf_counter() - started
+    finally:
+        metrics.reset_current_test(token)
+
+
+def run_group(tests):
+    return [run_test(test) for test in tests]
+
+
+def _run_unit(unit):
+    # Worker'a fonksiyon yerine TestRef gelir; suite scripti ilk kullanımda yüklenir
+    return run_group([registry.resolve(entry) for entry in unit])
+
+
+def _worker_state():
+    modules = {name: sys.modules[name].worker_state() for name in WORKER_MODULES if name in sys.modules}
+    return os.environ.get("PETSTORE_BASE_URL"), modules
+
+
+def _init_worker(state):
+    base_url, modules = state
+    if base_url:
+        os.environ["PETSTORE_BASE_URL"] = base_url
+    for name, value in modules.items():
+        importlib.import_module(name).init_worker(value)
+
+
+def _units(test_cases):
+    # Her grup tek bir iş, bağımsız her test ayrı bir iş olur
+    return [tuple(test) if isinstance(test, TestGroup) else (test,) for test in test_cases]
+
+
+def run_test_cases(test_cases, workers=1, mode="thread", concurrency=None, start_method=None):
+    """
+    Test caselerini çalıştırır ve sonuçları konsola yazar.
+
+    workers 1 ise testler listedeki sırayla çalışır. Daha büyük değerlerde bağımsız
+    testler thread veya process havuzunda paralel çalışır; group() ile işaretlenmiş
+    testler kendi içinde sıralı kalır.
+
+    Process modunda fork dışı başlatma yöntemlerinde worker'lara fonksiyon objeleri
+    yerine TestRef'ler gönderilir; forkserver worker'ları requests'i önceden yüklemiş
+    process'ten kopyalandığı için her worker'ın başlaması milisaniyeler sürer.
+
+    Args:
+        test_cases (list): Çalıştırılacak test case fonksiyonları ve gruplar.
+        workers (int): Aynı anda çalışacak iş sayısı.
+        mode (str): "thread", "process" veya "async".
+        concurrency (int): Async modda aynı anda çalışacak test sayısı.
+        start_method (str): Process modunda "fork", "forkserver" veya "spawn" (varsayılan: platformunki).
+
+    Returns:
+        list: Her test için (test ismi, başarılı mı, hata mesajı, süre) listesi.
+    """
+    if mode == "async":
+        from petstore import aio
+        return aio.run_test_cases(test_cases, concurrency or aio.DEFAULT_CONCURRENCY)
+
+    units = _units(test_cases)
+    if workers <= 1:
+        return [result for unit in units for result in run_group(unit)]
+
+    if mode == "process":
+        context = multiprocessing.get_context(start_method)
+        if context.get_start_method() == "fork":
+            # Ayarlar ve suite modülü fork ile miras alınır; tembel oluşturulan paylaşılan
+            # kilitler worker'lardan önce oluşsun diye durum yine toplanır
+            _worker_state()
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        else:
+            if context.get_start_method() == "forkserver":
+                context.set_forkserver_preload(FORKSERVER_PRELOAD)
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                           initializer=_init_worker, initargs=(_worker_state(),))
+            units = registry.compile_units(units)
+        with executor:
+            return [result for unit_results in executor.map(_run_unit, units) for result in unit_results]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map sonuçları giriş sırasıyla döner, rapor deterministik kalır
+        return [result for unit_results in executor.map(run_group, units) for result in unit_results]
+
+
+def print_summary(results, elapsed):
+    failed = [name for name, passed, *_ in results if not passed]
+    print(f"\n{len(results)} test, {len(failed)} başarısız, süre: {elapsed:.2f} sn")
+    for name in failed:
+        print(f"  Başarısız: {name}")
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="PetStore test caselerini çalıştırır.")
+    parser.add_argument("--workers", type=int, default=1, help="Paralel iş sayısı (varsayılan: 1, sıralı)")
+    parser.add_argument("--mode", choices=["thread", "process", "async"], default="thread", help="Paralel çalışma havuzu")
+    parser.add_argument("--start-method", choices=["fork", "forkserver", "spawn"], default=None,
+                        help="Process modunda worker başlatma yöntemi")
+    parser.add_argument("--base-url", default=None, help="Suite'in BASE_URL değerini değiştirir")
+    parser.add_argument("--local", action="store_true", help="Testleri süreç içi Petstore emülatörüne karşı çalıştırır")
+    parser.add_argument("--results", default=None, help="HTTP çağrı ölçümlerinin yazılacağı .jsonl veya .csv dosyası")
+    parser.add_argument("--latency", action="store_true",
+                        help="Endpoint bazında gecikme yüzdeliklerini histogramla toplayıp yazdırır")
+    parser.add_argument("--validate-schema", type=float, nargs="?", const=1.0, default=None, metavar="RATE",
+                        help="Yanıtları Swagger şemasına göre kontrol eder; RATE kontrol edilecek oran (varsayılan 1.0)")
+    parser.add_argument("--budget", type=float, default=None, metavar="SECONDS",
+                        help="Koşunun en fazla süresi; dolunca kalan istekler hemen hata verir")
+    parser.add_argument("--retries", type=int, default=None, help="İdempotent istekler için en fazla tekrar sayısı")
+    parser.add_argument("--rate", type=float, default=None, metavar="RPS",
+                        help="Tüm worker'lar için saniyedeki en fazla istek sayısı")
+    parser.add_argument("--burst", type=int, default=None, help="Hız limitinde ani izin verilen istek sayısı")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Uçuştaki istek sayısını gecikme ve hata oranına göre AIMD ile ayarlar")
+    parser.add_argument("--cassette", default=None, metavar="PATH", help="İstek/yanıt kayıtlarının tutulduğu sqlite dosyası")
+    parser.add_argument("--cassette-mode", choices=["record", "replay", "verify"], default="replay",
+                        help="record: canlı çalışıp kaydeder, replay: ağa çıkmaz, verify: replay + canlı örnek kontrolü")
+    parser.add_argument("--drift-sample", type=float, default=0.1, metavar="RATE",
+                        help="verify modunda canlı sunucuyla karşılaştırılacak istek oranı")
+    parser.add_argument("--keep-data", action="store_true", help="Koşuda oluşturulan petleri sonunda silmez")
+    parser.add_argument("--shard", default=None, metavar="i/N", help="Testlerin yalnızca i. parçasını çalıştırır (1 <= i <= N)")
+    parser.add_argument("--durations", action="append", default=[], metavar="REPORT",
+                        help="Shard dağılımında kullanılacak önceki --report dosyaları (tekrarlanabilir)")
+    parser.add_argument("--report", default=None, help="Test bazlı sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--concurrency", type=int, default=None, help="Async modda eşzamanlı test sayısı")
+    return parser
+
+
+def _run_cases(args, parser, get_test_cases, get_generated_cases):
+    # Test listesini (gerekirse matris ve shard filtresiyle) çalıştırır; sonuçlar ve test id'leri döner
+    test_cases = get_test_cases()
+    if getattr(args, "matrix", False):
+        generated = get_generated_cases()
+        # tolerated caseler sunucunun kabul ettiği geçersiz isteklerdir; negatif case olarak sayılmaz
+        tolerated = sum(getattr(case, "tolerated", False) for case in generated)
+        print(f"Üretilen negatif case sayısı: {len(generated) - tolerated}, "
+              f"sunucunun kabul ettiği (tolerated, 200 beklenir): {tolerated}")
+        test_cases = test_cases + generated
+    units = _units(test_cases)
+    unit_ids = registry.unit_ids(units)
+    if args.shard:
+        from petstore import shard
+        try:
+            index, count = shard.parse(args.shard)
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+        selected = shard.select(unit_ids, index, count, shard.load_durations(args.durations))
+        units, unit_ids = [units[i] for i in selected], [unit_ids[i] for i in selected]
+        test_cases = [TestGroup(unit) if len(unit) > 1 else unit[0] for unit in units]
+        print(f"Shard {args.shard}: {sum(map(len, units))} test")
+    results = run_test_cases(test_cases, workers=args.workers, mode=args.mode, concurrency=args.concurrency,
+                             start_method=args.start_method)
+    return results, unit_ids
+
+
+def main(get_test_cases, argv=None, get_generated_cases=None, get_workflow=None):
+    """
+    Suite scriptlerinin ortak giriş noktası.
+
+    Args:
+        get_test_cases (callable): Test case listesini dönen fonksiyon.
+        argv (list): Komut satırı argümanları (varsayılan: sys.argv).
+        get_generated_cases (callable): --matrix verildiğinde eklenecek üretilmiş caseleri dönen fonksiyon.
+        get_workflow (callable): --workflow verildiğinde test listesi yerine çalıştırılacak Workflow'u dönen fonksiyon.
+    """
+    parser = build_arg_parser()
+    if get_generated_cases is not None:
+        parser.add_argument("--matrix", action="store_true", help="Şemadan üretilen negatif test matrisini de çalıştırır")
+    if get_workflow is not None:
+        parser.add_argument("--workflow", action="store_true",
+                            help="Testleri kaynak bağımlılık grafiğine göre paralel çalıştırır ve kritik yolu yazar")
+    args = parser.parse_args(argv)
+    if getattr(args, "workflow", False) and (args.mode != "thread" or args.shard):
+        parser.error("--workflow yalnızca thread modunda ve --shard olmadan kullanılabilir")
+    if args.mode == "async":
+        from petstore import aio
+        # Backend yoksa coroutine caseler ImportError ile başarısız olur; koşu başlamadan durdurulur.
+        # Kaset replay'i ağa çıkmadığı için backend gerektirmez
+        if not aio.available() and not (args.cassette and args.cassette_mode == "replay"):
+            parser.error("--mode async için httpx veya aiohttp kurulu olmalı (pip install httpx)")
+    suite = sys.modules[get_test_cases.__module__]
+    server = controller = recorder = writer = aggregator = validator = None
+    cleaned = False
+    try:
+        if args.local:
+            from petstore import server as petstore_server
+            server = petstore_server.start()
+            suite.BASE_URL = server.base_url
+        elif args.base_url:
+            suite.BASE_URL = args.base_url
+        # Suite'i sonradan yükleyen worker process'ler de aynı adrese gitsin
+        os.environ["PETSTORE_BASE_URL"] = suite.BASE_URL
+        # Her worker'ın ve testlerin çağırdığı bulk yardımcılarının beklemeden bağlantı alabileceği
+        # büyüklükte havuz; koşu sırasında yeniden boyutlanmaz
+        from petstore import bulk
+        client.configure(pool_maxsize=max(args.workers, bulk.DEFAULT_WORKERS, client.POOL_MAXSIZE))
+        if args.retries is not None or args.budget is not None:
+            # policy requests'i de yükler; yalnızca ayar verildiğinde burada import edilir
+            from petstore import policy
+            if args.retries is not None:
+                policy.configure(max_retries=args.retries)
+            policy.set_budget(args.budget)
+        if args.mode == "async":
+            from petstore import aio
+            parallel = args.concurrency or aio.DEFAULT_CONCURRENCY
+        else:
+            parallel = args.workers
+        controller = ratelimit.install(args.rate, args.burst, args.adaptive, maximum=max(parallel, 2))
+        if args.cassette:
+            from petstore import cassette
+            recorder = cassette.install(args.cassette, args.cassette_mode, args.drift_sample)
+        print("Testler Başlatılıyor...\n")
+        writer = metrics.add_hook(metrics.ResultWriter(args.results)) if args.results else None
+        aggregator = metrics.add_hook(metrics.EndpointAggregator()) if args.latency else None
+        if args.validate_schema is not None:
+            from petstore import schema
+            validator = schema.install(args.validate_schema)
+        start = time.perf_counter()
+        if getattr(args, "workflow", False):
+            from petstore import workflow
+            flow = get_workflow()
+            unit_ids = registry.unit_ids([(current.test,) for current in flow.steps])
+            results = workflow.run(flow, args.workers)
+            elapsed = time.perf_counter() - start
+            print_summary(results, elapsed)
+            workflow.print_critical_path(flow, results, elapsed)
+        else:
+            results, unit_ids = _run_cases(args, parser, get_test_cases, get_generated_cases)
+            elapsed = time.perf_counter() - start
+            print_summary(results, elapsed)
+        if args.report:
+            from petstore import shard
+            shard.write_report(args.report, [test_id for ids in unit_ids for test_id in ids], results, elapsed,
+                               args.shard)
+            print(f"Test raporu: {args.report}")
+        if args.mode != "process":
+            stats = client.connection_stats()
+            print(f"Bağlantılar: {stats['opened']} açıldı, {stats['reused']} yeniden kullanıldı")
+        # Temizlik istekleri testlerin gecikmelerine karışmasın
+        if aggregator is not None:
+            metrics.remove_hook(aggregator)
+            if args.mode != "process":
+                print(aggregator.summary())
+        # Temizlik DELETE'leri kasete kaydedilmez; replay'de karşılığı olmayan kayıt bırakırlar
+        if recorder is not None:
+            cassette.uninstall()
+        cleaned = True
+        _cleanup(args, suite, recorder)
+        if controller is not None and args.mode != "process":
+            print(controller.summary())
+        if recorder is not None and args.mode != "process":
+            print(recorder.summary())
+        # Process modunda yanıtlar worker'larda okunur; buradaki sayaçlar boş kalır
+        if validator is not None and args.mode != "process":
+            print(validator.summary())
+        if writer is not None:
+            print(f"Çağrı ölçümleri: {args.results}")
+        print("\nTüm testler tamamlandı.")
+        return results
+    finally:
+        # Koşu yarıda kesilse de veri silinir, hook'lar ve kaset kaldırılır, emülatör kapanır
+        if recorder is not None:
+            cassette.uninstall()
+        if not cleaned:
+            try:
+                _cleanup(args, suite, recorder)
+            except Exception as e:
+                print(f"Temizlik başarısız oldu: {e}")
+        ratelimit.uninstall()
+        for hook in (aggregator, writer):
+            if hook is not None:
+                metrics.remove_hook(hook)
+        if writer is not None:
+            writer.close()
+        if validator is not None:
+            client.remove_response_hook(validator)
+        if server is not None:
+            server.stop()
+
+
+def _cleanup(args, suite, recorder):
+    # replay ve verify modunda sunucuya yazan istek gitmez (verify yalnızca okuma isteklerini
+    # canlı kontrol eder); temizlenecek bir şey yoktur
+    if "petstore.ids" not in sys.modules or args.keep_data or (recorder is not None and recorder.mode != "record"):
+        return
+    from petstore import ids
+    counts = ids.cleanup(suite.BASE_URL)
+    print(f"Temizlik: {counts['deleted']} pet silindi, {counts['missing']} zaten yoktu, {counts['failed']} hata")
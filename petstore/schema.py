@@ -0,0 +1,298 @@
+import random
+import threading
+
+from petstore import client, metrics
+
+# Petstore v2 Swagger tanımları (definitions)
+DEFINITIONS = {
+    "Category": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "format": "int64"},
+            "name": {"type": "string"},
+        },
+    },
+    "Tag": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "format": "int64"},
+            "name": {"type": "string"},
+        },
+    },
+    "Pet": {
+        "type": "object",
+        "required": ["name", "photoUrls"],
+        "properties": {
+            "id": {"type": "integer", "format": "int64"},
+            "category": {"$ref": "Category"},
+            "name": {"type": "string"},
+            "photoUrls": {"type": "array", "items": {"type": "string"}},
+            "tags": {"type": "array", "items": {"$ref": "Tag"}},
+            "status": {"type": "string", "enum": ["available", "pending", "sold"]},
+        },
+    },
+    "Order": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "format": "int64"},
+            "petId": {"type": "integer", "format": "int64"},
+            "quantity": {"type": "integer", "format": "int32"},
+            "shipDate": {"type": "string", "format": "date-time"},
+            "status": {"type": "string", "enum": ["placed", "approved", "delivered"]},
+            "complete": {"type": "boolean"},
+        },
+    },
+    "User": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "format": "int64"},
+            "username": {"type": "string"},
+            "firstName": {"type": "string"},
+            "lastName": {"type": "string"},
+            "email": {"type": "string"},
+            "password": {"type": "string"},
+            "phone": {"type": "string"},
+            "userStatus": {"type": "integer", "format": "int32"},
+        },
+    },
+    "ApiResponse": {
+        "type": "object",
+        "properties": {
+            "code": {"type": "integer", "format": "int32"},
+            "type": {"type": "string"},
+            "message": {"type": "string"},
+        },
+    },
+}
+
+# (method, endpoint şablonu, status) -> yanıt şeması. Hata yanıtları ERROR_SCHEMA ile kontrol edilir.
+RESPONSES = {
+    ("POST", "/pet", 200): {"$ref": "Pet"},
+    ("PUT", "/pet", 200): {"$ref": "Pet"},
+    ("GET", "/pet/{id}", 200): {"$ref": "Pet"},
+    ("DELETE", "/pet/{id}", 200): {"$ref": "ApiResponse"},
+    ("GET", "/pet/findByStatus", 200): {"type": "array", "items": {"$ref": "Pet"}},
+    ("POST", "/pet/{id}/uploadImage", 200): {"$ref": "ApiResponse"},
+    ("GET", "/store/inventory", 200): {"type": "object"},
+    ("POST", "/store/order", 200): {"$ref": "Order"},
+    ("GET", "/store/order/{id}", 200): {"$ref": "Order"},
+    ("DELETE", "/store/order/{id}", 200): {"$ref": "ApiResponse"},
+    ("POST", "/user", 200): {"$ref": "ApiResponse"},
+    ("POST", "/user/createWithArray", 200): {"$ref": "ApiResponse"},
+    ("POST", "/user/createWithList", 200): {"$ref": "ApiResponse"},
+    ("GET", "/user/login", 200): {"$ref": "ApiResponse"},
+    ("GET", "/user/logout", 200): {"$ref": "ApiResponse"},
+    ("GET", "/user/{username}", 200): {"$ref": "User"},
+    ("PUT", "/user/{username}", 200): {"$ref": "ApiResponse"},
+    ("DELETE", "/user/{username}", 200): {"$ref": "ApiResponse"},
+}
+ERROR_SCHEMA = {"$ref": "ApiResponse"}
+
+INTEGER_RANGES = {"int32": (-2**31, 2**31 - 1), "int64": (-2**63, 2**63 - 1)}
+# Sonuç özetinde tutulacak en fazla ihlal örneği
+MAX_VIOLATION_SAMPLES = 20
+
+
+def compile_schema(schema, definitions=DEFINITIONS, _compiled=None):
+    """
+    Şemayı, değeri kontrol edip hata mesajlarını listeye ekleyen bir fonksiyona derler.
+
+    Şema her çağrıda yorumlanmaz; tip kontrolleri, required alanlar ve enum'lar
+    derleme sırasında closure'lara gömülür.
+
+    Returns:
+        callable: check(value, path, errors)
+    """
+    compiled = {} if _compiled is None else _compiled
+
+    if "$ref" in schema:
+        name = schema["$ref"]
+        if name not in compiled:
+            compiled[name] = compile_schema(definitions[name], definitions, compiled)
+        return compiled[name]
+
+    kind = schema.get("type")
+    checks = []
+
+    if kind == "object":
+        required = tuple(schema.get("required", ()))
+        properties = tuple(
+            (key, compile_schema(value, definitions, compiled)) for key, value in schema.get("properties", {}).items()
+        )
+
+        def check_object(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append(f"{path}: object bekleniyordu, {type(value).__name__} geldi")
+                return
+            for key in required:
+                if key not in value:
+                    errors.append(f"{path}.{key}: zorunlu alan eksik")
+            for key, check in properties:
+                if key in value:
+                    check(value[key], f"{path}.{key}", errors)
+        checks.append(check_object)
+    elif kind == "array":
+        check_item = compile_schema(schema.get("items", {}), definitions, compiled)
+
+        def check_array(value, path, errors):
+            if not isinstance(value, list):
+                errors.append(f"{path}: array bekleniyordu, {type(value).__name__} geldi")
+                return
+            for index, item in enumerate(value):
+                check_item(item, f"{path}[{index}]", errors)
+        checks.append(check_array)
+    elif kind == "integer":
+        low, high = INTEGER_RANGES.get(schema.get("format"), (None, None))
+
+        def check_integer(value, path, errors):
+            if not isinstance(value, int) or isinstance(value, bool):
+                errors.append(f"{path}: integer bekleniyordu, {type(value).__name__} geldi")
+            elif low is not None and not low <= value <= high:
+                errors.append(f"{path}: {schema['format']} aralığı dışında")
+        checks.append(check_integer)
+    elif kind == "string":
+        def check_string(value, path, errors):
+            if not isinstance(value, str):
+                errors.append(f"{path}: string bekleniyordu, {type(value).__name__} geldi")
+        checks.append(check_string)
+    elif kind == "boolean":
+        def check_boolean(value, path, errors):
+            if not isinstance(value, bool):
+                errors.append(f"{path}: boolean bekleniyordu, {type(value).__name__} geldi")
+        checks.append(check_boolean)
+
+    if "enum" in schema:
+        allowed = frozenset(schema["enum"])
+
+        def check_enum(value, path, errors):
+            if isinstance(value, str) and value not in allowed:
+                errors.append(f"{path}: izin verilmeyen değer {value!r}")
+        checks.append(check_enum)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value, path, errors):
+        for check in checks:
+            check(value, path, errors)
+    return check_all
+
+
+# Modül yüklenirken bir kez derlenir; aynı tanımı kullanan endpointler aynı fonksiyonu paylaşır
+_definitions = {}
+VALIDATORS = {key: compile_schema(schema, _compiled=_definitions) for key, schema in RESPONSES.items()}
+ERROR_VALIDATOR = compile_schema(ERROR_SCHEMA, _compiled=_definitions)
+# Akış olarak okunan dizi yanıtlarında elemanlar tek tek kontrol edilir
+ITEM_VALIDATORS = {
+    key: compile_schema(schema["items"], _compiled=_definitions)
+    for key, schema in RESPONSES.items() if schema.get("type") == "array"
+}
+
+
+def validator_for(method, endpoint, status):
+    """
+    Endpoint ve status koduna ait derlenmiş doğrulayıcıyı döner; tanımsızsa None.
+    """
+    check = VALIDATORS.get((method, endpoint, status))
+    if check is None and status >= 400:
+        return ERROR_VALIDATOR
+    return check
+
+
+def validate(method, endpoint, status, body):
+    """
+    Parse edilmiş yanıt gövdesini şemaya göre kontrol eder.
+
+    Returns:
+        list: Hata mesajları; geçerliyse boş liste.
+    """
+    check = validator_for(method, endpoint, status)
+    errors = []
+    if check is not None:
+        check(body, "$", errors)
+    return errors
+
+
+class ResponseValidator:
+    """
+    petstore.client üzerinden dönen yanıtları şemaya göre kontrol eden hook.
+
+    Args:
+        sample_rate (float): Kontrol edilecek yanıt oranı (0-1); yük testlerinde düşürülür.
+    """
+
+    def __init__(self, sample_rate=1.0):
+        self.sample_rate = sample_rate
+        self.checked = 0
+        self.failed = 0
+        self.samples = []
+        self._lock = threading.Lock()
+
+    def __call__(self, method, url, response):
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        endpoint = metrics.endpoint_template(url)
+        check = validator_for(method.upper(), endpoint, response.status_code)
+        if check is None or not response.content:
+            return
+        errors = []
+        try:
+            body = response.json()
+        except ValueError:
+            errors.append("$: geçerli JSON değil")
+        else:
+            check(body, "$", errors)
+        self._record(f"{method.upper()} {endpoint} {response.status_code}", errors)
+
+    def wrap_items(self, method, url, response, items):
+        """
+        stream=True ile alınmış dizi yanıtının elemanlarını okundukça kontrol eder.
+
+        Gövde belleğe alınmadığı için __call__ yerine streaming.iter_pets tarafından
+        çağrılır. Yanıt tek kontrol sayılır; akış yarıda bırakılırsa okunan elemanlar
+        kontrol edilmiş olur.
+
+        Args:
+            items (iterator): Akıştan parse edilen dizi elemanları.
+
+        Returns:
+            iterator: Aynı elemanlar, aynı sırayla.
+        """
+        endpoint = metrics.endpoint_template(url)
+        check = ITEM_VALIDATORS.get((method.upper(), endpoint, response.status_code))
+        if check is None or self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            yield from items
+            return
+        errors = []
+        try:
+            for index, item in enumerate(items):
+                check(item, f"$[{index}]", errors)
+                yield item
+        except ValueError:
+            errors.append("$: geçerli JSON dizisi değil")
+            raise
+        finally:
+            self._record(f"{method.upper()} {endpoint} {response.status_code}", errors)
+
+    def _record(self, call, errors):
+        with self._lock:
+            self.checked += 1
+            if errors:
+                self.failed += 1
+                if len(self.samples) < MAX_VIOLATION_SAMPLES:
+                    self.samples.append((call, errors[:3]))
+
+    def summary(self):
+        lines = [f"Şema kontrolü: {self.checked} yanıt, {self.failed} ihlal"]
+        lines.extend(f"  {call}: {'; '.join(errors)}" for call, errors in self.samples)
+        return "\n".join(lines)
+
+
+def install(sample_rate=1.0):
+    """
+    Yanıt doğrulamayı tüm client çağrılarına ekler.
+
+    Returns:
+        ResponseValidator: Sayaçları ve ihlal örneklerini tutan hook.
+    """
+    return client.add_response_hook(ResponseValidator(sample_rate))
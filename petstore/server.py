@@ -0,0 +1,541 @@
+import argparse
+import json
+import math
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Petstore v2 ile aynı kök yol; BASE_URL = http://host:port/v2
+BASE_PATH = "/v2"
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+_PET_PATH = re.compile(r"^/pet/([^/]+)$")
+_UPLOAD_PATH = re.compile(r"^/pet/([^/]+)/uploadImage$")
+_FILENAME = re.compile(rb'filename="([^"]*)"')
+_ORDER_PATH = re.compile(r"^/store/order/([^/]+)$")
+_USER_PATH = re.compile(r"^/user/([^/]+)$")
+# Swagger sunucusunun /user/login yanıtında döndüğü oturum başlıkları
+LOGIN_RATE_LIMIT = 5000
+LOGIN_EXPIRES_AFTER = 3600
+
+
+class PetStore:
+    """
+    Petleri id'ye ve status'e göre indeksleyen, thread-safe bellek içi depo.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pets = {}
+        self._by_status = {}
+        self._next_id = 1
+        # Her değişiklikte artar; findByStatus yanıtlarının ETag'i
+        self.version = 0
+
+    def save(self, pet):
+        with self._lock:
+            if not pet.get("id"):
+                pet["id"] = self._next_id
+                self._next_id += 1
+            # Swagger sunucusu gibi eksik liste alanlarını boş döner
+            pet.setdefault("photoUrls", [])
+            pet.setdefault("tags", [])
+            old = self._pets.get(pet["id"])
+            if old is not None:
+                self._by_status.get(old.get("status"), set()).discard(pet["id"])
+            self._pets[pet["id"]] = pet
+            self._by_status.setdefault(pet.get("status"), set()).add(pet["id"])
+            self.version += 1
+            return pet
+
+    def get(self, pet_id):
+        return self._pets.get(pet_id)
+
+    def delete(self, pet_id):
+        with self._lock:
+            pet = self._pets.pop(pet_id, None)
+            if pet is not None:
+                self._by_status.get(pet.get("status"), set()).discard(pet_id)
+                self.version += 1
+            return pet
+
+    def find_by_status(self, statuses):
+        with self._lock:
+            return [self._pets[pet_id] for status in statuses for pet_id in self._by_status.get(status, ())]
+
+    def inventory(self):
+        with self._lock:
+            return {status: len(pet_ids) for status, pet_ids in self._by_status.items() if pet_ids and status}
+
+
+class RecordStore:
+    """
+    Siparişler ve kullanıcılar için anahtar -> kayıt tutan thread-safe bellek içi depo.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = {}
+
+    def save(self, key, record):
+        with self._lock:
+            self._records[key] = record
+            return record
+
+    def save_all(self, items):
+        with self._lock:
+            self._records.update(items)
+
+    def get(self, key):
+        return self._records.get(key)
+
+    def delete(self, key):
+        with self._lock:
+            return self._records.pop(key, None)
+
+
+def _api_response(code, message, type_="unknown"):
+    return {"code": code, "type": type_, "message": message}
+
+
+def _is_int64(value):
+    return isinstance(value, int) and not isinstance(value, bool) and -2**63 <= value < 2**63
+
+
+class _Invalid(ValueError):
+    pass
+
+
+def _long(value):
+    # Jackson varsayılanları: ondalıklı sayı kesilir; string, boolean ve aralık dışı değer reddedilir
+    if isinstance(value, float) and math.isfinite(value):
+        value = int(value)
+    if value is not None and not _is_int64(value):
+        raise _Invalid(value)
+    return value
+
+
+def _string(value):
+    # Skalerler string'e çevrilir; dizi ve nesne reddedilir
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if value is not None and not isinstance(value, str):
+        raise _Invalid(value)
+    return value
+
+
+def _array(read):
+    def read_array(value):
+        if value is None:
+            return None
+        if not isinstance(value, list):
+            raise _Invalid(value)
+        return [read(item) for item in value]
+    return read_array
+
+
+def _object(fields):
+    def read_object(value):
+        if value is None:
+            return None
+        if not isinstance(value, dict):
+            raise _Invalid(value)
+        # null alanlar Swagger yanıtlarında olduğu gibi atlanır
+        result = {key: fields[key](item) if key in fields else item for key, item in value.items()}
+        return {key: item for key, item in result.items() if item is not None}
+    return read_object
+
+
+_read_category = _object({"id": _long, "name": _string})
+_read_pet_fields = _object({
+    "id": _long,
+    "category": _read_category,
+    "name": _string,
+    "photoUrls": _array(_string),
+    "tags": _array(_read_category),
+    "status": _string,
+})
+
+
+def _read_pet(pet):
+    """
+    Gövdeyi Swagger sunucusunun (Jackson) Pet modeline okuduğu gibi okur.
+
+    Tip uyumsuzlukları 500 ile reddedilir; skalerden string'e ve ondalıktan tamsayıya
+    dönüşümler, null alanlar, eksik zorunlu alanlar ve enum dışı status kabul edilir.
+
+    Returns:
+        dict: Dönüştürülmüş pet; gövde Pet olarak okunamıyorsa None.
+    """
+    if not isinstance(pet, dict):
+        return None
+    try:
+        return _read_pet_fields(pet)
+    except _Invalid:
+        return None
+
+
+def _is_int32(value):
+    return isinstance(value, int) and not isinstance(value, bool) and -2**31 <= value < 2**31
+
+
+def _valid_order(order):
+    if not isinstance(order, dict):
+        return False
+    if not all(_is_int64(order.get(key, 0)) for key in ("id", "petId")):
+        return False
+    if not _is_int32(order.get("quantity", 0)):
+        return False
+    if any(key in order and not isinstance(order[key], str) for key in ("shipDate", "status")):
+        return False
+    return "complete" not in order or isinstance(order["complete"], bool)
+
+
+def _valid_user(user):
+    if not isinstance(user, dict):
+        return False
+    if not _is_int64(user.get("id", 0)) or not _is_int32(user.get("userStatus", 0)):
+        return False
+    fields = ("username", "firstName", "lastName", "email", "password", "phone")
+    return not any(key in user and not isinstance(user[key], str) for key in fields)
+
+
+class PetstoreHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "PetstoreEmulator/1.0"
+    # Başlık ve gövde ayrı yazıldığından Nagle + delayed ACK her yanıta ~40 ms ekler
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def store(self):
+        return self.server.store
+
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status, payload=None, headers=None):
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self, method):
+        parts = urlsplit(self.path)
+        if not parts.path.startswith(BASE_PATH):
+            return self._send(404, _api_response(404, "HTTP 404 Not Found"))
+        path = parts.path[len(BASE_PATH):]
+        match = _UPLOAD_PATH.match(path)
+        if match and method == "POST":
+            return self._upload_image(match.group(1))
+        body = self._read_body()
+
+        if path == "/pet":
+            if method in ("POST", "PUT"):
+                return self._save_pet(body)
+            return self._send(405, _api_response(405, "HTTP 405 Method Not Allowed"))
+        if path == "/pet/findByStatus" and method == "GET":
+            return self._find_by_status(parts.query)
+        match = _PET_PATH.match(path)
+        if match and method in ("GET", "DELETE"):
+            return self._pet_by_id(method, match.group(1))
+        if path in ("/pet/", "/pet/findByStatus", "/pet/uploadImage") or match:
+            return self._send(405, _api_response(405, "HTTP 405 Method Not Allowed"))
+        if path.startswith("/store/"):
+            return self._route_store(method, path, body)
+        if path == "/user" or path.startswith("/user/"):
+            return self._route_user(method, path, parts.query, body)
+        return self._send(404, _api_response(404, "HTTP 404 Not Found"))
+
+    def _json_body(self, body, validate):
+        # (kayıt, None) veya (None, hata yanıtı gönderen fonksiyon) döner
+        if "json" not in self.headers.get("Content-Type", ""):
+            return None, lambda: self._send(415, _api_response(415, "HTTP 415 Unsupported Media Type"))
+        try:
+            record = json.loads(body)
+        except ValueError:
+            return None, lambda: self._send(400, _api_response(400, "bad input"))
+        if not validate(record):
+            return None, lambda: self._send(500, _api_response(500, "something bad happened"))
+        return record, None
+
+    def _route_store(self, method, path, body):
+        if path == "/store/inventory":
+            if method != "GET":
+                return self._send(405, _api_response(405, "HTTP 405 Method Not Allowed"))
+            return self._send(200, self.store.inventory())
+        if path == "/store/order":
+            if method != "POST":
+                return self._send(405, _api_response(405, "HTTP 405 Method Not Allowed"))
+            order, error = self._json_body(body, _valid_order)
+            if error:
+                return error()
+            order.setdefault("id", 0)
+            return self._send(200, self.server.orders.save(order["id"], order))
+        match = _ORDER_PATH.match(path)
+        if not match:
+            return self._send(404, _api_response(404, "HTTP 404 Not Found"))
+        if method not in ("GET", "DELETE"):
+            return self._send(405, _api_response(405, "HTTP 405 Method Not Allowed"))
+        raw_id = match.group(1)
+        try:
+            order_id = int(raw_id)
+        except ValueError:
+            return self._send(404, _api_response(404, f'java.lang.NumberFormatException: For input string: "{raw_id}"'))
+        if method == "GET":
+            order = self.server.orders.get(order_id)
+            if order is None:
+                return self._send(404, _api_response(1, "Order not found", "error"))
+            return self._send(200, order)
+        if self.server.orders.delete(order_id) is None:
+            return self._send(404, _api_response(404, "Order Not Found"))
+        return self._send(200, _api_response(200, str(order_id)))
+
+    def _route_user(self, method, path, query, body):
+        users = self.server.users
+        if path == "/user" and method == "POST":
+            user, error = self._json_body(body, _valid_user)
+            if error:
+                return error()
+            users.save(user.get("username"), user)
+            return self._send(200, _api_response(200, str(user.get("id", 0))))
+        if path in ("/user/createWithArray", "/user/createWithList") and method == "POST":
+            batch, error = self._json_body(body, lambda value: isinstance(value, list) and all(map(_valid_user, value)))
+            if error:
+                return error()
+            users.save_all((user.get("username"), user) for user in batch)
+            return self._send(200, _api_response(200, "ok"))
+        if path == "/user/login" and method == "GET":
+            session = int(time.time() * 1000)
+            expires = time.strftime("%a %b %d %H:%M:%S UTC %Y", time.gmtime(time.time() + LOGIN_EXPIRES_AFTER))
+            headers = {"X-Rate-Limit": str(LOGIN_RATE_LIMIT), "X-Expires-After": expires}
+            return self._send(200, _api_response(200, f"logged in user session:{session}"), headers)
+        if path == "/user/logout" and method == "GET":
+            return self._send(200, _api_response(200, "ok"))
+        match = _USER_PATH.match(path)
+        if not match or match.group(1) in ("createWithArray", "createWithList", "login", "logout") \
+                or method not in ("GET", "PUT", "DELETE"):
+            return self._send(405, _api_response(405, "HTTP 405 Method Not Allowed"))
+        username = match.group(1)
+        if method == "GET":
+            user = users.get(username)
+            if user is None:
+                return self._send(404, _api_response(1, "User not found", "error"))
+            return self._send(200, user)
+        if method == "PUT":
+            user, error = self._json_body(body, _valid_user)
+            if error:
+                return error()
+            # Swagger sunucusu gibi kullanıcı yoksa oluşturur
+            users.save(username, user)
+            return self._send(200, _api_response(200, str(user.get("id", 0))))
+        if users.delete(username) is None:
+            return self._send(404)
+        return self._send(200, _api_response(200, username))
+
+    def _save_pet(self, body):
+        if "json" not in self.headers.get("Content-Type", ""):
+            return self._send(415, _api_response(415, "HTTP 415 Unsupported Media Type"))
+        try:
+            pet = json.loads(body)
+        except ValueError:
+            return self._send(400, _api_response(400, "bad input"))
+        pet = _read_pet(pet)
+        if pet is None:
+            return self._send(500, _api_response(500, "something bad happened"))
+        return self._send(200, self.store.save(pet))
+
+    def _find_by_status(self, query):
+        statuses = [status for value in parse_qs(query).get("status", []) for status in value.split(",")]
+        etag = f'"{self.store.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, headers={"ETag": etag})
+        return self._send(200, self.store.find_by_status(statuses), {"ETag": etag})
+
+    def _pet_by_id(self, method, raw_id):
+        try:
+            pet_id = int(raw_id)
+        except ValueError:
+            return self._send(404, _api_response(404, f'java.lang.NumberFormatException: For input string: "{raw_id}"'))
+        if method == "GET":
+            pet = self.store.get(pet_id)
+            if pet is None:
+                return self._send(404, _api_response(1, "Pet not found", "error"))
+            return self._send(200, pet)
+        if self.store.delete(pet_id) is None:
+            return self._send(404)
+        return self._send(200, _api_response(200, str(pet_id)))
+
+    def _drain_body(self):
+        # Büyük upload'lar belleğe alınmadan parça parça okunur; ilk parça filename için saklanır
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            body = self._read_body()
+            return body[:UPLOAD_CHUNK_SIZE], len(body)
+        remaining = int(self.headers.get("Content-Length") or 0)
+        first = self.rfile.read(min(remaining, UPLOAD_CHUNK_SIZE))
+        total = len(first)
+        remaining -= total
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, UPLOAD_CHUNK_SIZE))
+            if not chunk:
+                break
+            total += len(chunk)
+            remaining -= len(chunk)
+        return first, total
+
+    def _upload_image(self, raw_id):
+        head, size = self._drain_body()
+        if not self.headers.get("Content-Type", "").startswith("multipart/form-data"):
+            return self._send(415, _api_response(415, "HTTP 415 Unsupported Media Type"))
+        try:
+            int(raw_id)
+        except ValueError:
+            return self._send(404, _api_response(404, f'java.lang.NumberFormatException: For input string: "{raw_id}"'))
+        match = _FILENAME.search(head)
+        filename = match.group(1).decode(errors="replace") if match else "file"
+        message = f"additionalMetadata: null\nFile uploaded to ./{filename}, {size} bytes"
+        return self._send(200, _api_response(200, message))
+
+    def do_GET(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def do_PUT(self):
+        self._route("PUT")
+
+    def do_DELETE(self):
+        self._route("DELETE")
+
+
+class PetstoreServer(ThreadingHTTPServer):
+    """
+    Testlerin kullandığı Petstore v2 pet, store ve user endpointlerini taklit eden süreç içi sunucu.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0):
+        super().__init__((host, port), PetstoreHandler)
+        self.store = PetStore()
+        self.orders = RecordStore()
+        self.users = RecordStore()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{BASE_PATH}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="petstore-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def start(host="127.0.0.1", port=0):
+    """
+    Sunucuyu arka plan thread'inde başlatır.
+
+    Returns:
+        PetstoreServer: base_url özelliği BASE_URL olarak kullanılabilir.
+    """
+    return PetstoreServer(host, port).start()
+
+
+class ServerProcess:
+    """
+    Emülatörü ayrı bir Python process'inde çalıştırır.
+
+    Sunucunun thread'leri, soketleri ve bellek ayırmaları çağıran process'in kaynak
+    ölçümlerine (ör. soak) karışmaz.
+
+    Args:
+        host (str): Dinlenecek adres.
+        port (int): Dinlenecek port; 0 ise boş bir port seçilir.
+
+    Raises:
+        RuntimeError: Process adresini yazmadan sonlanırsa.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "petstore.server", "--host", host, "--port", str(port)],
+            stdout=subprocess.PIPE, text=True, cwd=root,
+        )
+        # İlk satır "Petstore emülatörü çalışıyor: <base_url>"; sunucu dinlemeye başladıktan sonra yazılır
+        line = self._process.stdout.readline()
+        if not line:
+            self._process.wait()
+            raise RuntimeError(f"Petstore emülatörü başlatılamadı (çıkış kodu {self._process.returncode})")
+        self.base_url = line.rsplit(" ", 1)[-1].strip()
+
+    def stop(self):
+        self._process.terminate()
+        self._process.wait()
+        self._process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def start_process(host="127.0.0.1", port=0):
+    """
+    Sunucuyu ayrı bir process'te başlatır.
+
+    Returns:
+        ServerProcess: base_url özelliği BASE_URL olarak kullanılabilir.
+    """
+    return ServerProcess(host, port)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Yerel Petstore v2 emülatörü.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    server = PetstoreServer(args.host, args.port)
+    # start_process() bu satırı okuyarak adresi öğrenir; çıktı pipe'a bağlıyken de hemen yazılmalı
+    print(f"Petstore emülatörü çalışıyor: {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,141 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+
+from petstore import registry, suites
+from petstore.runner import main, print_summary
+
+# runner.main'in suite modülü gibi kullandığı adres; suite'ler PETSTORE_BASE_URL ile yüklenir
+BASE_URL = os.environ.get("PETSTORE_BASE_URL", "https://petstore.swagger.io/v2")
+# Geçmişi olmayan testlerin ağırlığı (saniye), hiç geçmiş yoksa
+DEFAULT_DURATION = 1.0
+
+
+def get_test_cases():
+    """
+    suites.SUITE_FILES'taki tüm suite'lerin (pet ve store/user, positive ve negative) birleşik test listesi.
+    """
+    return registry.collect()
+
+
+def get_generated_cases():
+    return suites.load("negative").get_mutation_test_cases()
+
+
+def parse(spec):
+    """
+    "i/N" biçimindeki shard tanımını (index, count) olarak döner; i 1'den başlar.
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Shard 'i/N' biçiminde olmalı: {spec}") from None
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"Shard indeksi 1 ile {count} arasında olmalı: {spec}")
+    return index, count
+
+
+def load_durations(paths):
+    """
+    Önceki koşuların rapor dosyalarından test id'si -> ortalama süre sözlüğü üretir.
+    """
+    samples = {}
+    for path in paths or ():
+        if not os.path.exists(path):
+            continue
+        for test in read_report(path)["tests"]:
+            samples.setdefault(test["id"], []).append(test["duration"])
+    return {test_id: sum(values) / len(values) for test_id, values in samples.items()}
+
+
+def assign(unit_ids, count, durations=None):
+    """
+    İş birimlerini geçmiş sürelere göre count shard'a dağıtır (LPT: en uzun iş en boş shard'a).
+
+    Bir grubun tüm testleri aynı birimdedir, bölünmez. Aynı id listesi ve aynı süre
+    dosyası ile her makine aynı dağılımı hesaplar.
+
+    Returns:
+        list: Her birim için shard indeksi (0'dan başlar).
+    """
+    durations = durations or {}
+    default = statistics.median(durations.values()) if durations else DEFAULT_DURATION
+    weights = [sum(durations.get(test_id, default) for test_id in ids) for ids in unit_ids]
+    loads = [0.0] * count
+    shards = [0] * len(unit_ids)
+    # Eşit ağırlıkta id sırası belirleyici; liste sırası değişse de dağılım değişmez
+    for position in sorted(range(len(unit_ids)), key=lambda i: (-weights[i], unit_ids[i])):
+        target = min(range(count), key=lambda shard: (loads[shard], shard))
+        loads[target] += weights[position]
+        shards[position] = target
+    return shards
+
+
+def select(unit_ids, index, count, durations=None):
+    """
+    index/count shard'ına düşen birimlerin konumlarını orijinal sırayla döner.
+    """
+    return [position for position, shard in enumerate(assign(unit_ids, count, durations)) if shard == index - 1]
+
+
+def write_report(path, test_ids, results, elapsed, shard=None):
+    """
+    Test bazlı sonuçları JSON olarak yazar; sonraki koşularda süre geçmişi olarak da kullanılır.
+    """
+    report = {
+        "shard": shard,
+        "elapsed": elapsed,
+        "tests": [
+            {"id": test_id, "name": name, "passed": passed, "error": error, "duration": duration}
+            for test_id, (name, passed, error, duration) in zip(test_ids, results)
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def read_report(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def merge(paths, output=None):
+    """
+    Shard rapor dosyalarını tek raporda birleştirir ve özetini yazar.
+
+    Returns:
+        dict: Birleşik rapor; elapsed en uzun shard'ın süresidir.
+    """
+    reports = [read_report(path) for path in paths]
+    tests = {}
+    for report in reports:
+        for test in report["tests"]:
+            if test["id"] in tests:
+                print(f"Uyarı: {test['id']} birden fazla shard'da çalıştı")
+            tests[test["id"]] = test
+    merged = {
+        "shard": None,
+        "elapsed": max((report["elapsed"] for report in reports), default=0.0),
+        "tests": [tests[test_id] for test_id in sorted(tests)],
+    }
+    results = [(test["id"], test["passed"], test["error"], test["duration"]) for test in merged["tests"]]
+    print(f"{len(reports)} shard birleştirildi")
+    print_summary(results, merged["elapsed"])
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(merged, f, indent=2)
+    return merged
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["merge"]:
+        parser = argparse.ArgumentParser(prog="python -m petstore.shard merge",
+                                         description="Shard rapor dosyalarını birleştirir.")
+        parser.add_argument("reports", nargs="+", help="Shard'ların --report dosyaları")
+        parser.add_argument("--output", default=None, help="Birleşik raporun yazılacağı dosya")
+        args = parser.parse_args(sys.argv[2:])
+        merged = merge(args.reports, args.output)
+        sys.exit(1 if any(not test["passed"] for test in merged["tests"]) else 0)
+    main(get_test_cases, get_generated_cases=get_generated_cases)
@@ -0,0 +1,240 @@
+import argparse
+import contextlib
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+from petstore import client, ids, registry, suites
+from petstore.runner import run_test_cases
+
+DEFAULT_DURATION = 600.0
+DEFAULT_INTERVAL = 10.0
+# İlk örnekler import, bağlantı havuzu ve cache'lerin dolmasıyla büyür; eğime katılmaz
+WARMUP_FRACTION = 0.2
+MIN_SAMPLES = 6
+# Metrik -> (mutlak tolerans, baştaki değere göre oransal tolerans)
+TOLERANCES = {
+    "rss": (16 * 1024 * 1024, 0.20),
+    "fds": (8, 0.0),
+    "sockets": (8, 0.0),
+    "traced": (8 * 1024 * 1024, 0.20),
+}
+TOP_ALLOCATORS = 10
+
+
+def _rss():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # /proc yoksa yalnızca tepe değer bilinir
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def _descriptors():
+    # (açık fd sayısı, bunlardan soket olanlar)
+    fd_dir = "/proc/self/fd" if os.path.isdir("/proc/self/fd") else "/dev/fd"
+    fds = sockets = 0
+    for name in os.listdir(fd_dir):
+        try:
+            target = os.readlink(os.path.join(fd_dir, name))
+        except OSError:
+            continue
+        fds += 1
+        sockets += target.startswith("socket:")
+    return fds, sockets
+
+
+def sample(started):
+    """
+    Process'in o anki kaynak kullanımını döner.
+    """
+    fds, sockets = _descriptors()
+    return {
+        "elapsed": time.monotonic() - started,
+        "rss": _rss(),
+        "fds": fds,
+        "sockets": sockets,
+        "traced": tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0,
+    }
+
+
+def slope(points):
+    """
+    (x, y) noktalarına en küçük kareler ile oturan doğrunun eğimi.
+    """
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def detect_leaks(samples, tolerances=TOLERANCES):
+    """
+    Warmup sonrası örneklerde sürekli büyüyen metrikleri bulur.
+
+    Bir metrik, eğimi ölçüm penceresi boyunca toleranstan fazla büyüme öngörüyorsa ve
+    son üçte birin ortalaması ilk üçte birin ortalamasını aynı toleransla aşıyorsa
+    sızıntı sayılır; tek seferlik sıçramalar (ör. cache dolması) eğimi yükseltse de
+    ikinci koşulu sağlamaz.
+
+    Returns:
+        dict: Metrik -> (pencere başındaki değer, öngörülen büyüme); yalnızca sızıntılar.
+    """
+    window = samples[int(len(samples) * WARMUP_FRACTION):]
+    if len(window) < MIN_SAMPLES:
+        return {}
+    span = window[-1]["elapsed"] - window[0]["elapsed"]
+    third = len(window) // 3
+    leaks = {}
+    for metric, (absolute, relative) in tolerances.items():
+        start = window[0][metric]
+        limit = max(absolute, start * relative)
+        growth = slope([(point["elapsed"], point[metric]) for point in window]) * span
+        first = sum(point[metric] for point in window[:third]) / third
+        last = sum(point[metric] for point in window[-third:]) / third
+        if growth > limit and last - first > limit:
+            leaks[metric] = (start, growth)
+    return leaks
+
+
+def _format(metric, value):
+    return f"{value / (1024 * 1024):.1f} MB" if metric in ("rss", "traced") else f"{value:.0f}"
+
+
+class SoakRun:
+    """
+    Birleşik suite'leri belirtilen süre boyunca döngüde çalıştırıp kaynak kullanımını izler.
+
+    Args:
+        duration (float): Toplam süre (saniye).
+        interval (float): Örnekler arası en az süre; örnek iterasyon sonunda alınır.
+        workers (int): Her iterasyonda paralel iş sayısı (thread modu).
+        generated (bool): Üretilmiş negatif matrisi de döngüye katar.
+        trace (bool): tracemalloc ile bellek ayırma yerlerini izler.
+    """
+
+    def __init__(self, duration=DEFAULT_DURATION, interval=DEFAULT_INTERVAL, workers=1, generated=False, trace=True):
+        self.duration = duration
+        self.interval = interval
+        self.workers = workers
+        self.generated = generated
+        self.trace = trace
+        self.samples = []
+        self.iterations = 0
+        self.failures = 0
+        self._first_snapshot = None
+        self._last_snapshot = None
+
+    def run(self, output=None):
+        if self.trace:
+            tracemalloc.start()
+        test_cases = registry.collect(generated=self.generated)
+        started = time.monotonic()
+        deadline = started + self.duration
+        next_sample = started
+        with contextlib.ExitStack() as stack:
+            handle = stack.enter_context(open(output, "w")) if output else None
+            devnull = stack.enter_context(open(os.devnull, "w"))
+            while time.monotonic() < deadline:
+                with contextlib.redirect_stdout(devnull):
+                    results = run_test_cases(test_cases, workers=self.workers)
+                self.iterations += 1
+                self.failures += sum(not passed for _, passed, *_ in results)
+                if time.monotonic() >= next_sample:
+                    next_sample += self.interval
+                    point = sample(started)
+                    point["iteration"] = self.iterations
+                    self.samples.append(point)
+                    if handle:
+                        handle.write(json.dumps(point) + "\n")
+                        handle.flush()
+                    self._snapshot()
+        if self.trace:
+            tracemalloc.stop()
+        return detect_leaks(self.samples)
+
+    def _snapshot(self):
+        if not tracemalloc.is_tracing():
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        # Warmup sonrası ilk örnek karşılaştırma noktasıdır
+        if self._first_snapshot is None and self.samples[-1]["elapsed"] >= self.duration * WARMUP_FRACTION:
+            self._first_snapshot = snapshot
+        self._last_snapshot = snapshot
+
+    def top_allocators(self, limit=TOP_ALLOCATORS):
+        """
+        İlk ve son tracemalloc snapshot'ı arasında en çok büyüyen ayırma yerleri.
+        """
+        if self._first_snapshot is None or self._last_snapshot is self._first_snapshot:
+            return []
+        stats = self._last_snapshot.compare_to(self._first_snapshot, "lineno")
+        return [stat for stat in stats if stat.size_diff > 0][:limit]
+
+    def report(self, leaks):
+        if not self.samples:
+            # Süre ilk iterasyon bitmeden dolduysa (ör. --duration 0) karşılaştırılacak örnek yoktur
+            print(f"\nSoak: {self.iterations} iterasyon, hiç örnek alınmadı; --duration değerini artırın")
+            return
+        first, last = self.samples[0], self.samples[-1]
+        print(f"\nSoak: {self.iterations} iterasyon, {last['elapsed']:.0f} sn, {self.failures} başarısız test")
+        print(f"{'Metrik':<10}{'Başta':>12}{'Sonda':>12}  Durum")
+        for metric in TOLERANCES:
+            status = f"SIZINTI (+{_format(metric, leaks[metric][1])})" if metric in leaks else "sabit"
+            print(f"{metric:<10}{_format(metric, first[metric]):>12}{_format(metric, last[metric]):>12}  {status}")
+        allocators = self.top_allocators()
+        if allocators:
+            print("\nEn çok büyüyen bellek ayırma yerleri:")
+            for stat in allocators:
+                print(f"  {stat.traceback[0]}: +{stat.size_diff / 1024:.1f} KiB ({stat.count_diff:+d} blok)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Suite'leri uzun süre döngüde çalıştırıp kaynak sızıntılarını arar.")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="Toplam süre (saniye)")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="Örnekleme aralığı (saniye)")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--matrix", action="store_true", help="Üretilmiş negatif matrisi de çalıştırır")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="Bellek ayırma yerlerini izlemez (daha az yük)")
+    parser.add_argument("--output", default=None, help="Örneklerin yazılacağı JSON Lines dosyası")
+    parser.add_argument("--base-url", default=os.environ.get("PETSTORE_BASE_URL"))
+    parser.add_argument("--local", action="store_true",
+                        help="Ayrı bir process'te başlatılan Petstore emülatörüne karşı çalıştır")
+    args = parser.parse_args()
+
+    server = None
+    try:
+        if args.local:
+            # Emülatör ayrı process'te çalışır; thread'leri, soketleri ve depoladığı petler ölçüme sızıntı olarak girmez
+            from petstore import server as petstore_server
+            server = petstore_server.start_process()
+            args.base_url = server.base_url
+        if args.base_url:
+            os.environ["PETSTORE_BASE_URL"] = args.base_url
+            suites.set_base_url(args.base_url)
+        client.configure(pool_maxsize=max(args.workers, client.POOL_MAXSIZE))
+        soak = SoakRun(args.duration, args.interval, args.workers, args.matrix, not args.no_tracemalloc)
+        leaks = soak.run(args.output)
+    finally:
+        try:
+            # Soak boyunca ayrılan tüm id'lerdeki petler silinir; suite'ler kullanıcılarını kendileri siler
+            counts = ids.cleanup(args.base_url or suites.load("positive").BASE_URL)
+            print(f"Temizlik: {counts['deleted']} pet silindi, {counts['missing']} zaten yoktu, {counts['failed']} hata")
+        finally:
+            if server is not None:
+                server.stop()
+    soak.report(leaks)
+    if leaks:
+        print("\nKaynak sızıntısı tespit edildi.")
+        sys.exit(1)
@@ -0,0 +1,105 @@
+import codecs
+import json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+CHUNK_SIZE = 64 * 1024
+# Konsola/loga yazılacak liste özetinin en fazla karakter sayısı
+PREVIEW_CHARS = 2000
+
+_WHITESPACE = " \t\r\n"
+# Dizideki bir skalerin bittiğini kesinleştiren karakterler
+_DELIMITERS = _WHITESPACE + ",]"
+# Parça sınırında kesilmiş bir sayının devamında gelebilecek karakterler ("1." + "5", "2e" + "3")
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+def iter_json_array(chunks):
+    """
+    Byte parçaları halinde gelen bir JSON dizisinin elemanlarını sırayla üretir.
+
+    Bellekte yalnızca henüz tamamlanmamış eleman kadar metin tutulur; dizinin
+    tamamı hiçbir zaman parse edilmiş liste olarak oluşmaz.
+
+    Args:
+        chunks (iterable): JSON dizisinin byte parçaları.
+
+    Raises:
+        ValueError: Gövde bir JSON dizisi değilse veya yarıda kesildiyse.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    started = False
+    for chunk in chunks:
+        buffer += text.decode(chunk)
+        position = 0
+        while True:
+            while position < len(buffer) and (buffer[position] in _WHITESPACE or started and buffer[position] == ","):
+                position += 1
+            if position >= len(buffer):
+                break
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError("Yanıt bir JSON dizisi değil.")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break
+            if not isinstance(item, (dict, list)) and (end == len(buffer) or buffer[end] not in _DELIMITERS):
+                # Sayı/literal ancak ardından ayraç gelince biter; parça sonundaki "1." veya "2e" devam edebilir
+                if not set(buffer[end:]) <= _NUMBER_CHARS:
+                    raise ValueError("Geçersiz JSON dizisi elemanı.")
+                break
+            position = end
+            yield item
+        buffer = buffer[position:]
+    raise ValueError("JSON dizisi tamamlanmadan yanıt bitti.")
+
+
+def iter_pets(response, chunk_size=CHUNK_SIZE):
+    """
+    stream=True ile alınmış findByStatus yanıtındaki petleri tek tek üretir.
+
+    ijson kuruluysa onu, değilse iter_json_array'i kullanır. Client'ın response hook'ları
+    (ör. şema kontrolü) elemanları okundukça görür.
+    """
+    if ijson is not None:
+        response.raw.decode_content = True
+        items = ijson.items(response.raw, "item", use_float=True)
+    else:
+        items = iter_json_array(response.iter_content(chunk_size))
+    for wrap in getattr(response, "item_hooks", ()):
+        items = wrap(items)
+    yield from items
+
+
+def preview(items, max_chars=PREVIEW_CHARS):
+    """
+    Elemanları tüketirken sayar ve yalnızca ilk max_chars karakterlik kısmını metin olarak tutar.
+
+    Returns:
+        tuple: (eleman sayısı, kısaltılmış liste metni)
+    """
+    parts = []
+    size = 0
+    count = 0
+    for item in items:
+        count += 1
+        if size < max_chars:
+            text = repr(item)
+            parts.append(text)
+            size += len(text) + 2
+    shown = ", ".join(parts)
+    if len(shown) > max_chars:
+        shown = shown[:max_chars] + "..."
+    hidden = count - len(parts)
+    return count, f"[{shown}{f', ... (+{hidden} more)' if hidden else ''}]"
@@ -0,0 +1,41 @@
+import importlib.util
+import os
+import sys
+
+# Suite scriptleri repo kökünde, import edilemeyen (tireli) dosya isimleriyle duruyor
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SUITE_FILES = {
+    "positive": "PetStoreTest-PositiveCases.py",
+    "negative": "PetStoreTest-NegativeCases.py",
+    "store_user_positive": "PetStoreTest-StoreUserPositiveCases.py",
+    "store_user_negative": "PetStoreTest-StoreUserNegativeCases.py",
+}
+
+
+def load(name):
+    """
+    Suite scriptini modül olarak yükler; aynı process içinde tekrar yüklemez.
+
+    Args:
+        name (str): SUITE_FILES'taki suite ismi, örn. "positive" veya "store_user_negative".
+
+    Returns:
+        module: Scenario fonksiyonlarını ve get_test_cases() içeren modül.
+    """
+    module_name = f"petstore_suite_{name}"
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT, SUITE_FILES[name]))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def set_base_url(base_url):
+    """
+    Yüklenmiş tüm suitelerin BASE_URL değerini değiştirir.
+    """
+    for name in SUITE_FILES:
+        load(name).BASE_URL = base_url
@@ -0,0 +1,101 @@
+import socket
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from petstore import client, metrics
+
+
+class _TimedConnectionMixin:
+    """
+    Yeni bağlantıları sayar; DNS çözümleme ve bağlantı kurma sürelerini ölçer.
+    """
+
+    def _new_conn(self):
+        timing = metrics.timing()
+        if timing is None:
+            return super()._new_conn()
+        started = time.perf_counter()
+        try:
+            address = socket.getaddrinfo(self._dns_host, self.port, type=socket.SOCK_STREAM)[0][4][0]
+        except OSError:
+            # Hatanın urllib3 tarafından normal şekilde raporlanması için çözümlemeyi ona bırak
+            return super()._new_conn()
+        resolved = time.perf_counter()
+        timing["dns"] += resolved - started
+        host, self._dns_host = self._dns_host, address
+        try:
+            return super()._new_conn()
+        finally:
+            self._dns_host = host
+
+    def connect(self):
+        client._count("opened")
+        timing = metrics.timing()
+        if timing is None:
+            return super().connect()
+        started = time.perf_counter()
+        dns = timing["dns"]
+        super().connect()
+        # TCP + TLS el sıkışması, DNS hariç
+        timing["connect"] += time.perf_counter() - started - (timing["dns"] - dns)
+
+
+class _CountingHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _CountingHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+    def _make_request(self, *args, **kwargs):
+        client._count("requests")
+        return super()._make_request(*args, **kwargs)
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+    def _make_request(self, *args, **kwargs):
+        client._count("requests")
+        return super()._make_request(*args, **kwargs)
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    Açılan ve yeniden kullanılan bağlantıları sayan keep-alive adapter.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        timing = metrics.timing()
+        if timing is not None and timing["ttfb"] is None:
+            # Adapter yanıt başlıkları okunduğunda döner; gövde Session tarafından okunur
+            timing["ttfb"] = time.perf_counter() - started
+        return response
+
+
+def new_session(pool_connections, pool_maxsize, pool_block):
+    """
+    Sayaçlı keep-alive adapter takılmış yeni bir requests.Session döner.
+    """
+    session = requests.Session()
+    adapter = PooledAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,147 @@
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from petstore.runner import run_test, test_name
+
+# Bir workflow adımı: test ve etkilediği kaynakların isimleri (örn. "pet")
+Step = namedtuple("Step", "test produces consumes destroys")
+
+
+def _names(value):
+    return (value,) if isinstance(value, str) else tuple(value)
+
+
+def step(test, produces=(), consumes=(), destroys=()):
+    """
+    Bir test caseini, kullandığı kaynaklarla birlikte workflow adımı olarak tanımlar.
+
+    Args:
+        test (callable): Çalıştırılacak test case (fonksiyon veya partial).
+        produces (str | tuple): Adımın oluşturduğu veya değiştirdiği kaynaklar.
+        consumes (str | tuple): Adımın yalnızca okuduğu kaynaklar.
+        destroys (str | tuple): Adımın sildiği kaynaklar.
+
+    Returns:
+        Step: Workflow'a eklenecek adım.
+    """
+    return Step(test, _names(produces), _names(consumes), _names(destroys))
+
+
+class Workflow:
+    """
+    Adımların kaynak bildirimlerinden bağımlılık grafiği (DAG) kuran workflow.
+
+    Adımların yazıldığı sıra kaynakların yaşam döngüsünü belirler: bir kaynağı okuyan
+    adım son yazan adımdan sonra, yazan veya silen adım ise son yazandan ve o zamandan
+    beri okuyan tüm adımlardan sonra çalışır. Aynı kaynağı okuyan adımlar ve ortak
+    kaynağı olmayan dallar birbirini beklemez.
+
+    Args:
+        steps (list): step() ile tanımlanmış adımlar.
+
+    Raises:
+        ValueError: Bir adım, önceki hiçbir adımın üretmediği (veya silinmiş) bir kaynağı kullanıyorsa.
+    """
+
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.dependencies = []
+        writers = {}
+        readers = {}
+        # Üretilmiş ve henüz silinmemiş kaynaklar; silen adım yine de son yazan olarak kalır
+        alive = set()
+        for index, current in enumerate(self.steps):
+            name = test_name(current.test)
+            dependencies = set()
+            for resource in current.consumes + current.destroys:
+                if resource not in alive:
+                    raise ValueError(f"{name}: '{resource}' kaynağını üreten önceki bir adım yok")
+            for resource in current.consumes:
+                dependencies.add(writers[resource])
+                readers.setdefault(resource, []).append(index)
+            for resource in current.produces + current.destroys:
+                if resource in writers:
+                    dependencies.add(writers[resource])
+                dependencies.update(readers.pop(resource, ()))
+                writers[resource] = index
+            alive.update(current.produces)
+            alive.difference_update(current.destroys)
+            dependencies.discard(index)
+            self.dependencies.append(frozenset(dependencies))
+
+    def critical_path(self, durations):
+        """
+        Süreleri verilen adımlarda en uzun bağımlılık zinciri.
+
+        Returns:
+            tuple: (zincirdeki adımların indeksleri, toplam süre)
+        """
+        if not self.steps:
+            return [], 0.0
+        lengths = []
+        previous = []
+        # Bağımlılıklar her zaman daha önce yazılmış adımlardır; liste sırası topolojik sıradır
+        for index, dependencies in enumerate(self.dependencies):
+            before = max(dependencies, key=lambda dependency: lengths[dependency], default=None)
+            previous.append(before)
+            lengths.append(durations[index] + (lengths[before] if before is not None else 0.0))
+        index = max(range(len(self.steps)), key=lengths.__getitem__)
+        total = lengths[index]
+        path = []
+        while index is not None:
+            path.append(index)
+            index = previous[index]
+        return path[::-1], total
+
+
+def run(workflow, workers=1):
+    """
+    Workflow adımlarını bağımlılıkları bittikçe thread havuzunda çalıştırır.
+
+    Bağımlı olduğu bir adım başarısız olan adım çalıştırılmaz, başarısız sayılır.
+
+    Returns:
+        list: Her adım için (test ismi, başarılı mı, hata mesajı veya None, süre); adım sırasıyla.
+    """
+    steps = workflow.steps
+    results = [None] * len(steps)
+    remaining = [set(dependencies) for dependencies in workflow.dependencies]
+    dependents = [[] for _ in steps]
+    for index, dependencies in enumerate(workflow.dependencies):
+        for dependency in dependencies:
+            dependents[dependency].append(index)
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = {}
+
+        def finish(index, result):
+            results[index] = result
+            for dependent in dependents[index]:
+                remaining[dependent].discard(index)
+                if remaining[dependent]:
+                    continue
+                failed = [results[dependency][0] for dependency in workflow.dependencies[dependent]
+                          if not results[dependency][1]]
+                if failed:
+                    name = test_name(steps[dependent].test)
+                    print(f"\nAtlandı: {name} (başarısız bağımlılık: {', '.join(failed)})")
+                    finish(dependent, (name, False, f"Bağımlı olduğu adım başarısız: {', '.join(failed)}", 0.0))
+                else:
+                    futures[executor.submit(run_test, steps[dependent].test)] = dependent
+
+        for index, dependencies in enumerate(workflow.dependencies):
+            if not dependencies:
+                futures[executor.submit(run_test, steps[index].test)] = index
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                finish(futures.pop(future), future.result())
+    return results
+
+
+def print_critical_path(workflow, results, elapsed):
+    path, total = workflow.critical_path([duration for *_, duration in results])
+    busy = sum(duration for *_, duration in results)
+    print(f"\nKritik yol: {total:.2f} sn (koşu {elapsed:.2f} sn, adımların toplamı {busy:.2f} sn)")
+    print("  " + " -> ".join(results[index][0] for index in path))
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+import pytest
+
+from petstore import aio, cassette, client, metrics, policy, ratelimit
+from petstore.mutations import MutationCase
+
+URL = "http://petstore.test/v2/pet/1"
+
+
+class FakeAsyncClient:
+    """
+    Sırayla verilen status kodlarını dönen, gönderilen istekleri kaydeden AsyncClient yerine geçen sınıf.
+
+    URL'ye özel sıra routes ile verilebilir; son status kodu tekrar eder.
+    """
+
+    def __init__(self, *statuses, delay=0.0, routes=None):
+        self.routes = dict(routes or {})
+        self.statuses = list(statuses)
+        self.delay = delay
+        self.calls = []
+
+    async def request(self, method, url, params=None, data=None, headers=None, timeout=None):
+        self.calls.append((method, url, data, timeout, threading.get_ident()))
+        await asyncio.sleep(self.delay)
+        statuses = self.routes.get(url, self.statuses)
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return aio.AsyncResponse(status, {"Content-Type": "application/json"}, b'{"id": 1}', "utf-8", url, "OK")
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def records():
+    collected = []
+    hook = metrics.add_hook(collected.append)
+    yield collected
+    metrics.remove_hook(hook)
+
+
+@pytest.fixture
+def fast_policy(monkeypatch):
+    monkeypatch.setattr(policy, "default_policy", policy.Policy(backoff_base=0.0))
+
+
+def _install(monkeypatch, fake):
+    monkeypatch.setattr(aio, "get_client", lambda: fake)
+    return fake
+
+
+def test_request_reports_metrics_and_runs_response_hooks(monkeypatch, records, fast_policy):
+    fake = _install(monkeypatch, FakeAsyncClient(200))
+    seen = []
+    hook = client.add_response_hook(lambda method, url, response: seen.append((method, response.status_code)))
+    try:
+        response = asyncio.run(aio.post(URL, data=b'{"id": 1}'))
+    finally:
+        client.remove_response_hook(hook)
+    assert response.json() == {"id": 1}
+    assert seen == [("POST", 200)]
+    # Policy endpoint timeout'unu verir
+    assert fake.calls[0][3] == policy.DEFAULT_TIMEOUT
+    [record] = records
+    assert (record.method, record.endpoint, record.status, record.bytes_sent) == ("POST", "/pet/{id}", 200, 9)
+
+
+def test_policy_retries_idempotent_requests(monkeypatch, records, fast_policy):
+    fake = _install(monkeypatch, FakeAsyncClient(503, 200))
+    response = asyncio.run(aio.get(URL))
+    assert response.status_code == 200
+    assert len(fake.calls) == 2
+    assert records[0].retries == 1
+
+
+def test_concurrent_requests_keep_separate_timings(monkeypatch, records, fast_policy):
+    retry_url = f"{URL}?retry"
+    # İkinci coroutine'in ilk denemesi 503 alır; birincinin zamanlamasına yazılmamalı
+    _install(monkeypatch, FakeAsyncClient(200, delay=0.01, routes={retry_url: [503, 200]}))
+
+    async def run():
+        return await asyncio.gather(aio.get(URL), aio.get(retry_url))
+
+    asyncio.run(run())
+    assert {record.url: record.retries for record in records} == {URL: 0, retry_url: 1}
+
+
+def test_cassette_records_and_replays_async_requests(monkeypatch, tmp_path, fast_policy):
+    path = str(tmp_path / "aio.sqlite")
+    fake = _install(monkeypatch, FakeAsyncClient(200))
+    try:
+        cassette.install(path, "record")
+        asyncio.run(aio.get(URL))
+        cassette.install(path, "replay")
+        response = asyncio.run(aio.get(URL))
+    finally:
+        cassette.uninstall()
+    assert len(fake.calls) == 1
+    assert (response.status_code, response.json()) == (200, {"id": 1})
+
+
+def test_ratelimit_releases_async_slots(monkeypatch, fast_policy):
+    _install(monkeypatch, FakeAsyncClient(200, delay=0.01))
+    controller = ratelimit.install(adaptive=True, maximum=8)
+    controller.limit = 1.0
+
+    async def run():
+        return await asyncio.wait_for(asyncio.gather(*(aio.get(URL) for _ in range(5))), timeout=5)
+
+    try:
+        asyncio.run(run())
+    finally:
+        ratelimit.uninstall()
+    assert controller.in_flight == 0
+    assert controller.limit > 1.0
+
+
+def test_mutation_cases_run_on_the_event_loop(monkeypatch, fast_policy):
+    fake = _install(monkeypatch, FakeAsyncClient(400))
+    cases = [MutationCase(f"case_{index}", "POST", URL, b"{}") for index in range(3)]
+    results = aio.run_test_cases(cases, concurrency=3)
+    assert all(passed for _, passed, _, _ in results)
+    # acall coroutine'i thread havuzuna gönderilmeden çalışır
+    assert {call[4] for call in fake.calls} == {threading.get_ident()}
+
+
+def test_async_mode_requires_a_backend(monkeypatch, capsys):
+    from petstore import runner
+    monkeypatch.setattr(aio, "httpx", None)
+    monkeypatch.setattr(aio, "aiohttp", None)
+    with pytest.raises(SystemExit):
+        runner.main(lambda: [], ["--mode", "async"])
+    assert "httpx veya aiohttp" in capsys.readouterr().err
@@ -0,0 +1,62 @@
+import argparse
+
+import pytest
+
+from petstore import bench
+
+
+def _result(samples):
+    ordered = sorted(samples)
+    return {
+        "samples": list(samples),
+        "p95": bench.percentile(ordered, 95),
+        "throughput": 1000 / (sum(samples) / len(samples)),
+    }
+
+
+def _compare(baseline, current):
+    return bench.compare({"scenarios": {"get_pet": _result(baseline)}},
+                         {"scenarios": {"get_pet": _result(current)}})[0]
+
+
+def test_mann_whitney_known_answer():
+    # Tüm current örnekleri baseline'dan büyük: U = n1 * n2
+    u, p_value = bench.mann_whitney_u([1, 2, 3], [4, 5, 6])
+    assert u == 9
+    assert p_value == pytest.approx(0.0404, abs=1e-4)
+
+
+def test_mann_whitney_without_samples():
+    assert bench.mann_whitney_u([], [1, 2]) == (0.0, 1.0)
+
+
+def test_identical_samples_are_not_a_regression():
+    samples = [10.0 + index % 5 for index in range(30)]
+    row = _compare(samples, samples)
+    assert row["p_value"] > bench.DEFAULT_ALPHA
+    assert row["effect"] == pytest.approx(0.5)
+    assert not row["regression"]
+
+
+def test_clearly_shifted_samples_are_a_regression():
+    baseline = [10.0 + index % 5 for index in range(30)]
+    row = _compare(baseline, [value * 1.5 for value in baseline])
+    assert row["p_value"] < bench.DEFAULT_ALPHA
+    assert row["regression"]
+
+
+def test_small_significant_shift_needs_effect_size():
+    # Örneklerin çoğu aynı, kuyruk büyümüş: p95 artar ve p anlamlı olsa da etki küçük
+    baseline = [10.0 + index % 10 for index in range(1000)]
+    current = [value + 5 if value >= 17 else value for value in baseline]
+    row = _compare(baseline, current)
+    assert row["p_value"] < bench.DEFAULT_ALPHA
+    assert row["p95_change"] > bench.DEFAULT_THRESHOLD
+    assert row["effect"] < bench.DEFAULT_MIN_EFFECT
+    assert not row["regression"]
+
+
+def test_iterations_must_be_positive():
+    with pytest.raises(argparse.ArgumentTypeError):
+        bench._count(1)("0")
+    assert bench._count(0)("0") == 0
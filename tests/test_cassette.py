@@ -0,0 +1,85 @@
+import pytest
+
+from petstore import cassette, client, ids, server
+from petstore.payloads import JSON_HEADERS, PetFactory
+
+
+@pytest.fixture
+def emulator():
+    running = server.start()
+    yield running
+    running.stop()
+
+
+@pytest.fixture
+def installed():
+    yield cassette.install
+    cassette.uninstall()
+
+
+def _use_run(monkeypatch, run_id):
+    monkeypatch.setattr(ids, "RUN_ID", run_id)
+    monkeypatch.setattr(ids, "FIRST_ID", run_id * ids.RUN_BLOCK)
+
+
+def test_normalize_replaces_run_scoped_tokens(monkeypatch):
+    _use_run(monkeypatch, 4242)
+    assert cassette.normalize(f"/pet/{ids.FIRST_ID + 7}") == "/pet/<run>000007"
+    assert cassette.normalize(b'{"username": "owner_4242_0"}') == b'{"username": "owner_<run>_0"}'
+    # Başka sayıların parçası olan eşleşmeler korunur
+    assert cassette.normalize("14242 42420 4242123") == "14242 42420 4242123"
+    _use_run(monkeypatch, 77)
+    assert cassette.restore(b"<run>000007") == b"77000007"
+
+
+def test_request_key_ignores_host_and_run_id(monkeypatch):
+    _use_run(monkeypatch, 1111)
+    first = cassette.request_key("GET", f"http://a.test/v2/pet/{ids.FIRST_ID + 1}", scope="get_pet")
+    _use_run(monkeypatch, 2222)
+    second = cassette.request_key("GET", f"http://b.test:8080/v2/pet/{ids.FIRST_ID + 1}", scope="get_pet")
+    assert first == second
+    assert first != cassette.request_key("GET", f"http://b.test/v2/pet/{ids.FIRST_ID + 2}", scope="get_pet")
+
+
+def test_record_and_replay_round_trip(tmp_path, monkeypatch, emulator, installed):
+    path = str(tmp_path / "cassette.db")
+    _use_run(monkeypatch, 1234)
+    pet_id = ids.FIRST_ID + 5
+    installed(path, "record")
+    client.post(f"{emulator.base_url}/pet", data=PetFactory().body(id=pet_id), headers=JSON_HEADERS)
+    for _ in range(2):
+        assert client.get(f"{emulator.base_url}/pet/{pet_id}").status_code == 200
+    client.delete(f"{emulator.base_url}/pet/{pet_id}")
+    assert client.get(f"{emulator.base_url}/pet/{pet_id}").status_code == 404
+    assert installed(path, "replay") is cassette.active
+    emulator.stop()
+
+    # Farklı run id ve kapalı sunucu: yanıtlar kasetten, bu koşunun id'siyle döner
+    _use_run(monkeypatch, 98765)
+    pet_id = ids.FIRST_ID + 5
+    client.post(f"{emulator.base_url}/pet", data=PetFactory().body(id=pet_id), headers=JSON_HEADERS)
+    responses = [client.get(f"{emulator.base_url}/pet/{pet_id}") for _ in range(2)]
+    assert [response.json()["id"] for response in responses] == [pet_id, pet_id]
+    assert client.delete(f"{emulator.base_url}/pet/{pet_id}").status_code == 200
+    # Tekrar sırası korunur; silme sonrası GET 404 döner
+    assert client.get(f"{emulator.base_url}/pet/{pet_id}").status_code == 404
+    assert cassette.active.hits == 5
+    with pytest.raises(cassette.CassetteMissError):
+        client.get(f"{emulator.base_url}/pet/{pet_id + 1}")
+
+
+def test_verify_only_sends_reads_live(tmp_path, emulator, installed):
+    path = str(tmp_path / "cassette.db")
+    url = f"{emulator.base_url}/pet"
+    pet_id = ids.allocate()
+    body = PetFactory().body(id=pet_id)
+    installed(path, "record")
+    client.post(url, data=body, headers=JSON_HEADERS)
+    client.get(f"{url}/findByStatus", params={"status": "available"})
+    emulator.store.delete(pet_id)
+    recorder = installed(path, "verify", drift_sample=1.0)
+    client.post(url, data=body, headers=JSON_HEADERS)
+    client.get(f"{url}/findByStatus", params={"status": "available"})
+    # POST replay edildi ama canlı sunucuya gitmedi; yalnızca GET kontrol edildi
+    assert recorder.checked == 1
+    assert emulator.store.find_by_status(["available"]) == []
@@ -0,0 +1,41 @@
+import pytest
+
+from petstore import client
+
+
+class FakeSession:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    created = []
+
+    def new_session():
+        created.append(FakeSession())
+        return created[-1]
+
+    monkeypatch.setattr(client, "_new_session", new_session)
+    monkeypatch.setattr(client, "_session", None)
+    monkeypatch.setattr(client, "_session_pid", None)
+    monkeypatch.setattr(client, "POOL_MAXSIZE", client.POOL_MAXSIZE)
+    return created
+
+
+def test_session_is_shared_until_settings_change(sessions):
+    first = client.get_session()
+    assert client.get_session() is first
+    client.configure(pool_maxsize=client.POOL_MAXSIZE)
+    assert client.get_session() is first and not first.closed
+
+
+def test_configure_closes_the_replaced_session(sessions):
+    first = client.get_session()
+    client.configure(pool_maxsize=client.POOL_MAXSIZE + 1)
+    assert first.closed
+    second = client.get_session()
+    assert second is not first and not second.closed
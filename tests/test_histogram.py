@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from petstore.bench import percentile
+from petstore.histogram import Histogram
+
+
+def _filled(values, **kwargs):
+    histogram = Histogram(**kwargs)
+    for value in values:
+        histogram.record(value)
+    return histogram
+
+
+def test_empty_histogram():
+    histogram = Histogram()
+    assert histogram.percentile(99) == 0.0
+    assert histogram.mean == 0.0
+
+
+@pytest.mark.parametrize("pct", [1, 50, 90, 95, 99, 99.9, 100])
+def test_percentiles_within_precision(pct):
+    generator = random.Random(pct)
+    values = sorted(generator.lognormvariate(-4, 1) for _ in range(10000))
+    histogram = _filled(values, precision=0.01)
+    exact = percentile(values, pct)
+    assert histogram.percentile(pct) == pytest.approx(exact, rel=0.01)
+
+
+def test_extremes_are_exact():
+    histogram = _filled([0.003, 0.2, 0.05])
+    assert histogram.percentile(0) == histogram.min == 0.003
+    assert histogram.percentile(100) == histogram.max == 0.2
+    assert histogram.mean == pytest.approx(0.253 / 3)
+
+
+def test_values_below_lowest_share_first_bucket():
+    histogram = _filled([0.0, 1e-9, 5e-7], lowest=1e-6)
+    assert histogram.counts == {0: 3}
+    assert histogram.percentile(50) == 0.0
+
+
+def test_merge_matches_single_histogram():
+    generator = random.Random(11)
+    values = [generator.uniform(0.001, 2.0) for _ in range(2000)]
+    merged = _filled(values[:700]).merge(_filled(values[700:]))
+    single = _filled(values)
+    assert merged.counts == single.counts
+    assert (merged.count, merged.min, merged.max) == (single.count, single.min, single.max)
+    assert merged.total == pytest.approx(single.total)
+
+
+def test_merge_rejects_different_layout():
+    with pytest.raises(ValueError):
+        Histogram(precision=0.01).merge(Histogram(precision=0.02))
+
+
+def test_exact_percentile_nearest_rank():
+    values = list(range(1, 11))
+    assert percentile(values, 50) == 5
+    assert percentile(values, 95) == 10
+    assert percentile(values, 10) == 1
+    assert percentile([], 99) == 0.0
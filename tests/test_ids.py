@@ -0,0 +1,32 @@
+import multiprocessing
+
+from petstore import ids
+
+
+def _allocate_many(count):
+    return [ids.allocate() for _ in range(count)]
+
+
+def test_allocate_creates_shared_lock():
+    # Yalnızca import eden process semaphore açmaz; ilk allocate kilidi oluşturur
+    assert ids.FIRST_ID <= ids.allocate() < ids.FIRST_ID + ids.RUN_BLOCK
+    assert ids._lock is not None
+
+
+def test_reserve_is_stable_and_registered():
+    first = ids.reserve("tests.reserve", 3)
+    assert first == ids.reserve("tests.reserve", 3) == ids.derive("tests.reserve", 3)
+    assert set(first) <= set(ids.allocated())
+
+
+def test_derive_is_not_registered():
+    derived = ids.derive("tests.derive.only")
+    assert derived not in ids.allocated()
+
+
+def test_forked_workers_share_the_counter():
+    ids.worker_state()
+    context = multiprocessing.get_context("fork")
+    with context.Pool(4) as pool:
+        allocated = [pet_id for chunk in pool.map(_allocate_many, [50] * 4) for pet_id in chunk]
+    assert len(set(allocated)) == 200
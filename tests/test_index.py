@@ -0,0 +1,71 @@
+import pytest
+
+from petstore import client, server
+from petstore.index import PetIndex
+from petstore.payloads import JSON_HEADERS, PetFactory
+
+
+@pytest.fixture
+def base_url():
+    emulator = server.start()
+    yield emulator.base_url
+    emulator.stop()
+
+
+@pytest.fixture
+def index():
+    pet_index = PetIndex(ttl=3600.0)
+    yield pet_index
+    pet_index.close()
+
+
+def _create(base_url, pet_id, name):
+    response = client.post(f"{base_url}/pet", data=PetFactory().body(id=pet_id, name=name), headers=JSON_HEADERS)
+    assert response.status_code == 200
+
+
+def test_writes_invalidate_the_cached_list(base_url, index):
+    _create(base_url, 1, "Tommy")
+    assert [pet["id"] for pet in index.find(base_url, name="Tommy")] == [1]
+    _create(base_url, 2, "Tommy")
+    assert sorted(pet["id"] for pet in index.find(base_url, name="Tommy")) == [1, 2]
+    client.delete(f"{base_url}/pet/1")
+    assert [pet["id"] for pet in index.find(base_url, name="Tommy")] == [2]
+
+
+def test_reads_keep_the_cached_list(base_url, index):
+    _create(base_url, 1, "Tommy")
+    index.find(base_url, name="Tommy")
+    client.get(f"{base_url}/pet/1")
+    index.find(base_url, name="Tommy")
+    # TTL dolmadı ve yazma olmadı; ikinci find istek atmaz
+    assert index.refresh(base_url) is None
+
+
+def test_unchanged_list_is_revalidated_with_304(base_url, index):
+    _create(base_url, 1, "Tommy")
+    index.find(base_url)
+    client.post(f"{base_url}/store/order", data=b"{}", headers=JSON_HEADERS)
+    assert index.refresh(base_url) is None
+    client.put(f"{base_url}/pet", data=b"not json", headers=JSON_HEADERS)
+    assert index.refresh(base_url) is None
+    index.invalidate(base_url)
+    assert index.refresh(base_url) == 304
+
+
+def test_fetch_runs_outside_the_lock(base_url, index, monkeypatch):
+    _create(base_url, 1, "Tommy")
+    get = client.get
+
+    def fetch(*args, **kwargs):
+        # İstek sürerken kilit serbest; araya giren yazma listeyi eskitebilir
+        assert not index._lock.locked()
+        index.invalidate(base_url)
+        return get(*args, **kwargs)
+
+    monkeypatch.setattr(client, "get", fetch)
+    assert index.refresh(base_url) == 200
+    monkeypatch.setattr(client, "get", get)
+    # İstek sırasında eskitilen liste uygulanır ama taze sayılmaz
+    assert index.refresh(base_url) == 304
+    assert [pet["id"] for pet in index.find(base_url, name="Tommy")] == [1]
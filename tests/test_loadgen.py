@@ -0,0 +1,46 @@
+import time
+
+import pytest
+
+from petstore.loadgen import LoadGenerator
+
+
+def _slots(generator, count, start=100.0):
+    return [generator._next_slot(start) - start for _ in range(count)]
+
+
+def test_constant_arrivals_are_evenly_spaced():
+    generator = LoadGenerator({"get_pet": 1}, rate=4.0)
+    assert _slots(generator, 5) == pytest.approx([0.0, 0.25, 0.5, 0.75, 1.0])
+
+
+def test_poisson_arrivals_follow_the_rate():
+    generator = LoadGenerator({"get_pet": 1}, rate=100.0, seed=7, arrival="poisson")
+    slots = _slots(generator, 5000)
+    gaps = [later - earlier for earlier, later in zip(slots, slots[1:])]
+    assert all(gap > 0 for gap in gaps)
+    # Üstel aralıkların ortalaması 1/rate
+    assert sum(gaps) / len(gaps) == pytest.approx(0.01, rel=0.05)
+
+
+def test_poisson_schedule_is_reproducible_with_seed():
+    first = LoadGenerator({"get_pet": 1}, rate=50.0, seed=3, arrival="poisson")
+    second = LoadGenerator({"get_pet": 1}, rate=50.0, seed=3, arrival="poisson")
+    assert _slots(first, 20) == _slots(second, 20)
+
+
+def test_unknown_arrival_is_rejected():
+    with pytest.raises(ValueError):
+        LoadGenerator({"get_pet": 1}, rate=1.0, arrival="burst")
+
+
+def test_unsent_arrivals_are_recorded_with_their_wait():
+    generator = LoadGenerator({"get_pet": 1}, rate=1.0)
+    now = time.perf_counter()
+    # Takvim 10 sn geride, süre 1 sn önce doldu: ilk istek gönderilmeden en az 9 sn beklemiş sayılır
+    generator._worker(0, now - 10.0, now - 1.0)
+    assert generator._unsent == 1
+    assert generator.unsent_wait.max == pytest.approx(9.0)
+    report = generator.report(10.0)
+    assert report["unsent"] == 1
+    assert report["p99_with_unsent"] == pytest.approx(9000.0, rel=0.01)
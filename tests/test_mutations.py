@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from petstore import mutations, server
+from petstore.payloads import PetFactory
+
+
+def _cases():
+    return {case.__name__: case for case in mutations.generate_cases("http://petstore.test/v2", [PetFactory().build()])}
+
+
+@pytest.mark.parametrize("name, tolerated", [
+    ("post_pet_name_wrong_type_int_tolerated", True),
+    ("post_pet_name_wrong_type_list", False),
+    ("post_pet_id_wrong_type_str", False),
+    ("post_pet_id_wrong_type_bool", False),
+    ("post_pet_id_out_of_range_high", False),
+    ("post_pet_status_bad_enum_tolerated", True),
+    ("put_pet_name_missing_required_tolerated", True),
+    ("put_pet_tags_wrong_type_nonetype_tolerated", True),
+    ("put_pet_tags_wrong_type_dict", False),
+    ("put_pet_body_truncated", False),
+])
+def test_mutation_classes_expect_server_behaviour(name, tolerated):
+    assert _cases()[name].tolerated is tolerated
+
+
+def test_accepted_id_mutations_are_not_generated():
+    # Sunucu bu id'lerle koşu aralığı dışında pet oluşturur
+    names = set(_cases())
+    assert not {name for name in names if name.startswith(("post_pet_id_wrong_type_float", "post_pet_id_wrong_type_nonetype"))}
+    assert all(name.endswith("_tolerated") == case.tolerated for name, case in _cases().items())
+
+
+def test_cases_are_deduplicated():
+    cases = mutations.generate_cases("http://petstore.test/v2", [PetFactory().build()] * 2)
+    assert len({case.key for case in cases}) == len(cases)
+
+
+def test_emulator_reads_pets_like_swagger():
+    pet = server._read_pet({"id": 7.9, "name": 12345, "status": None, "photoUrls": [True], "tags": [{"id": 1}]})
+    assert pet == {"id": 7, "name": "12345", "photoUrls": ["true"], "tags": [{"id": 1}]}
+    assert server._read_pet({"id": "invalid_id"}) is None
+    assert server._read_pet({"tags": [{"id": 2**63}]}) is None
+    assert server._read_pet({"category": []}) is None
+    assert server._read_pet(["not", "a", "pet"]) is None
+
+
+def test_every_generated_case_matches_the_emulator():
+    emulator = server.start()
+    try:
+        for case in mutations.generate_cases(emulator.base_url, [PetFactory().build(id=1)]):
+            case()
+    finally:
+        emulator.stop()
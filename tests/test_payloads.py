@@ -0,0 +1,22 @@
+from petstore.payloads import MISSING, PetFactory, _freeze
+
+
+def test_freeze_keeps_scalar_types_apart():
+    assert len({_freeze(True), _freeze(1), _freeze(1.0)}) == 3
+    assert _freeze({"id": 1}) != _freeze({"id": True})
+
+
+def test_freeze_ignores_dict_order():
+    assert _freeze({"a": 1, "b": [1, 2]}) == _freeze({"b": [1, 2], "a": 1})
+
+
+def test_freeze_distinguishes_containers_and_missing():
+    assert _freeze([1, 2]) != _freeze((1, 2))
+    assert _freeze(MISSING) != _freeze("<missing>")
+
+
+def test_body_cache_does_not_mix_equal_scalars():
+    factory = PetFactory()
+    assert factory.body(id=1) is factory.body(id=1)
+    assert b"true" in factory.body(id=True)
+    assert b"1.0" in factory.body(id=1.0)
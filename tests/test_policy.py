@@ -0,0 +1,103 @@
+import pytest
+import requests
+
+from petstore import policy
+from petstore.policy import BudgetExceededError, CircuitBreaker, CircuitOpenError, Policy
+
+HOST = "petstore.test"
+URL = f"http://{HOST}/v2/pet/1"
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+
+    def close(self):
+        pass
+
+
+def _open(breaker):
+    for _ in range(breaker.threshold):
+        breaker.record(HOST, success=False)
+    assert breaker.is_open(HOST)
+
+
+def test_breaker_opens_after_threshold_and_rejects():
+    breaker = CircuitBreaker(threshold=3, cooldown=60.0)
+    _open(breaker)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(HOST)
+
+
+def test_half_open_probe_recovers(monkeypatch):
+    breaker = CircuitBreaker(threshold=2, cooldown=10.0)
+    now = [100.0]
+    monkeypatch.setattr(policy.time, "monotonic", lambda: now[0])
+    _open(breaker)
+    now[0] += 11.0
+    breaker.before_request(HOST)
+    # Deneme sürerken ikinci istek reddedilir
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(HOST)
+    breaker.record(HOST, success=True)
+    assert not breaker.is_open(HOST)
+    breaker.before_request(HOST)
+
+
+def test_failed_probe_restarts_cooldown(monkeypatch):
+    breaker = CircuitBreaker(threshold=2, cooldown=10.0)
+    now = [100.0]
+    monkeypatch.setattr(policy.time, "monotonic", lambda: now[0])
+    _open(breaker)
+    now[0] += 11.0
+    breaker.before_request(HOST)
+    breaker.record(HOST, success=False)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(HOST)
+
+
+def test_unexpected_error_releases_probe(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(policy.time, "monotonic", lambda: now[0])
+    run = Policy(max_retries=0, breaker=CircuitBreaker(threshold=1, cooldown=10.0))
+    _open(run.breaker)
+    now[0] += 11.0
+
+    def broken(timeout):
+        raise KeyError("not a connection error")
+
+    with pytest.raises(KeyError):
+        run.execute("GET", URL, broken)
+    # Devre hâlâ half-open; yeni deneme reddedilmez ve başarılı olunca kapanır
+    assert run.execute("GET", URL, lambda timeout: FakeResponse(200)).status_code == 200
+    assert not run.breaker.is_open(HOST)
+
+
+def test_connection_errors_count_as_failures():
+    run = Policy(max_retries=0, breaker=CircuitBreaker(threshold=2, cooldown=60.0))
+
+    def refused(timeout):
+        raise requests.exceptions.ConnectionError("refused")
+
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            run.execute("GET", URL, refused)
+    assert run.breaker.is_open(HOST)
+
+
+def test_budget_exhaustion_is_not_a_breaker_failure():
+    run = Policy(max_retries=0, breaker=CircuitBreaker(threshold=1, cooldown=60.0))
+    run.set_budget(0)
+    with pytest.raises(BudgetExceededError):
+        run.execute("GET", URL, lambda timeout: FakeResponse(200))
+    assert not run.breaker.is_open(HOST)
+
+
+def test_retries_idempotent_requests_on_unavailable(monkeypatch):
+    monkeypatch.setattr(policy.time, "sleep", lambda seconds: None)
+    run = Policy(max_retries=2, breaker=CircuitBreaker(threshold=10))
+    statuses = iter([503, 503, 200])
+    assert run.execute("GET", URL, lambda timeout: FakeResponse(next(statuses))).status_code == 200
+    statuses = iter([503, 200])
+    assert run.execute("POST", URL, lambda timeout: FakeResponse(next(statuses))).status_code == 503
@@ -0,0 +1,90 @@
+import pytest
+
+from petstore import ratelimit
+from petstore.ratelimit import AdaptiveConcurrency, TokenBucket
+
+ENDPOINT = "/pet/{id}"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ratelimit.time, "sleep", sleep)
+    return now, slept
+
+
+def test_bucket_allows_burst_then_paces_at_rate(clock):
+    now, slept = clock
+    bucket = TokenBucket(rate=10, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # Kova boş; bir token 1/rate saniyede birikir
+    assert bucket.acquire() == pytest.approx(0.1)
+    assert slept == [pytest.approx(0.1)]
+
+
+def test_bucket_refills_up_to_burst(clock):
+    now, slept = clock
+    bucket = TokenBucket(rate=2, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    now[0] += 60.0
+    assert [bucket.acquire() for _ in range(2)] == [0.0, 0.0]
+    assert bucket._take() == pytest.approx(0.5)
+
+
+def test_initial_limit_is_clamped_to_maximum():
+    controller = AdaptiveConcurrency(initial=4, maximum=2)
+    assert (controller.limit, controller.peak) == (2.0, 2)
+
+
+def test_success_increases_limit_additively(clock):
+    controller = AdaptiveConcurrency(initial=4, maximum=8)
+    for _ in range(4):
+        controller.release(ENDPOINT, controller.acquire(), overloaded=False)
+    # Her başarılı yanıt limiti 1/limit kadar artırır; 4 yanıtta yaklaşık 1
+    assert int(controller.limit) == 4
+    assert controller.limit == pytest.approx(4.93, abs=0.01)
+    assert controller.in_flight == 0
+
+
+def test_overload_halves_limit_once_per_wave(clock):
+    now, _ = clock
+    controller = AdaptiveConcurrency(initial=8, maximum=8)
+    started = [controller.acquire() for _ in range(3)]
+    now[0] += 0.01
+    for value in started:
+        controller.release(ENDPOINT, value, overloaded=True)
+    # Düşüşten önce gönderilen isteklerin hataları tekrar düşürmez
+    assert (controller.limit, controller.decreases) == (4.0, 1)
+    now[0] += 0.01
+    controller.release(ENDPOINT, controller.acquire(), overloaded=True)
+    assert (controller.limit, controller.decreases) == (2.0, 2)
+
+
+def test_slow_response_counts_as_overload(clock):
+    now, _ = clock
+    controller = AdaptiveConcurrency(initial=4, maximum=8)
+    started = controller.acquire()
+    now[0] += 0.1
+    controller.release(ENDPOINT, started, overloaded=False)
+    started = controller.acquire()
+    # En iyi gecikmenin LATENCY_TOLERANCE katından yavaş
+    now[0] += 0.5
+    controller.release(ENDPOINT, started, overloaded=False)
+    assert controller.decreases == 1
+
+
+def test_limit_never_drops_below_minimum(clock):
+    now, _ = clock
+    controller = AdaptiveConcurrency(initial=2, minimum=1, maximum=8)
+    for _ in range(5):
+        now[0] += 0.01
+        controller.release(ENDPOINT, controller.acquire(), overloaded=True)
+    assert controller.limit == 1
@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+
+from petstore import cassette, client, metrics, ratelimit, runner
+from petstore import server as petstore_server
+
+# runner.main suite'in BASE_URL'ini bu modülde arar
+BASE_URL = "http://petstore.test/v2"
+
+
+def _recorder(log, name, delay=0.0):
+    def test():
+        time.sleep(delay)
+        log.append(name)
+    test.__name__ = name
+    return test
+
+
+def test_units_keep_groups_together():
+    a, b, c = (_recorder([], name) for name in "abc")
+    assert runner._units([a, runner.group(b, c)]) == [(a,), (b, c)]
+
+
+def test_sequential_run_keeps_list_order():
+    log = []
+    tests = [_recorder(log, "a"), runner.group(_recorder(log, "b"), _recorder(log, "c")), _recorder(log, "d")]
+    results = runner.run_test_cases(tests)
+    assert log == ["a", "b", "c", "d"]
+    assert [name for name, *_ in results] == ["a", "b", "c", "d"]
+
+
+def test_parallel_run_orders_groups_and_reports_in_input_order():
+    log = []
+    # İlk adım yavaş olsa da grubun ikinci adımı ondan önce başlamaz
+    tests = [runner.group(_recorder(log, "first", 0.05), _recorder(log, "second")), _recorder(log, "other")]
+    results = runner.run_test_cases(tests, workers=2)
+    assert log.index("first") < log.index("second")
+    assert log[0] == "other"
+    assert [name for name, *_ in results] == ["first", "second", "other"]
+
+
+def test_failures_are_reported_not_raised():
+    def broken():
+        raise AssertionError("boom")
+    name, passed, error, _ = runner.run_test(broken)
+    assert (name, passed, error) == ("broken", False, "boom")
+
+
+def test_main_tears_down_when_the_suite_raises(monkeypatch, tmp_path):
+    stopped = threading.Event()
+
+    class FakeServer:
+        base_url = BASE_URL
+
+        def stop(self):
+            stopped.set()
+
+    monkeypatch.setattr(petstore_server, "start", lambda: FakeServer())
+    monkeypatch.setenv("PETSTORE_BASE_URL", BASE_URL)
+    hooks = list(metrics._hooks)
+    response_hooks = list(client._response_hooks)
+
+    def get_test_cases():
+        raise RuntimeError("suite failed")
+
+    argv = ["--local", "--keep-data", "--adaptive", "--latency", "--validate-schema",
+            "--results", str(tmp_path / "calls.jsonl"), "--cassette", str(tmp_path / "c.db"), "--cassette-mode", "record"]
+    with pytest.raises(RuntimeError):
+        runner.main(get_test_cases, argv)
+    assert stopped.is_set()
+    assert metrics._hooks == hooks and client._response_hooks == response_hooks
+    assert cassette.active is None and ratelimit._controller is None
@@ -0,0 +1,50 @@
+from functools import partial
+
+import pytest
+
+from petstore import schema, streaming
+
+URL = "http://petstore.test/v2/pet/findByStatus?status=available"
+
+
+class StreamedResponse:
+    def __init__(self, body, status_code=200):
+        self.body = body
+        self.status_code = status_code
+
+    def iter_content(self, chunk_size):
+        return (self.body[offset:offset + 7] for offset in range(0, len(self.body), 7))
+
+
+def _streamed(validator, body):
+    response = StreamedResponse(body)
+    response.item_hooks = [partial(validator.wrap_items, "GET", URL, response)]
+    return response
+
+
+@pytest.fixture(autouse=True)
+def without_ijson(monkeypatch):
+    monkeypatch.setattr(streaming, "ijson", None)
+
+
+def test_validate_reports_missing_required_fields():
+    assert schema.validate("GET", "/pet/{id}", 200, {"name": "doggie", "photoUrls": []}) == []
+    assert schema.validate("GET", "/pet/{id}", 200, {"photoUrls": []}) == ["$.name: zorunlu alan eksik"]
+
+
+def test_streamed_items_are_validated_as_one_response():
+    validator = schema.ResponseValidator()
+    body = b'[{"name": "a", "photoUrls": []}, {"photoUrls": [], "status": "lost"}]'
+    pets = list(streaming.iter_pets(_streamed(validator, body)))
+    assert len(pets) == 2
+    assert (validator.checked, validator.failed) == (1, 1)
+    call, errors = validator.samples[0]
+    assert call == "GET /pet/findByStatus 200"
+    assert errors == ["$[1].name: zorunlu alan eksik", "$[1].status: izin verilmeyen değer 'lost'"]
+
+
+def test_truncated_stream_is_a_violation():
+    validator = schema.ResponseValidator()
+    with pytest.raises(ValueError):
+        list(streaming.iter_pets(_streamed(validator, b'[{"name": "a", "photoUrls": []}')))
+    assert (validator.checked, validator.failed) == (1, 1)
@@ -0,0 +1,43 @@
+import argparse
+import random
+
+import pytest
+
+from petstore import registry, runner, shard, suites
+
+UNITS = [(f"suite::test_{index}",) for index in range(20)] + [("suite::group_a", "suite::group_b")]
+DURATIONS = {f"suite::test_{index}": 0.1 * (index % 7 + 1) for index in range(20)}
+
+
+@pytest.mark.parametrize("durations", [None, DURATIONS])
+def test_assign_is_deterministic_and_ignores_list_order(durations):
+    shards = shard.assign(UNITS, 3, durations)
+    assert shard.assign(UNITS, 3, durations) == shards
+    shuffled = UNITS[:]
+    random.Random(1).shuffle(shuffled)
+    by_unit = dict(zip(UNITS, shards))
+    assert [by_unit[unit] for unit in shuffled] == shard.assign(shuffled, 3, durations)
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5])
+def test_shards_cover_every_unit_exactly_once(count):
+    selected = [position for index in range(1, count + 1) for position in shard.select(UNITS, index, count, DURATIONS)]
+    assert sorted(selected) == list(range(len(UNITS)))
+
+
+def test_assign_balances_by_duration():
+    units = [("slow",), ("fast_1",), ("fast_2",)]
+    assert shard.assign(units, 2, {"slow": 2.0, "fast_1": 1.0, "fast_2": 1.0}) == [0, 1, 1]
+
+
+def test_parse_rejects_out_of_range_index():
+    assert shard.parse("2/3") == (2, 3)
+    with pytest.raises(argparse.ArgumentTypeError):
+        shard.parse("4/3")
+
+
+
+def test_test_cases_include_every_suite():
+    units = runner._units(shard.get_test_cases())
+    covered = {registry.test_id(test).split("::")[0] for unit in units for test in unit}
+    assert covered == set(suites.SUITE_FILES)
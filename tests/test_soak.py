@@ -0,0 +1,49 @@
+from petstore import soak
+
+TOLERANCES = {"rss": (1000, 0.0), "fds": (2, 0.0)}
+
+
+def _samples(rss, fds=lambda index: 10, count=30):
+    return [{"elapsed": float(index), "rss": rss(index), "fds": fds(index)} for index in range(count)]
+
+
+def test_steady_growth_is_a_leak():
+    leaks = soak.detect_leaks(_samples(lambda index: 50_000 + 500 * index), TOLERANCES)
+    assert set(leaks) == {"rss"}
+    start, growth = leaks["rss"]
+    assert start == 50_000 + 500 * 6
+    assert growth == 500 * 23
+
+
+def test_flat_and_noisy_metrics_are_not_leaks():
+    assert soak.detect_leaks(_samples(lambda index: 50_000 + (index % 3) * 400), TOLERANCES) == {}
+
+
+def test_warmup_growth_is_ignored():
+    # İlk %20'deki büyüme (import, havuz ve cache dolması) pencereye girmez
+    assert soak.detect_leaks(_samples(lambda index: 10_000 * min(index, 5)), TOLERANCES) == {}
+
+
+def test_transient_spikes_are_not_leaks():
+    # Son örnekteki sıçrama eğimi yükseltir ama son üçte birin ortalamasını toleransın üstüne taşımaz
+    assert soak.detect_leaks(_samples(lambda index: 50_000 + 5_000 * (index == 29)), TOLERANCES) == {}
+    assert soak.detect_leaks(_samples(lambda index: 50_000 + 20_000 * (index == 15)), TOLERANCES) == {}
+
+
+def test_descriptor_leak():
+    leaks = soak.detect_leaks(_samples(lambda index: 50_000, lambda index: 10 + index), TOLERANCES)
+    assert set(leaks) == {"fds"}
+
+
+def test_too_few_samples():
+    assert soak.detect_leaks(_samples(lambda index: 1000 * index, count=5), TOLERANCES) == {}
+
+
+def test_slope():
+    assert soak.slope([(0, 1), (1, 3), (2, 5)]) == 2
+    assert soak.slope([(1, 1), (1, 5)]) == 0.0
+
+
+def test_report_without_samples(capsys):
+    soak.SoakRun(duration=0, trace=False).report({})
+    assert "hiç örnek alınmadı" in capsys.readouterr().out
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from petstore.streaming import iter_json_array, preview
+
+BODY = json.dumps([{"id": 1, "name": "çomar"}, 12345, -1.5e3, "text", True, None, [1, 2], 0.25]).encode()
+
+
+def _split(body, size):
+    return [body[offset:offset + size] for offset in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", range(1, 12))
+def test_items_survive_every_chunk_split(size):
+    assert list(iter_json_array(_split(BODY, size))) == json.loads(BODY)
+
+
+def test_number_cut_at_chunk_boundary_is_not_yielded_early():
+    assert list(iter_json_array([b"[1.", b"5, 2", b"e3, 7", b"0]"])) == [1.5, 2000.0, 70]
+
+
+def test_whitespace_after_last_item():
+    assert list(iter_json_array([b" [ 1 ,\n2 ", b"]  "])) == [1, 2]
+
+
+def test_empty_array():
+    assert list(iter_json_array([b"[", b"]"])) == []
+
+
+def test_not_an_array():
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"id": 1}']))
+
+
+def test_truncated_body():
+    with pytest.raises(ValueError):
+        list(iter_json_array([b"[1, 2"]))
+
+
+def test_garbage_after_scalar():
+    with pytest.raises(ValueError):
+        list(iter_json_array([b"[1x, 2]"]))
+
+
+def test_preview_counts_all_items():
+    count, text = preview(range(1000), max_chars=10)
+    assert count == 1000
+    assert text.endswith("more)]")
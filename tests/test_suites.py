@@ -0,0 +1,38 @@
+import pytest
+
+from petstore import bench, runner, server, suites
+
+
+@pytest.fixture
+def emulator(monkeypatch):
+    # runner.main ve bench.run suite'lerin BASE_URL'ini ve PETSTORE_BASE_URL'i değiştirir; test sonunda geri alınır
+    monkeypatch.setenv("PETSTORE_BASE_URL", "http://petstore.test/v2")
+    for name in suites.SUITE_FILES:
+        suite = suites.load(name)
+        monkeypatch.setattr(suite, "BASE_URL", suite.BASE_URL)
+    store = server.start()
+    yield store
+    store.stop()
+
+
+def _leftovers(store):
+    return sorted(store.store._pets), list(store.orders._records), list(store.users._records)
+
+
+@pytest.mark.parametrize("name", ["store_user_positive", "store_user_negative"])
+def test_store_user_suite_passes_and_cleans_up(emulator, name, capsys):
+    suite = suites.load(name)
+    results = runner.main(suite.get_test_cases, ["--base-url", emulator.base_url])
+    failures = [(test, error) for test, passed, error, _ in results if not passed]
+    assert results and not failures
+    assert _leftovers(emulator) == ([], [], [])
+
+
+def test_bulk_user_benchmark_compares_with_single_posts(emulator, capsys):
+    results = bench.run(emulator.base_url, scenarios=bench.USER_SCENARIOS, warmup=0, iterations=2)
+    scenarios = results["scenarios"]
+    assert set(scenarios) == set(bench.USER_SCENARIOS)
+    assert all(row["errors"] == 0 and row["throughput"] > 0 for row in scenarios.values())
+    bench.print_bulk_comparison(results)
+    assert "usersSingle" in capsys.readouterr().out
+    assert _leftovers(emulator) == ([], [], [])
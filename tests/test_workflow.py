@@ -0,0 +1,102 @@
+import threading
+
+import pytest
+
+from petstore import workflow
+from petstore.workflow import Workflow, step
+
+
+def _named(name, action=None, calls=None):
+    def test():
+        if calls is not None:
+            calls.append(name)
+        if action is not None:
+            action()
+    test.__name__ = name
+    return test
+
+
+def _flow(*specs):
+    return Workflow(step(_named(name), **resources) for name, resources in specs)
+
+
+def test_readers_wait_for_writer_and_not_for_each_other():
+    flow = _flow(
+        ("create", {"produces": "pet"}),
+        ("get", {"consumes": "pet"}),
+        ("verify", {"consumes": "pet"}),
+        ("update", {"produces": "pet"}),
+        ("delete", {"destroys": "pet"}),
+    )
+    assert flow.dependencies == [
+        frozenset(),
+        frozenset({0}),
+        frozenset({0}),
+        frozenset({0, 1, 2}),
+        frozenset({3}),
+    ]
+
+
+def test_independent_resources_do_not_depend_on_each_other():
+    flow = _flow(
+        ("create_pet", {"produces": "pet"}),
+        ("create_user", {"produces": "user"}),
+        ("order", {"produces": "order", "consumes": ("pet", "user")}),
+        ("get_user", {"consumes": "user"}),
+    )
+    assert flow.dependencies == [frozenset(), frozenset(), frozenset({0, 1}), frozenset({1})]
+
+
+def test_using_a_destroyed_or_missing_resource_fails():
+    with pytest.raises(ValueError):
+        _flow(("get", {"consumes": "pet"}))
+    with pytest.raises(ValueError):
+        _flow(("create", {"produces": "pet"}), ("delete", {"destroys": "pet"}), ("get", {"consumes": "pet"}))
+
+
+def test_recreating_after_destroy_waits_for_destroy():
+    flow = _flow(("create", {"produces": "pet"}), ("delete", {"destroys": "pet"}), ("again", {"produces": "pet"}))
+    assert flow.dependencies[2] == frozenset({1})
+
+
+def test_critical_path():
+    flow = _flow(
+        ("create", {"produces": "pet"}),
+        ("slow_read", {"consumes": "pet"}),
+        ("fast_read", {"consumes": "pet"}),
+        ("delete", {"destroys": "pet"}),
+    )
+    assert flow.critical_path([1.0, 5.0, 2.0, 1.0]) == ([0, 1, 3], 7.0)
+    assert Workflow([]).critical_path([]) == ([], 0.0)
+
+
+def test_run_respects_dependencies_and_parallelism(capsys):
+    calls = []
+    readers = threading.Barrier(2, timeout=5)
+    flow = Workflow([
+        step(_named("create", calls=calls), produces="pet"),
+        # İki okuyucu aynı anda çalışmazsa barrier zaman aşımına uğrar
+        step(_named("read_a", readers.wait, calls), consumes="pet"),
+        step(_named("read_b", readers.wait, calls), consumes="pet"),
+        step(_named("delete", calls=calls), destroys="pet"),
+    ])
+    results = workflow.run(flow, workers=4)
+    assert [passed for _, passed, *_ in results] == [True] * 4
+    assert calls[0] == "create" and calls[-1] == "delete"
+
+
+def test_failed_step_skips_dependents(capsys):
+    def fail():
+        raise AssertionError("boom")
+
+    flow = Workflow([
+        step(_named("create", fail), produces="pet"),
+        step(_named("get"), consumes="pet"),
+        step(_named("delete"), destroys="pet"),
+        step(_named("unrelated"), produces="user"),
+    ])
+    results = workflow.run(flow, workers=2)
+    assert [(name, passed) for name, passed, *_ in results] == [
+        ("create", False), ("get", False), ("delete", False), ("unrelated", True),
+    ]
+    assert "create" in results[2][2]